@@ -37,22 +37,19 @@ def create_pin(username):
     print()
     return pin
 
-def customer_exists(username, pin):
-    for customer in Customer.customers:
-        if customer.username == username and customer.pin == pin:
-            return True
-    return False
+def customer_exists(username):
+    return username in Customer.customers  # <-- usernames are unique
 
 def register():  # <-- Main Menu: New Registration (Option 1)
     while True:
         new_username = create_username()
         new_pin = create_pin(new_username)
-        if not customer_exists(new_username, new_pin):
+        if not customer_exists(new_username):
             new_customer = Customer(new_username, new_pin)
             print(f"{new_customer.username} has been registered with a starting balance of ${new_customer.balance:.2f}.")
             return None
         else:
-            print("A user with these credentials already exists in the system.")
+            print("A user with this name already exists in the system.")
             choice = input("Do you want to try again? (y/n) ").lower()
             if choice == 'y':
                 print()
@@ -84,10 +81,10 @@ def login():  # <-- Main Menu: User Login (Option 2)
         print("user login".upper())
         u = get_username()
         p = get_pin()
-        for customer in Customer.customers:
-            if customer.username == u and customer.pin == p:
-                print("Login successful!\n")
-                return customer
+        customer = Customer.customers.authenticate(u, p)
+        if customer is not None:
+            print("Login successful!\n")
+            return customer
         print("Invalid credentials!\n")
         errors += 1
         if errors >= max_errors:
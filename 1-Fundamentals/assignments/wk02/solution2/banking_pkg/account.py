@@ -1,4 +1,145 @@
+import os
+import hmac
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from textwrap import fill
+from banking_pkg.registry import CustomerRegistry
+
+
+#=========================
+# PIN HASHING
+#=========================
+SCRYPT_COST = (2**14, 8, 1)         # <-- n, r, p: about 16 MB and tens of milliseconds per hash
+PBKDF2_ITERATIONS = 600000          # <-- used when OpenSSL has no scrypt
+SALT_BYTES = 16
+
+def hash_pin(pin, salt=None, cost=SCRYPT_COST):
+    """
+    Returns a salted hash of a PIN, as `scrypt$n$r$p$salt$hash`
+    (or `pbkdf2_sha256$iterations$salt$hash` without scrypt).
+    """
+    salt = salt or os.urandom(SALT_BYTES)
+    if hasattr(hashlib, "scrypt"):
+        n, r, p = cost
+        digest = hashlib.scrypt(pin.encode(), salt=salt, n=n, r=r, p=p)
+        return f"scrypt${n}${r}${p}${salt.hex()}${digest.hex()}"
+    digest = hashlib.pbkdf2_hmac("sha256", pin.encode(), salt, PBKDF2_ITERATIONS)
+    return f"pbkdf2_sha256${PBKDF2_ITERATIONS}${salt.hex()}${digest.hex()}"
+
+def verify_pin(pin, pin_hash):
+    """Indicates whether `pin` matches a hash made by `hash_pin`. Malformed hashes never match."""
+    try:
+        scheme, *params, salt, digest = pin_hash.split("$")
+        salt, digest = bytes.fromhex(salt), bytes.fromhex(digest)
+        if scheme == "scrypt":
+            n, r, p = map(int, params)
+            candidate = hashlib.scrypt(pin.encode(), salt=salt, n=n, r=r, p=p, dklen=len(digest))
+        elif scheme == "pbkdf2_sha256":
+            (iterations,) = params
+            candidate = hashlib.pbkdf2_hmac("sha256", pin.encode(), salt, int(iterations), len(digest))
+        else:
+            return False
+    except (ValueError, TypeError, AttributeError):
+        return False
+    return hmac.compare_digest(candidate, digest)
+
+
+#=========================
+# VERIFICATION CACHE
+#=========================
+class VerificationCache:
+    """
+    Remembers recently verified credentials for `ttl` seconds, so signing in
+    again soon after skips the slow hash. Holds at most `maxsize` entries,
+    evicting the least recently used.
+
+    Entries are keyed by an HMAC of the credentials under a random key that
+    only lives in this process, so the cache never holds a PIN. Failed
+    attempts are never cached.
+    """
+
+    def __init__(self, maxsize=1024, ttl=60, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._key = os.urandom(32)
+        self._entries = OrderedDict()   # <-- key: expiry time
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"VerificationCache(maxsize='{self.maxsize}', ttl='{self.ttl}', entries='{len(self)}')"
+
+    def _entry_key(self, username, pin, pin_hash):
+        message = "\0".join((username, pin, pin_hash)).encode()  # <-- a new hash invalidates the entry
+        return hmac.new(self._key, message, hashlib.sha256).digest()
+
+    def hit(self, username, pin, pin_hash):
+        key = self._entry_key(username, pin, pin_hash)
+        with self._lock:
+            expires = self._entries.get(key)
+            if expires is None:
+                return False
+            if expires <= self._clock():
+                del self._entries[key]
+                return False
+            self._entries.move_to_end(key)
+            return True
+
+    def add(self, username, pin, pin_hash):
+        key = self._entry_key(username, pin, pin_hash)
+        with self._lock:
+            self._entries[key] = self._clock() + self.ttl
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class PinVerifier:
+    """
+    Checks PINs against their hashes on a pool of worker threads, so
+    concurrent sign-ins hash in parallel (scrypt and PBKDF2 release the GIL)
+    and the number of hashes in flight, and their memory, stays bounded.
+    """
+
+    def __init__(self, workers=None, cache=None):
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.cache = VerificationCache() if cache is None else cache
+        self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="pin-verifier")
+
+    def __repr__(self):
+        return f"PinVerifier(workers='{self.workers}', cache={self.cache!r})"
+
+    def _verify(self, username, pin, pin_hash):
+        is_valid = verify_pin(pin, pin_hash)
+        if is_valid:
+            self.cache.add(username, pin, pin_hash)
+        return is_valid
+
+    def submit(self, username, pin, pin_hash):
+        """Starts checking a PIN and returns a `Future` of the result."""
+        return self._pool.submit(self._verify, username, pin, pin_hash)
+
+    def verify(self, username, pin, pin_hash):
+        """Indicates whether `pin` matches `pin_hash`, from the cache when it was verified recently."""
+        if self.cache.hit(username, pin, pin_hash):
+            return True
+        return self.submit(username, pin, pin_hash).result()
+
+    def shutdown(self):
+        self._pool.shutdown()
+
+
+pin_verifier = PinVerifier()
 
 
 #========================= 
@@ -6,19 +147,31 @@ from textwrap import fill
 #=========================
 class Customer:
 
-    customers = []
+    customers = None  # <-- `CustomerRegistry`, set below
 
-    def __init__(self, username, pin, balance:int=0):
+    def __init__(self, username, pin, balance:int=0, registry=None):
         self.username = username
-        self.pin = pin
+        self.pin_hash = hash_pin(pin)  # <-- the PIN itself is never stored
         self.balance = balance
-        Customer.customers.append(self)
+        (Customer.customers if registry is None else registry).add(self)
+
+    @classmethod
+    def from_record(cls, username, pin_hash, balance=0):
+        """Creates a customer from a stored PIN hash without registering it (used by `CustomerRegistry`)."""
+        customer = cls.__new__(cls)
+        customer.username = username
+        customer.pin_hash = pin_hash
+        customer.balance = balance
+        return customer
 
     def __str__(self):
         return f"<Customer `{self.username}` (Balance: ${self.balance:.2f})>"
 
     def __repr__(self):
-        return f"Customer(username='{self.username}', pin='{self.pin}')"
+        return f"Customer(username='{self.username}')"
+
+    def check_pin(self, pin):
+        return pin_verifier.verify(self.username, pin, self.pin_hash)
 
     def show_balance(self):
         print(f"Current Balance: ${self.balance:.2f}")
@@ -61,3 +214,6 @@ class Customer:
     def logout(self):
         print(f"Goodbye {self.username}!")
         return None
+
+
+Customer.customers = CustomerRegistry(factory=Customer.from_record, verify=pin_verifier.verify)
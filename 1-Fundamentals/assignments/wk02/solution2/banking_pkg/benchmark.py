@@ -0,0 +1,104 @@
+#
+# Customer lookup and cached sign-in latency as the number of registered
+# customers grows, and sign-in throughput with hashed PINs.
+#
+# Usage: python -m banking_pkg.benchmark [SIZE ...]
+#
+
+import os
+import sys
+import time
+import random
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from banking_pkg.account import Customer, PinVerifier, VerificationCache, hash_pin
+from banking_pkg.registry import CustomerRegistry
+
+
+#=========================
+# FIXTURES
+#=========================
+def write_customers(path, count, pin_hash):
+    with open(path, "w") as f:
+        for idx in range(count):
+            f.write(f"user{idx},{pin_hash},{idx % 500}\n")
+
+def linear_lookup(customers, username):  # <-- the scan `login` used before the registry
+    for customer in customers:
+        if customer.username == username:
+            return customer
+    return None
+
+
+#=========================
+# BENCHMARKS
+#=========================
+def lookup_usernames(count, lookups):
+    rng = random.Random(0)
+    return [f"user{rng.randrange(count * 2)}" for _ in range(lookups)]  # <-- half are unknown users
+
+def time_lookups(lookup, customers, count, lookups):
+    timings = []
+    for username in lookup_usernames(count, lookups):
+        start = time.perf_counter()
+        lookup(customers, username)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return sum(timings) / len(timings) * 1e6, timings[int(len(timings) * 0.99)] * 1e6
+
+def warm_cache(cache, count, lookups, pin, pin_hash):
+    for username in set(lookup_usernames(count, lookups)):
+        if int(username[4:]) < count:
+            cache.add(username, pin, pin_hash)  # <-- what a successful sign-in leaves behind
+
+def run_lookups(sizes, lookups=10000, linear_limit=100000):
+    print(f"{'customers'.rjust(10)} | {'load'.rjust(9)} | {'registry mean'.rjust(13)} | {'p99'.rjust(9)} | {'sign-in mean'.rjust(12)} | {'p99'.rjust(9)} | {'linear mean'.rjust(11)}")
+    pin_hash = hash_pin("0000")  # <-- one hash shared by every customer: hashing millions of PINs would take hours
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in sizes:
+            path = os.path.join(tmp, f"customers-{count}.csv")
+            write_customers(path, count, pin_hash)
+            verifier = PinVerifier(1, VerificationCache(maxsize=lookups))
+            registry = CustomerRegistry(factory=Customer.from_record, verify=verifier.verify)
+            start = time.perf_counter()
+            registry.load(path)
+            load_time = time.perf_counter() - start
+            mean, p99 = time_lookups(lambda r, u: r.get(u), registry, count, lookups)
+            warm_cache(verifier.cache, count, lookups, "0000", pin_hash)
+            auth_mean, auth_p99 = time_lookups(lambda r, u: r.authenticate(u, "0000"), registry, count, lookups)
+            verifier.shutdown()
+            linear = "-"
+            if count <= linear_limit:
+                customers = list(registry)
+                linear_mean, _ = time_lookups(linear_lookup, customers, count, max(lookups // 100, 10))
+                linear = f"{linear_mean:9.2f}us"
+            print(f"{count:10d} | {load_time:8.2f}s | {mean:11.2f}us | {p99:7.2f}us | {auth_mean:10.2f}us | {auth_p99:7.2f}us | {linear.rjust(11)}")
+
+def time_sign_ins(verifier, credentials, clients):
+    registry = CustomerRegistry(factory=Customer.from_record, verify=verifier.verify)
+    for username, pin, pin_hash in credentials:
+        registry.add(Customer.from_record(username, pin_hash))
+    start = time.perf_counter()
+    with ThreadPoolExecutor(clients) as pool:
+        customers = list(pool.map(lambda c: registry.authenticate(c[0], c[1]), credentials))
+    elapsed = time.perf_counter() - start
+    assert all(customers)
+    return len(credentials) / elapsed
+
+def run_sign_ins(users=32, clients=8):
+    credentials = [(f"user{idx}", f"{idx:04d}") for idx in range(users)]
+    credentials = [(username, pin, hash_pin(pin)) for username, pin in credentials]
+    print(f"Sign-ins of {users} users from {clients} concurrent clients ({os.cpu_count()} CPUs):")
+    for workers in sorted({1, min(4, os.cpu_count() or 1)}):
+        verifier = PinVerifier(workers)
+        cold = time_sign_ins(verifier, credentials, clients)
+        cached = time_sign_ins(verifier, credentials, clients)
+        verifier.shutdown()
+        print(f"| {workers} verifier threads | cold: {cold:10.1f} sign-ins/s | cached: {cached:10.1f} sign-ins/s |")
+
+
+if __name__ == '__main__':
+    sizes = [int(size) for size in sys.argv[1:]] or [1000, 10000, 100000, 1000000]
+    run_lookups(sizes)
+    print()
+    run_sign_ins()
@@ -0,0 +1,90 @@
+class DuplicateUsernameError(ValueError):
+    """Raised when a username is registered twice."""
+
+
+def _verify_pin(username, pin, pin_hash):
+    from banking_pkg.account import verify_pin  # <-- `account` imports this module
+    return verify_pin(pin, pin_hash)
+
+
+#=========================
+# CUSTOMER REGISTRY
+#=========================
+class CustomerRegistry:
+    """
+    Every registered customer, indexed by username.
+
+    Lookups are a single dictionary access, so they cost the same with ten
+    customers or ten million. Customers bulk-loaded from a file are kept as
+    plain (pin_hash, balance) records, and a `Customer` object is only
+    created the first time one of them is looked up.
+    """
+
+    def __init__(self, factory=None, verify=None):
+        self._index = {}            # <-- username: Customer, or a (pin_hash, balance) record
+        self._factory = factory     # <-- (username, pin_hash, balance) -> Customer
+        self._verify = verify or _verify_pin    # <-- (username, pin, pin_hash) -> bool
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, username):
+        return username in self._index
+
+    def __iter__(self):
+        for username in list(self._index):
+            yield self.get(username)
+
+    def __repr__(self):
+        return f"CustomerRegistry(customers='{len(self)}')"
+
+    def add(self, customer):
+        if customer.username in self._index:
+            raise DuplicateUsernameError(f"The username `{customer.username}` is already registered.")
+        self._index[customer.username] = customer
+        return customer
+
+    def remove(self, username):
+        self._index.pop(username, None)
+
+    def clear(self):
+        self._index.clear()
+
+    def get(self, username):
+        """Returns the customer registered as `username`, or None."""
+        entry = self._index.get(username)
+        if type(entry) is tuple:
+            entry = self._index[username] = self._factory(username, *entry)
+        return entry
+
+    def authenticate(self, username, pin):
+        """Returns the customer if `pin` matches the one registered for `username`, otherwise None."""
+        entry = self._index.get(username)
+        if entry is None:
+            return None
+        pin_hash = entry[0] if type(entry) is tuple else entry.pin_hash
+        return self.get(username) if self._verify(username, pin, pin_hash) else None
+
+    def load(self, path, skip_duplicates=False):
+        """
+        Registers every customer listed in a file, one `username,pin_hash[,balance]`
+        per line, where `pin_hash` comes from `account.hash_pin`. Returns the
+        number of customers added.
+
+        Nothing is registered if a line is malformed, or if a username is
+        already taken (unless `skip_duplicates` is set).
+        """
+        records = {}
+        with open(path) as f:
+            for line_number, line in enumerate(f, 1):
+                fields = line.rstrip("\n").split(",")
+                if not fields[0] or len(fields) not in (2, 3):
+                    raise ValueError(f"{path}, line {line_number}: expected `username,pin_hash[,balance]`")
+                username = fields[0]
+                if username in records or username in self._index:
+                    if skip_duplicates:
+                        continue
+                    raise DuplicateUsernameError(f"{path}, line {line_number}: the username `{username}` is already registered.")
+                records[username] = (fields[1], float(fields[2]) if len(fields) == 3 else 0)
+        self._index.update(records)
+        return len(records)
@@ -1,5 +1,8 @@
+import os
+import tempfile
 import unittest
-from banking_pkg.account import Customer
+from banking_pkg.account import Customer, PinVerifier, VerificationCache, hash_pin, verify_pin
+from banking_pkg.registry import CustomerRegistry, DuplicateUsernameError
 import app
 
 
@@ -14,9 +17,10 @@ class TestCustomer(unittest.TestCase):
         print("teardownClass")
 
     def setUp(self):
-        self.c_01 = Customer("Jonathan","0917")
-        self.c_02 = Customer("Jovan","0911")
-        self.c_03 = Customer("Steven","0531")
+        self.registry = CustomerRegistry()  # <-- keeps the customers out of `Customer.customers`
+        self.c_01 = Customer("Jonathan","0917",registry=self.registry)
+        self.c_02 = Customer("Jovan","0911",registry=self.registry)
+        self.c_03 = Customer("Steven","0531",registry=self.registry)
         
     def tearDown(self):
         pass
@@ -32,6 +36,127 @@ class TestCustomer(unittest.TestCase):
         self.assertFalse(Customer.is_amount_valid("1000",500))
 
 
+FAST_COST = (2**4, 8, 1)  # <-- cheap scrypt parameters for hashes written by the tests
+
+
+class TestPinHashing(unittest.TestCase):
+
+    def test_hash_pin(self):
+        pin_hash = hash_pin("0917")
+        self.assertNotIn("0917", pin_hash)
+        self.assertNotEqual(pin_hash, hash_pin("0917"))  # <-- salted
+        self.assertTrue(verify_pin("0917", pin_hash))
+        self.assertFalse(verify_pin("0918", pin_hash))
+
+    def test_malformed_hash(self):
+        self.assertFalse(verify_pin("0917", "0917"))
+        self.assertFalse(verify_pin("0917", "scrypt$x$8$1$00$00"))
+        self.assertFalse(verify_pin("0917", "md5$00$00"))
+
+    def test_customer_stores_hash(self):
+        registry = CustomerRegistry()
+        customer = Customer("Jonathan","0917",registry=registry)
+        self.assertFalse(hasattr(customer, "pin"))
+        self.assertNotIn("0917", repr(customer))
+        self.assertTrue(customer.check_pin("0917"))
+        self.assertFalse(customer.check_pin("0000"))
+
+    def test_hash_is_not_a_pin(self):
+        registry = CustomerRegistry(factory=Customer.from_record)
+        pin_hash = hash_pin("0917", cost=FAST_COST)
+        registry.add(Customer.from_record("Jonathan", pin_hash))
+        self.assertIsNone(registry.authenticate("Jonathan", pin_hash))
+        self.assertIsNotNone(registry.authenticate("Jonathan", "0917"))
+
+
+class TestVerificationCache(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0
+        self.cache = VerificationCache(maxsize=2, ttl=60, clock=lambda: self.now)
+
+    def test_ttl(self):
+        self.cache.add("Ada","1815","hash")
+        self.assertTrue(self.cache.hit("Ada","1815","hash"))
+        self.assertFalse(self.cache.hit("Ada","0000","hash"))
+        self.assertFalse(self.cache.hit("Ada","1815","new hash"))
+        self.now = 60
+        self.assertFalse(self.cache.hit("Ada","1815","hash"))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_bounded(self):
+        for username in ("Ada", "Alan", "Grace"):
+            self.cache.add(username,"1815","hash")
+        self.assertEqual(len(self.cache), 2)
+        self.assertFalse(self.cache.hit("Ada","1815","hash"))  # <-- least recently used
+        self.assertTrue(self.cache.hit("Grace","1815","hash"))
+
+    def test_verifier_caches_successes_only(self):
+        verifier = PinVerifier(workers=2, cache=self.cache)
+        pin_hash = hash_pin("1815", cost=FAST_COST)
+        self.assertFalse(verifier.verify("Ada","0000",pin_hash))
+        self.assertEqual(len(self.cache), 0)
+        self.assertTrue(verifier.submit("Ada","1815",pin_hash).result())
+        self.assertTrue(self.cache.hit("Ada","1815",pin_hash))
+        verifier.shutdown()
+
+
+class TestCustomerRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.verifier = PinVerifier(workers=2)
+        self.registry = CustomerRegistry(factory=Customer.from_record, verify=self.verifier.verify)
+        self.c_01 = Customer("Ada","1815",registry=self.registry)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "customers.csv")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        self.verifier.shutdown()
+
+    def test_lookup(self):
+        self.assertIs(self.registry.get("Ada"), self.c_01)
+        self.assertIsNone(self.registry.get("Grace"))
+        self.assertIn("Ada", self.registry)
+        self.assertEqual(len(self.registry), 1)
+
+    def test_unique_username(self):
+        with self.assertRaises(DuplicateUsernameError):
+            Customer("Ada","0000",registry=self.registry)
+        self.assertTrue(verify_pin("1815", self.registry.get("Ada").pin_hash))
+
+    def test_authenticate(self):
+        self.assertIs(self.registry.authenticate("Ada","1815"), self.c_01)
+        self.assertIsNone(self.registry.authenticate("Ada","0000"))
+        self.assertIsNone(self.registry.authenticate("Grace","1815"))
+
+    def test_load(self):
+        with open(self.path, "w") as f:
+            f.write(f"Grace,{hash_pin('1906', cost=FAST_COST)},250\nAlan,{hash_pin('1912', cost=FAST_COST)}\n")
+        self.assertEqual(self.registry.load(self.path), 2)
+        grace = self.registry.authenticate("Grace","1906")
+        self.assertEqual((grace.username, grace.balance), ("Grace", 250))
+        self.assertIsNone(self.registry.authenticate("Alan","1906"))
+        self.assertIs(self.registry.get("Grace"), grace)
+        self.assertEqual(self.registry.get("Alan").balance, 0)
+        self.assertEqual(sorted(c.username for c in self.registry), ["Ada", "Alan", "Grace"])
+
+    def test_load_duplicates(self):
+        with open(self.path, "w") as f:
+            f.write(f"Grace,{hash_pin('1906', cost=FAST_COST)}\nAda,{hash_pin('0000', cost=FAST_COST)}\n")
+        with self.assertRaises(DuplicateUsernameError):
+            self.registry.load(self.path)
+        self.assertNotIn("Grace", self.registry)  # <-- nothing is loaded
+        self.assertEqual(self.registry.load(self.path, skip_duplicates=True), 1)
+        self.assertIs(self.registry.authenticate("Ada","1815"), self.c_01)
+
+    def test_load_malformed(self):
+        with open(self.path, "w") as f:
+            f.write("Grace\n")
+        with self.assertRaises(ValueError):
+            self.registry.load(self.path)
+
+
 class TestApp(unittest.TestCase):
     def test_create_username(self):
         pass
\ No newline at end of file
@@ -1,10 +1,10 @@
 from hangman_pkg.config import *
+from hangman_pkg.context import default_context
 from hangman_pkg.game_objects import Option, Game, Mode, Guess
+from hangman_pkg.inputs import use_provider
 
 import sys
 from textwrap import fill
-import time
-import copy
 
 
 #========================================
@@ -24,7 +24,7 @@ def start_game():
     mode.results(guess_obj)
     print()
     Game.summary()
-    time.sleep(10)
+    pause(10)
 
 # Callback Func: `RULES` (Menu Option = 2)
 def show_rules():
@@ -44,7 +44,7 @@ def show_rules():
         print(f"{k.title()}:")
         print(v)
         print()
-    time.sleep(15)
+    pause(15)
 
 # Callback Func: `END` (Menu Option = 3)
 def end_app():
@@ -74,7 +74,7 @@ def get_mode():
     print()
     show_options(Mode.all_modes)
     mode = get_selection(Mode.all_modes)
-    new_mode = copy.copy(mode)
+    new_mode = default_context.new_game(mode)
     print()
     print(f"You have selected the `{str(new_mode.name).title()}` game mode.")
     return new_mode
@@ -98,12 +98,20 @@ def run_app():
     print(f"<*x{'='*80}x*>")  # <-- border
     return obj
 
-def hangman():
-    action = None
-    while action != end:
-        action = run_app()
-        print()
-    print("Thanks for using the app!\n")
+def hangman(provider=None):
+    """Runs the application until the user ends it.
+
+    Parameters
+    ----------
+    provider : InputProvider, optional
+        The source of every line of user input (see `hangman_pkg.inputs`). Defaults to the console.
+    """
+    with use_provider(provider):
+        action = None
+        while action != end:
+            action = run_app()
+            print()
+        print("Thanks for using the app!\n")
 
 
 
@@ -0,0 +1,243 @@
+import sys
+import json
+import struct
+import datetime
+from array import array
+
+try:  # <-- optional: vectorized queries when NumPy is installed
+    import numpy as np
+except ImportError:
+    np = None
+
+from .history_store import history_store
+
+
+#========================================
+# COLUMNAR FORMAT
+#========================================
+
+MAGIC = b"HMOC"
+VERSION = 1
+HEADER = struct.Struct("<4sII")     # <-- magic, version, row count
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+UINT32 = "I" if array("I").itemsize == 4 else "L"   # <-- "I" is only guaranteed to be 2 bytes
+
+# column name: array typecode
+SCHEMA = {
+    'timestamp': "d",       # seconds since the epoch
+    'is_victorious': "B",
+    'mode_code': "H",       # index into `modes`
+    'word_code': UINT32,    # index into `words`
+    'word_length': "H",
+    'tries': "H",
+    'duration': "d",
+    'hit_mask': UINT32,     # 26-bit mask of correctly guessed letters
+    'miss_mask': UINT32,    # 26-bit mask of incorrectly guessed letters
+}
+
+
+def _letter_mask(values):
+    mask = 0
+    for value in values:
+        if len(value) == 1 and value in LETTERS:
+            mask |= 1 << LETTERS.index(value)
+    return mask
+
+def _as_numpy(column):
+    """Returns a NumPy view of an unsigned integer column, with the dtype derived from its item size."""
+    return np.frombuffer(column, dtype=np.dtype(f"u{column.itemsize}"))
+
+
+#========================================
+# OUTCOME COLUMNS
+#========================================
+
+class OutcomeColumns:
+    """A columnar batch of game outcomes, held in typed arrays with dictionary-encoded modes and words.
+
+    Attributes
+    ----------
+    columns : dict
+        One `array.array` per column in `SCHEMA`.
+    modes : list
+        The dictionary of game mode names referenced by `mode_code`.
+    words : list
+        The dictionary of target words referenced by `word_code`.
+
+    Methods
+    -------
+    append(outcome_obj)
+        Adds an 'Outcome' object to the batch.
+    write(path) / read(path)
+        Saves or loads the batch in a compact binary file.
+    win_rate_by_length()
+        Returns the win rate for each target word length.
+    hardest_letters(limit)
+        Returns the letters most often guessed incorrectly.
+    """
+    def __init__(self):
+        self.columns = {name: array(code) for name, code in SCHEMA.items()}
+        self.modes = []
+        self.words = []
+        self._mode_codes = {}
+        self._word_codes = {}
+
+    def __len__(self):
+        return len(self.columns['timestamp'])
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(rows='{len(self)}', modes='{len(self.modes)}', words='{len(self.words)}')"
+
+    @staticmethod
+    def _encode(value, values, codes):
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+    def _append_row(self, timestamp, is_victorious, game_mode, target_word, tries, duration, hit_mask, miss_mask):
+        cols = self.columns
+        cols['timestamp'].append(timestamp)
+        cols['is_victorious'].append(int(is_victorious))
+        cols['mode_code'].append(self._encode(str(game_mode), self.modes, self._mode_codes))
+        cols['word_code'].append(self._encode(target_word, self.words, self._word_codes))
+        cols['word_length'].append(len(target_word))
+        cols['tries'].append(tries)
+        cols['duration'].append(duration)
+        cols['hit_mask'].append(hit_mask)
+        cols['miss_mask'].append(miss_mask)
+
+    def append(self, outcome_obj):
+        """Adds an 'Outcome' object to the batch."""
+        self._append_row(
+            outcome_obj.timestamp.timestamp(), outcome_obj.is_victorious, outcome_obj.game_mode,
+            outcome_obj.target_word, outcome_obj.tries, outcome_obj.duration,
+            _letter_mask(outcome_obj.hits), _letter_mask(outcome_obj.misses))
+
+    def extend(self, outcomes):
+        """Adds every 'Outcome' object in an iterable to the batch."""
+        for outcome_obj in outcomes:
+            self.append(outcome_obj)
+        return self
+
+    @classmethod
+    def from_records(cls, records):
+        """Returns a batch built from 'HistoryStore' records."""
+        batch = cls()
+        for record in records:
+            batch._append_row(
+                datetime.datetime.fromisoformat(record['timestamp']).timestamp(), record['is_victorious'],
+                record['game_mode'], record['target_word'], record['tries'], record['duration'],
+                _letter_mask(record['hits']), _letter_mask(record['misses']))
+        return batch
+
+    def write(self, path):
+        """Writes the batch to a compact binary file (little-endian columns preceded by the JSON dictionaries)."""
+        dictionaries = json.dumps({'modes': self.modes, 'words': self.words}).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(self)))
+            f.write(struct.pack("<I", len(dictionaries)))
+            f.write(dictionaries)
+            for name in SCHEMA:
+                column = self.columns[name]
+                if sys.byteorder == "big":
+                    column = array(column.typecode, column)
+                    column.byteswap()
+                f.write(column.tobytes())
+
+    @classmethod
+    def read(cls, path):
+        """Reads a batch written by `write`.
+
+        Raises
+        ------
+        ValueError
+            If the file is not an outcome column file, or a column is shorter than the row count (e.g. the file is truncated).
+        """
+        batch = cls()
+        with open(path, "rb") as f:
+            magic, version, rows = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not an outcome column file")
+            size, = struct.unpack("<I", f.read(4))
+            dictionaries = json.loads(f.read(size).decode("utf-8"))
+            for name, code in SCHEMA.items():
+                column = array(code)
+                data = f.read(rows * column.itemsize)
+                if len(data) != rows * column.itemsize:
+                    raise ValueError(f"{path} is truncated: column `{name}` has {len(data) // column.itemsize} of {rows} rows")
+                column.frombytes(data)
+                if sys.byteorder == "big":
+                    column.byteswap()
+                batch.columns[name] = column
+        batch.modes = dictionaries['modes']
+        batch.words = dictionaries['words']
+        batch._mode_codes = {mode: code for code, mode in enumerate(batch.modes)}
+        batch._word_codes = {word: code for code, word in enumerate(batch.words)}
+        return batch
+
+    def _mask_rows(self, game_mode):
+        """Returns a selector for the rows of a game mode (a boolean array with NumPy), or None for every row."""
+        if game_mode is None:
+            return None
+        code = self._mode_codes.get(game_mode)
+        if np is not None:
+            if code is None:
+                return np.zeros(len(self), dtype=bool)
+            return _as_numpy(self.columns['mode_code']) == code  # <-- one vectorized compare
+        return array("B", (c == code for c in self.columns['mode_code']))
+
+    def win_rate_by_length(self, game_mode=None):
+        """Returns a dictionary of word length to (win rate, games), optionally for a single game mode."""
+        lengths = self.columns['word_length']
+        wins = self.columns['is_victorious']
+        selector = self._mask_rows(game_mode)
+        if np is not None:
+            lengths = _as_numpy(lengths)
+            wins = _as_numpy(wins)
+            if selector is not None:
+                lengths, wins = lengths[selector], wins[selector]
+            games = np.bincount(lengths)
+            won = np.bincount(lengths, weights=wins)
+            return {int(n): (float(won[n] / games[n]), int(games[n])) for n in np.nonzero(games)[0]}
+        games, won = {}, {}
+        for idx, (length, win) in enumerate(zip(lengths, wins)):
+            if selector is None or selector[idx]:
+                games[length] = games.get(length, 0) + 1
+                won[length] = won.get(length, 0) + win
+        return {n: (won[n] / games[n], games[n]) for n in sorted(games)}
+
+    def hardest_letters(self, limit:int=5):
+        """Returns the letters with the highest miss rate, as (letter, miss rate, times guessed) tuples."""
+        hit_masks = self.columns['hit_mask']
+        miss_masks = self.columns['miss_mask']
+        if np is not None:
+            hit_masks = _as_numpy(hit_masks)
+            miss_masks = _as_numpy(miss_masks)
+        results = []
+        for idx, letter in enumerate(LETTERS):
+            if np is not None:
+                misses = int(((miss_masks >> idx) & 1).sum())
+                hits = int(((hit_masks >> idx) & 1).sum())
+            else:
+                bit = 1 << idx
+                misses = sum(1 for mask in miss_masks if mask & bit)
+                hits = sum(1 for mask in hit_masks if mask & bit)
+            if misses + hits:
+                results.append((letter, misses / (misses + hits), misses + hits))
+        results.sort(key=lambda row: (-row[1], -row[2]))
+        return results[:limit]
+
+
+
+if __name__ == '__main__':
+    # Usage: python -m hangman_pkg.analytics [PATH]
+    # Exports the persisted history to PATH (default: outcomes.hmc) and prints a report.
+    path = sys.argv[1] if len(sys.argv) > 1 else "outcomes.hmc"
+    OutcomeColumns.from_records(history_store.load()).write(path)
+    batch = OutcomeColumns.read(path)
+    print(f"{batch!r} -> {path}")
+    for length, (rate, games) in batch.win_rate_by_length().items():
+        print(f"| {str(length).rjust(2)} letters: {rate:6.1%} of {games} games |")
+    print("Hardest letters: " + ", ".join(f"{letter.upper()} ({rate:.0%})" for letter, rate, _ in batch.hardest_letters()))
@@ -0,0 +1,67 @@
+import sys
+import importlib
+import importlib.util
+import threading
+
+
+#========================================
+# OPTIONAL AUDIO BACK ENDS
+#========================================
+
+# module name: distribution to install
+AUDIO_PACKAGES = {
+    'pyttsx3': "pyttsx3",
+    'speech_recognition': "SpeechRecognition",
+}
+
+_lock = threading.Lock()
+
+
+class AudioUnavailable(ImportError):
+    """Raised when an optional audio back end is used but is not installed."""
+
+
+def available(name:str):
+    """Indicates whether an optional audio package can be imported, without importing it."""
+    if name in sys.modules:
+        return sys.modules[name] is not None
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+def load(name:str):
+    """Imports an optional audio package on first use, and returns the module.
+
+    Audio packages are slow to import, so they are only loaded when speech mode needs them rather than when the game starts.
+
+    Parameters
+    ----------
+    name : str
+        The module name, a key of `AUDIO_PACKAGES`.
+
+    Returns
+    -------
+    module
+        The imported module.
+
+    Raises
+    ------
+    AudioUnavailable
+        If the package is not installed.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    with _lock:  # <-- one import, even when the speech worker and the game thread race
+        try:
+            return importlib.import_module(name)
+        except ImportError as exc:
+            raise AudioUnavailable(
+                f"The `{name}` package is not installed (pip install {AUDIO_PACKAGES.get(name, name)})") from exc
+
+
+
+if __name__ == '__main__':
+    for name in AUDIO_PACKAGES:
+        print(f"{name}: {'available' if available(name) else 'not installed'}")
@@ -0,0 +1,321 @@
+import io
+import os
+import sys
+import json
+import time
+import random
+import timeit
+import argparse
+import platform
+import tempfile
+import contextlib
+import statistics
+
+from . import word_index
+from .context import GameContext
+from .game_objects import Game, Mode, Guess, Outcome
+from .instrument import Tracer
+from .render import BoardRenderer
+from .solver import FREQUENCY_ORDER
+
+
+#========================================
+# BENCHMARK REGISTRY
+#========================================
+
+BENCHMARKS = {}     # <-- name: (setup function, operations per call)
+
+def benchmark(name, inner:int=1):
+    """Registers a benchmark. The decorated function prepares any state and returns the callable to time.
+
+    Parameters
+    ----------
+    name : str
+        The identifier of the benchmark.
+    inner : int, default = 1
+        The number of operations performed by each call of the timed callable. Results are reported per operation.
+    """
+    def register(setup):
+        BENCHMARKS[name] = (setup, inner)
+        return setup
+    return register
+
+@contextlib.contextmanager
+def _silenced():
+    """Discards everything printed inside the block."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+#========================================
+# FIXTURES
+#========================================
+
+SYNTHETIC_WORDS = 100000
+_workdir = None
+
+def _fixture_dir():
+    global _workdir
+    if _workdir is None:
+        _workdir = tempfile.TemporaryDirectory(prefix="hangman-bench-")
+    return _workdir.name
+
+def _dictionary():
+    """Returns the word list to benchmark against: the system dictionary, or a synthetic one with the same shape.
+
+    When the system dictionary is missing, `word_index` is pointed at the synthetic list and a temporary index directory for the rest of the run.
+    """
+    if os.path.isfile(word_index.DICTIONARY_PATH):
+        return word_index.DICTIONARY_PATH
+    path = os.path.join(_fixture_dir(), "words")
+    if not os.path.isfile(path):
+        rng = random.Random(0)
+        letters = "abcdefghijklmnopqrstuvwxyz"
+        with open(path, "w") as f:
+            for idx in range(SYNTHETIC_WORDS):
+                word = "".join(rng.choice(letters) for _ in range(rng.randint(2, 16)))
+                f.write((word.title() if idx % 5 == 0 else word) + "\n")  # <-- a share of proper nouns
+    word_index.DICTIONARY_PATH = path
+    word_index.INDEX_DIR = os.path.join(_fixture_dir(), "index")
+    return path
+
+def _mode(source="dictionary", word="juxtaposition"):
+    """Returns an unregistered game mode with an indexed target word."""
+    context = GameContext(store=None)
+    mode = Mode(name="bench", label="benchmark", source=source, min_word_length=10, context=context)
+    mode._word = word
+    mode._index_word()
+    return mode
+
+def _finished_game():
+    mode = _mode()
+    g = Guess()
+    for letter in FREQUENCY_ORDER:
+        g.value = letter
+        mode._grade_guess(g)
+        if mode._unrevealed == 0 or g.miss_count == mode.max_errors:
+            break
+    mode.is_victorious = mode._unrevealed == 0
+    mode.duration = 42.0
+    return mode, g
+
+
+#========================================
+# BENCHMARKS
+#========================================
+
+@benchmark("dictionary_build")
+def bench_dictionary_build():
+    source = _dictionary()
+    path = os.path.join(_fixture_dir(), "build.idx")
+    return lambda: word_index.WordIndex(source, path).build()
+
+@benchmark("dictionary_open")
+def bench_dictionary_open():
+    source = _dictionary()
+    path = os.path.join(_fixture_dir(), "open.idx")
+    word_index.WordIndex(source, path).build()
+    def run():
+        index = word_index.WordIndex(source, path).open()
+        index.close()
+    return run
+
+@benchmark("contact_local_dictionary")
+def bench_contact_local_dictionary():
+    _dictionary()
+    mode = _mode()
+    return mode._contact_local_dicitionary
+
+@benchmark("get_word")
+def bench_get_word():
+    _dictionary()
+    mode = _mode()
+    def run():
+        with _silenced():
+            mode.get_word()
+    return run
+
+@benchmark("grade_guess", inner=len(FREQUENCY_ORDER))
+def bench_grade_guess():
+    mode = _mode()
+    values = list(FREQUENCY_ORDER)
+    def run():
+        mode._index_word()
+        g = Guess()
+        for value in values:
+            g.value = value
+            mode._grade_guess(g)
+    return run
+
+@benchmark("hit_string")
+def bench_hit_string():
+    mode = _mode()
+    g = Guess("a")
+    mask = mode._positions["a"]
+    return lambda: g._hit_string(mode._word, mode._blanks, mask)
+
+@benchmark("hit_string_scan")
+def bench_hit_string_scan():
+    mode = _mode()
+    g = Guess("a")
+    return lambda: g._hit_string(mode._word, mode._blanks)
+
+@benchmark("show_board")
+def bench_show_board():
+    mode, g = _finished_game()
+    h_string, m_string = " ".join(mode._blanks), g.miss_string()
+    def run():
+        with _silenced():
+            g.show_board(h_string, m_string)
+    return run
+
+@benchmark("show_board_diff")
+def bench_show_board_diff():
+    mode, g = _finished_game()
+    h_string, m_string = " ".join(mode._blanks), g.miss_string()
+    renderer = BoardRenderer(io.StringIO(), ansi=True)
+    g.show_board(h_string, m_string, renderer)
+    def run():
+        renderer.stream.seek(0)
+        renderer.stream.truncate()
+        g.show_board(h_string, m_string, renderer)
+    return run
+
+@benchmark("span_disabled")
+def bench_span_disabled():
+    span = Tracer(enabled=False).span
+    def run():
+        with span("bench"):
+            pass
+    return run
+
+@benchmark("traced_disabled")
+def bench_traced_disabled():
+    return Tracer(enabled=False).traced()(lambda: None)
+
+@benchmark("traced_enabled")
+def bench_traced_enabled():
+    return Tracer(enabled=True, max_events=1000).traced()(lambda: None)
+
+@benchmark("outcome_create")
+def bench_outcome_create():
+    mode, g = _finished_game()
+    return lambda: Outcome(mode, g)
+
+def _bench_summary(size):
+    def setup():
+        mode, g = _finished_game()
+        outcome_obj = Outcome(mode, g)
+        context = GameContext(store=None)
+        for _ in range(size):
+            context.record(outcome_obj)
+        def run():
+            with _silenced():
+                Game.summary(context)
+        return run
+    return setup
+
+for size in (10, 10000, 1000000):
+    benchmark(f"summary[{size}]")(_bench_summary(size))
+
+
+#========================================
+# RUNNER
+#========================================
+
+def run_benchmarks(names=None, repeat:int=5, min_time:float=0.2):
+    """Times the selected benchmarks.
+
+    Parameters
+    ----------
+    names : list, optional
+        The benchmarks to run. Defaults to every registered benchmark.
+    repeat : int, default = 5
+        The number of timed rounds per benchmark.
+    min_time : float, default = 0.2
+        The minimum duration of a round, in seconds. The number of calls per round is calibrated to reach it.
+
+    Returns
+    -------
+    dict
+        The environment of the run, and the per-operation timings (in microseconds) of each benchmark.
+    """
+    results = {}
+    for name in names or BENCHMARKS:
+        setup, inner = BENCHMARKS[name]
+        timer = timeit.Timer(setup())
+        number, elapsed = timer.autorange()
+        number = max(int(number * min_time / elapsed), 1) if elapsed else number
+        rounds = [seconds / number / inner * 1e6 for seconds in timer.repeat(repeat, number)]
+        results[name] = {
+            'min_us': min(rounds),
+            'median_us': statistics.median(rounds),
+            'mean_us': statistics.mean(rounds),
+            'rounds': repeat,
+            'calls': number,
+        }
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'benchmarks': results,
+    }
+
+def compare(report, baseline, threshold:float=0.25):
+    """Compares a report with a baseline report.
+
+    Returns
+    -------
+    list
+        (name, baseline median, current median, ratio, is_regression) tuples for the benchmarks present in both reports. A benchmark regresses when its median is more than `threshold` slower than the baseline.
+    """
+    rows = []
+    for name, current in report['benchmarks'].items():
+        previous = baseline['benchmarks'].get(name)
+        if previous is None:
+            continue
+        ratio = current['median_us'] / previous['median_us'] if previous['median_us'] else 1.0
+        rows.append((name, previous['median_us'], current['median_us'], ratio, ratio > 1 + threshold))
+    return rows
+
+def show_report(report, rows=None):
+    """Displays the timings of a report, and the comparison with a baseline if given."""
+    print(f"Python {report['python']} | {report['platform']}")
+    for name, result in report['benchmarks'].items():
+        print(f"| {name.ljust(26)} median: {result['median_us']:12.3f}us | min: {result['min_us']:12.3f}us |")
+    if rows:
+        print("Baseline comparison:")
+        for name, previous, current, ratio, is_regression in rows:
+            print(f"| {name.ljust(26)} {previous:12.3f}us -> {current:12.3f}us ({ratio:5.2f}x){'  REGRESSION' if is_regression else ''}")
+
+
+
+if __name__ == '__main__':
+    # Usage: python -m hangman_pkg.benchmark [--json OUT] [--baseline BASELINE] [--threshold 0.25] [NAME ...]
+    parser = argparse.ArgumentParser(description="Times the hot paths of the hangman package.")
+    parser.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--baseline", help="compare against a report written with --json")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown before failing (0.25 = 25%%)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per round")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args(sys.argv[1:])
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        sys.exit(0)
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+    report = run_benchmarks(args.names, args.repeat, args.min_time)
+    rows = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            rows = compare(report, json.load(f), args.threshold)
+    show_report(report, rows)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if rows and any(row[-1] for row in rows):
+        sys.exit(1)
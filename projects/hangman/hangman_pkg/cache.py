@@ -0,0 +1,135 @@
+import time
+import threading
+from collections import OrderedDict
+
+
+#========================================
+# WORD-SOURCE CACHE
+#========================================
+
+class WordCache:
+    """A thread-safe LRU cache for word lists, bounded by entry count and time-to-live.
+
+    Entries are keyed by `(source, min_word_length, difficulty)`, so every copy of a 'Mode' that shares those parameters reuses the same word list. Word lists that can go stale (a 'WordView' whose index was rebuilt from a changed dictionary) are checked with their `is_current` method on every hit, and a stale entry counts as a miss.
+
+    Attributes
+    ----------
+    max_entries : int, default = 32
+        The maximum number of word lists held before the least recently used one is evicted.
+    ttl : float or None, default = 3600
+        The number of seconds an entry remains valid. None disables expiry.
+    hits : int
+        The number of lookups answered from the cache.
+    misses : int
+        The number of lookups that had to load a word list.
+    evictions : int
+        The number of entries removed because the cache was full or the entry had expired.
+    """
+    def __init__(self, max_entries:int=32, ttl=3600, clock=time.monotonic):
+        """Constructor method for the 'WordCache' class.
+
+        Parameters
+        ----------
+        max_entries : int, default = 32
+            The maximum number of word lists held by the cache.
+        ttl : float or None, default = 3600
+            The number of seconds an entry remains valid. None disables expiry.
+        clock : func, default = time.monotonic
+            A callable that returns the current time in seconds.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._clock = clock
+        self._entries = OrderedDict()   # <-- key: (expires_at, words)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        param_str = ", ".join(f"{k}='{v}'" for k,v in self.stats().items())
+        return f"{self.__class__.__name__}({param_str})"
+
+    def get(self, key):
+        """Returns the cached words for `key`, or None if the key is absent, expired, or stale."""
+        with self._lock:
+            entry = self._entries.get(key)
+        is_current = getattr(entry[1], "is_current", None) if entry is not None else None
+        is_stale = is_current is not None and not is_current()  # <-- outside the lock: it may reload an index
+        with self._lock:
+            if entry is not None and (is_stale or entry[0] is not None and entry[0] <= self._clock()):
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+                    self.evictions += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            if self._entries.get(key) is entry:
+                self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, words):
+        """Stores `words` under `key`, evicting the least recently used entries if the cache is full."""
+        expires_at = None if self.ttl is None else self._clock() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires_at, words)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key, loader):
+        """Returns the cached words for `key`, calling `loader()` to fill the cache on a miss.
+
+        Parameters
+        ----------
+        key : tuple
+            The cache key, typically `(source, min_word_length, difficulty)`.
+        loader : func
+            A callable that returns a word list, or None if the source was unavailable.
+
+        Returns
+        -------
+        list or None
+            The word list, or None if `loader` failed. Failures are not cached.
+        """
+        words = self.get(key)
+        if words is None:
+            words = loader()
+            if words is not None:
+                self.put(key, words)
+        return words
+
+    def invalidate(self, key=None):
+        """Removes `key` from the cache, or every entry if `key` is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self):
+        """Returns a dictionary of the cache size and its hit, miss and eviction counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+# Process-wide cache shared by every 'Mode' instance and copy
+word_cache = WordCache()
+
+
+
+if __name__ == '__main__':
+    pass
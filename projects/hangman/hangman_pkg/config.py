@@ -1,3 +1,10 @@
+import os
+import sys
+import time
+
+from .inputs import read_input
+
+
 #========================================
 # DISPLAY FUNCTIONS
 #========================================
@@ -80,7 +87,7 @@ def get_selection(obj_list):
     """
     is_valid = False
     while not is_valid:
-        obj_id = input("Enter a number for the desired option: ").lower()
+        obj_id = read_input("Enter a number for the desired option: ", obj_list).lower()
         is_valid = is_option_valid(obj_id, obj_list)
     obj_id = int(obj_id)
     obj = obj_list[obj_id-1]
@@ -121,6 +128,74 @@ def get_menu_options(menu):
     return obj
 
 
+#========================================
+# PAGER
+#========================================
+
+# Set HANGMAN_HEADLESS (or CI) to skip every pause, e.g. for scripted sessions
+HEADLESS = bool(os.environ.get("HANGMAN_HEADLESS") or os.environ.get("CI"))
+
+def is_interactive(stream=None):
+    """Indicates whether a person is at the keyboard: the input stream is a terminal and headless mode is off."""
+    stream = stream or sys.stdin
+    if HEADLESS:
+        return False
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+def pause(timeout:float, prompt="Press any key to continue..."):
+    """Keeps the current screen up until a key is pressed or `timeout` seconds pass, without echoing the key.
+
+    Pauses are skipped when input is not interactive (piped, scripted, or headless), so they never consume scripted input.
+
+    Parameters
+    ----------
+    timeout : float
+        The maximum number of seconds to wait.
+    prompt : str
+        The message displayed while waiting.
+
+    Returns
+    -------
+    bool
+        True if a key was pressed, False if the pause timed out or was skipped.
+    """
+    if not is_interactive():
+        return False
+    print(prompt, end="", flush=True)
+    try:
+        return _wait_for_key(timeout)
+    finally:
+        print()
+
+def _wait_for_key(timeout):
+    """Waits for a single keypress on the terminal. Returns True if a key was pressed before the timeout."""
+    if os.name == "nt":
+        import msvcrt
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if msvcrt.kbhit():
+                msvcrt.getwch()
+                return True
+            time.sleep(0.05)
+        return False
+    import select
+    import termios
+    import tty
+    fd = sys.stdin.fileno()
+    settings = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)  # <-- deliver keys immediately, without echo
+        ready, _, _ = select.select([fd], [], [], timeout)
+        if ready:
+            os.read(fd, 32)  # <-- consume the key, including multi-byte escape sequences
+        return bool(ready)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, settings)
+
+
 
 if __name__ == '__main__':
     pass
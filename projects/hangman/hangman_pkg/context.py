@@ -0,0 +1,202 @@
+import copy
+import heapq
+import itertools
+import threading
+from collections import deque
+
+from .history_store import history_store
+from .stats import ModeStats
+
+
+#========================================
+# COPY-ON-WRITE REGISTRY
+#========================================
+
+class Registry:
+    """A list-like registry of named objects (menu options or game modes) that is safe to read from any thread.
+
+    Writers replace the underlying tuple under a lock, so readers iterate a consistent snapshot without locking.
+
+    Methods
+    -------
+    add(item)
+        Registers an object.
+    remove(item)
+        Unregisters an object.
+    get(name)
+        Returns the registered object with a given name, or None.
+    """
+    def __init__(self, items=()):
+        self._items = tuple(items)
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({', '.join(str(item.name) for item in self._items)})"
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, idx):
+        return self._items[idx]
+
+    def add(self, item):
+        """Registers an object."""
+        with self._lock:
+            self._items = self._items + (item,)
+
+    def remove(self, item):
+        """Unregisters an object."""
+        with self._lock:
+            self._items = tuple(obj for obj in self._items if obj is not item)
+
+    def get(self, name):
+        """Returns the registered object named `name`, or None."""
+        for item in self._items:
+            if item.name == name:
+                return item
+        return None
+
+    def names(self):
+        """Returns the names of the registered objects, in registration order."""
+        return [item.name for item in self._items]
+
+
+#========================================
+# SHARDED OUTCOME BUFFER
+#========================================
+
+class OutcomeBuffer:
+    """A bounded buffer of the most recent 'Outcome' objects, split into per-thread shards.
+
+    Each thread is assigned a shard, round-robin, the first time it appends, so games finishing in parallel threads spread across the shards instead of contending for one. Reads merge the shards by timestamp.
+
+    Attributes
+    ----------
+    maxlen : int, default = 100
+        The maximum number of outcomes returned by reads.
+    shards : int, default = 8
+        The number of shards.
+    """
+    def __init__(self, maxlen:int=100, shards:int=8):
+        self.maxlen = maxlen
+        self.shards = shards
+        self._shards = [deque(maxlen=maxlen) for _ in range(shards)]
+        self._next_shard = itertools.count()    # <-- next() is atomic, so no lock is needed
+        self._local = threading.local()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(maxlen='{self.maxlen}', shards='{self.shards}', outcomes='{len(self)}')"
+
+    def append(self, outcome_obj):
+        """Adds an 'Outcome' object to the shard of the calling thread."""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = self._shards[next(self._next_shard) % self.shards]
+        shard.append(outcome_obj)
+
+    def recent(self, limit=None):
+        """Returns the most recent outcomes across every shard, oldest first."""
+        limit = self.maxlen if limit is None else min(limit, self.maxlen)
+        merged = heapq.merge(*(list(shard) for shard in self._shards), key=lambda outcome_obj: outcome_obj.timestamp)
+        return list(deque(merged, maxlen=limit))
+
+    def clear(self):
+        """Removes every outcome."""
+        for shard in self._shards:
+            shard.clear()
+
+    def __iter__(self):
+        return iter(self.recent())
+
+    def __len__(self):
+        return min(sum(len(shard) for shard in self._shards), self.maxlen)
+
+
+#========================================
+# GAME CONTEXT
+#========================================
+
+class GameContext:
+    """The owner of every collection shared by the games of one application, player or test.
+
+    Separate contexts never share state, and a single context may be used by games running in parallel threads.
+
+    Attributes
+    ----------
+    menu : Registry
+        The registered 'Option' objects.
+    modes : Registry
+        The registered 'Mode' objects, used as templates for new games.
+    history : OutcomeBuffer
+        The most recent 'Outcome' objects, at most `history_limit` (100 by default). Older outcomes only remain in `store`.
+    stats : dict
+        The running 'ModeStats' aggregates per game mode. Only written under a lock.
+    store : HistoryStore or None
+        The durable store that outcomes are persisted to. None disables persistence.
+
+    Methods
+    -------
+    new_game(mode_obj)
+        Returns a copy of a game mode that is ready to be played in this context.
+    record(outcome_obj)
+        Adds an 'Outcome' object to the history and statistics of the context, and persists it.
+    """
+    def __init__(self, menu=(), modes=(), store=history_store, history_limit:int=100, shards:int=8):
+        self.menu = Registry(menu)
+        self.modes = Registry(modes)
+        self.history = OutcomeBuffer(history_limit, shards)
+        self.stats = {}
+        self.store = store
+        self._stats_locks = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(menu={self.menu!r}, modes={self.modes!r}, history={self.history!r})"
+
+    def new_game(self, mode_obj):
+        """Returns a copy of a game mode, with its own gameplay event, that records its outcome in this context.
+
+        Parameters
+        ----------
+        mode_obj : Mode or str
+            A game mode, or the name of a mode registered in this context.
+        """
+        if isinstance(mode_obj, str):
+            name, mode_obj = mode_obj, self.modes.get(mode_obj)
+            if mode_obj is None:
+                raise KeyError(f"Unknown game mode: {name}")
+        game = copy.copy(mode_obj)
+        game.active_game = threading.Event()
+        game.context = self
+        game._session = None
+        return game
+
+    def _stats_lock(self, game_mode):
+        lock = self._stats_locks.get(game_mode)
+        if lock is None:
+            with self._lock:
+                lock = self._stats_locks.get(game_mode)
+                if lock is None:
+                    self.stats[game_mode] = ModeStats()
+                    lock = self._stats_locks[game_mode] = threading.Lock()
+        return lock
+
+    def record(self, outcome_obj):
+        """Adds an 'Outcome' object to the history and running statistics of the context, and queues it to be persisted."""
+        self.history.append(outcome_obj)
+        with self._stats_lock(outcome_obj.game_mode):  # <-- one lock per game mode
+            self.stats[outcome_obj.game_mode].record(outcome_obj)
+        if self.store is not None:
+            self.store.record(outcome_obj)
+
+
+# The context of the command-line application
+default_context = GameContext()
+
+
+
+if __name__ == '__main__':
+    pass
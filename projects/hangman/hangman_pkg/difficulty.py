@@ -0,0 +1,216 @@
+import os
+import sys
+import json
+import math
+import argparse
+
+from .word_index import INDEX_DIR, get_index
+from . import word_index
+
+
+#========================================
+# SCORING CONFIGURATION
+#========================================
+
+TIERS = ("easy", "medium", "hard")
+TIER_DIR = os.path.join(INDEX_DIR, "difficulty")
+WEIGHTS = {  # <-- feature: weight in the difficulty score
+    'misses': 1.0,      # misses of a simulated player before the word is solved
+    'rarity': 0.5,      # mean surprisal (in bits) of the word's distinct letters
+    'distinct': -0.1,   # distinct letters: more of them reveal the word sooner
+}
+MANIFEST = "manifest.json"
+
+
+def tier_dir(source=None):
+    """Returns the directory holding the difficulty tiers of a word list (by default, the system dictionary)."""
+    source = os.path.abspath(source or word_index.DICTIONARY_PATH)
+    return os.path.join(TIER_DIR, source.strip(os.sep).replace(os.sep, "_"))
+
+def letter_frequencies(words):
+    """Returns the fraction of words that contain each letter."""
+    counts = {}
+    for word in words:
+        for char in set(word):
+            counts[char] = counts.get(char, 0) + 1
+    return {char: count / len(words) for char, count in counts.items()}
+
+def word_features(word, frequencies):
+    """Returns the static features of a word: its distinct-letter count and the rarity of those letters."""
+    distinct = set(word)
+    return {
+        'distinct': len(distinct),
+        'rarity': sum(-math.log2(frequencies[char]) for char in distinct) / len(distinct),
+    }
+
+def difficulty_score(features):
+    """Returns the weighted difficulty score of a word's features (see `WEIGHTS`)."""
+    return sum(weight * features[name] for name, weight in WEIGHTS.items())
+
+
+#========================================
+# OFFLINE SCORING PIPELINE
+#========================================
+
+def _score_chunk(words, strategy_name, frequencies, source=None):
+    """Scores a chunk of words, simulating one game per word. Returns (word, distinct, rarity, misses, score) tuples."""
+    from .context import GameContext
+    from .game_objects import Mode
+    from .simulation import Strategy, play_headless
+
+    # The game's own error limit, so a word the simulated player loses scores the most misses a player can make
+    mode_obj = Mode(name="difficulty", context=GameContext(store=None))
+    strategy = Strategy.strategies[strategy_name](source=source)
+    rows = []
+    for word in words:
+        features = word_features(word, frequencies)
+        _, g = play_headless(mode_obj, strategy, word)
+        features['misses'] = g.miss_count
+        rows.append((word, features['distinct'], features['rarity'], features['misses'], difficulty_score(features)))
+    return rows
+
+def score_words(words, strategy="solver", workers=None, source=None):
+    """Scores every word, fanning the simulated games out over a process pool.
+
+    Parameters
+    ----------
+    words : list
+        The lowercase words to score.
+    strategy : str, default = "solver"
+        The name of the simulated player's 'Strategy'.
+    workers : int or None, default = None
+        The number of worker processes. None uses every CPU; 0 scores in the current process.
+    source : str, optional
+        The word list the simulated player draws its candidate words from. Defaults to the system dictionary.
+
+    Returns
+    -------
+    list
+        (word, distinct, rarity, misses, score) tuples, in the order of `words`.
+    """
+    frequencies = letter_frequencies(words)
+    workers = os.cpu_count() if workers is None else workers
+    chunk = max(len(words) // max(workers * 8, 1), 1)
+    chunks = [words[start:start + chunk] for start in range(0, len(words), chunk)]
+    if workers:
+        from concurrent.futures import ProcessPoolExecutor  # <-- multiprocessing is slow to import, and games only need `tier_words`
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(_score_chunk, chunks, [strategy] * len(chunks), [frequencies] * len(chunks), [source] * len(chunks)))
+    else:
+        results = [_score_chunk(words_chunk, strategy, frequencies, source) for words_chunk in chunks]
+    return [row for rows in results for row in rows]
+
+def build_tiers(source=None, tiers=TIERS, strategy="solver", workers=None, min_word_length:int=3):
+    """Scores a word list offline and writes one word list per difficulty tier, each split at score quantiles.
+
+    Every tier is a plain word list that is served through its own 'WordIndex', so picking a word from a tier at game start is O(1).
+
+    Parameters
+    ----------
+    source : str, optional
+        The word list to score. Defaults to the system dictionary.
+    tiers : tuple, default = TIERS
+        The tier names, from easiest to hardest.
+    strategy : str, default = "solver"
+        The name of the simulated player's 'Strategy'.
+    workers : int or None, default = None
+        The number of worker processes.
+    min_word_length : int, default = 3
+        Shorter words are left out of every tier.
+
+    Returns
+    -------
+    dict
+        The manifest written next to the tiers: the source stamp, the tier sizes and their score thresholds.
+    """
+    source = source or word_index.DICTIONARY_PATH
+    words = sorted({word for word in get_index(source).words(min_word_length)
+        if word.isascii() and word.isalpha() and word.islower()})
+    if not words:
+        raise ValueError(f"{source} has no words to score")
+    rows = sorted(score_words(words, strategy, workers, source), key=lambda row: (row[-1], row[0]))
+
+    directory = tier_dir(source)
+    os.makedirs(directory, exist_ok=True)
+    stat = os.stat(source)
+    manifest = {
+        'source': os.path.abspath(source),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'strategy': strategy,
+        'weights': WEIGHTS,
+        'tiers': {},
+    }
+    for number, tier in enumerate(tiers):
+        start, stop = len(rows) * number // len(tiers), len(rows) * (number + 1) // len(tiers)
+        tier_rows = rows[start:stop]
+        with open(os.path.join(directory, f"{tier}.txt"), "w") as f:
+            f.write("".join(f"{row[0]}\n" for row in tier_rows))
+        manifest['tiers'][tier] = {
+            'words': len(tier_rows),
+            'min_score': tier_rows[0][-1] if tier_rows else None,
+            'max_score': tier_rows[-1][-1] if tier_rows else None,
+        }
+    with open(os.path.join(directory, "scores.tsv"), "w") as f:
+        f.write("word\tdistinct\trarity\tmisses\tscore\n")
+        f.writelines(f"{word}\t{distinct}\t{rarity:.3f}\t{misses}\t{score:.3f}\n" for word, distinct, rarity, misses, score in rows)
+    with open(os.path.join(directory, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+#========================================
+# TIER LOOKUP
+#========================================
+
+def load_manifest(source=None):
+    """Returns the manifest of a word list's difficulty tiers, or None if they are missing or older than the word list."""
+    source = source or word_index.DICTIONARY_PATH
+    try:
+        with open(os.path.join(tier_dir(source), MANIFEST)) as f:
+            manifest = json.load(f)
+        stat = os.stat(source)
+    except (OSError, ValueError):
+        return None
+    if (manifest.get('size'), manifest.get('mtime_ns')) != (stat.st_size, stat.st_mtime_ns):
+        return None
+    return manifest
+
+def tier_words(difficulty:str, min_word_length:int=0, source=None):
+    """Returns a list-like view of the words of a difficulty tier with at least `min_word_length` letters.
+
+    No scoring happens here: the tier was written by `build_tiers`, and the view is an O(1) range of its 'WordIndex'.
+
+    Raises
+    ------
+    LookupError
+        If the tiers were never built, are stale, or have no tier named `difficulty`.
+    """
+    manifest = load_manifest(source)
+    if manifest is None:
+        raise LookupError("The difficulty tiers are missing or stale. Run `python -m hangman_pkg.difficulty build`")
+    if difficulty not in manifest['tiers']:
+        raise LookupError(f"Unknown difficulty `{difficulty}`. Expected one of: {', '.join(manifest['tiers'])}")
+    return get_index(os.path.join(tier_dir(source), f"{difficulty}.txt")).words(min_word_length)
+
+
+
+if __name__ == '__main__':
+    # Usage: python -m hangman_pkg.difficulty build [--source PATH] [--strategy solver] [--workers N]
+    #        python -m hangman_pkg.difficulty show [--source PATH]
+    parser = argparse.ArgumentParser(description="Scores dictionary words by difficulty and writes tiered word indexes.")
+    parser.add_argument("command", choices=("build", "show"))
+    parser.add_argument("--source", help="word list to score (default: the system dictionary)")
+    parser.add_argument("--strategy", default="solver", help="simulated player: solver, entropy, frequency or random")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (0 = in-process)")
+    parser.add_argument("--tiers", nargs="*", default=list(TIERS), help="tier names, from easiest to hardest")
+    args = parser.parse_args(sys.argv[1:])
+
+    manifest = build_tiers(args.source, tuple(args.tiers), args.strategy, args.workers) if args.command == "build" else load_manifest(args.source)
+    if manifest is None:
+        print("The difficulty tiers are missing or stale. Run `python -m hangman_pkg.difficulty build`")
+        sys.exit(1)
+    print(f"Difficulty tiers of {manifest['source']} (simulated with the `{manifest['strategy']}` strategy)")
+    for tier, info in manifest['tiers'].items():
+        sample = ", ".join(tier_words(tier, 0, args.source)[idx] for idx in range(min(info['words'], 5)))
+        print(f"| {tier.title().rjust(8)}: {str(info['words']).rjust(6)} words, score {info['min_score']:.2f} to {info['max_score']:.2f} | e.g. {sample}")
@@ -0,0 +1,246 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import importlib
+import traceback
+import contextlib
+import statistics
+
+from . import config
+from .context import default_context
+from .inputs import ScriptExhausted, ConsoleInput, ReplayInput, FuzzInput
+from .startup import PROJECT_DIR
+
+
+#========================================
+# SESSION DRIVER
+#========================================
+
+def _load_app():
+    """Imports the command-line application (`app.py` in the project directory)."""
+    if PROJECT_DIR not in sys.path:
+        sys.path.insert(0, PROJECT_DIR)
+    return importlib.import_module("app")
+
+@contextlib.contextmanager
+def _scripted(silent:bool=True, persist:bool=False):
+    """Runs the block headless (no pauses), optionally without output and without persisting outcomes."""
+    headless, store = config.HEADLESS, default_context.store
+    config.HEADLESS = True
+    if not persist:
+        default_context.store = None
+    try:
+        if silent:
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                yield
+        else:
+            yield
+    finally:
+        config.HEADLESS, default_context.store = headless, store
+
+def _games_played():
+    return sum(stats.games for stats in list(default_context.stats.values()))
+
+def run_session(provider, seed:int=0, allow_exhausted:bool=False, silent:bool=True, persist:bool=False):
+    """Runs one end-to-end session of the application (menu, game modes, games and summaries) with scripted input.
+
+    Parameters
+    ----------
+    provider : InputProvider
+        The source of every line of input.
+    seed : int, default = 0
+        Seeds `random` before the session, so the same input picks the same words.
+    allow_exhausted : bool, default = False
+        Indicates whether running out of input counts as a successful session (as it does for fuzzing), rather than a divergence from the script.
+    silent : bool, default = True
+        Indicates whether the application's output is discarded.
+    persist : bool, default = False
+        Indicates whether the outcomes are written to the history store.
+
+    Returns
+    -------
+    response['status'] : str
+        "exit" if the session ended through the END option, "finished" if the application returned, "exhausted" if the input ran out, or "error".
+    response['successful'] : bool
+        True if successful, False otherwise.
+    response['error'] : str or None
+        None if successful, a string error message otherwise.
+    response['games'] : int
+        The number of games completed.
+    response['inputs'] : int or None
+        The number of lines of input read, if the provider records them.
+    response['seconds'] : float
+        The duration of the session.
+    """
+    app = _load_app()
+    response = {
+        'status': "finished",
+        'successful': True,
+        'error': None,
+        'games': 0,
+        'inputs': None,
+        'seconds': 0.0,
+    }
+    random.seed(seed)
+    games = _games_played()
+    start = time.perf_counter()
+    with _scripted(silent, persist):
+        try:
+            app.hangman(provider)
+        except SystemExit:  # <-- `end_app` exits the interpreter
+            response['status'] = "exit"
+        except ScriptExhausted as exc:
+            response['status'] = "exhausted"
+            response['successful'] = allow_exhausted
+            response['error'] = None if allow_exhausted else str(exc)
+        except Exception:
+            response['status'] = "error"
+            response['successful'] = False
+            response['error'] = traceback.format_exc()
+    response['seconds'] = time.perf_counter() - start
+    response['games'] = _games_played() - games
+    if provider.lines is not None:
+        response['inputs'] = len(provider.lines)
+    return response
+
+def run_sessions(kind="fuzz", sessions:int=100, seed:int=0, script=None, max_inputs:int=500, fail_dir=None):
+    """Runs many scripted sessions back to back and measures their throughput.
+
+    Parameters
+    ----------
+    kind : str, default = "fuzz"
+        "fuzz" to generate a random session per seed, or "replay" to replay `script` in every session.
+    sessions : int, default = 100
+        The number of sessions.
+    seed : int, default = 0
+        The seed of the first fuzz session; session `n` uses `seed + n`. Every replay session uses `seed`, so they all play the same words.
+    script : list, optional
+        The lines replayed in every session. Required for "replay".
+    max_inputs : int, default = 500
+        The number of lines of input of a fuzz session.
+    fail_dir : str, optional
+        A directory that the input of every failed session is saved to, as a replay script.
+
+    Returns
+    -------
+    dict
+        The status counts, throughput and session-time percentiles of the run, and the failed sessions.
+    """
+    results, failures = [], []
+    start = time.perf_counter()
+    for session_seed in range(seed, seed + sessions):
+        if kind == "fuzz":
+            provider = FuzzInput(session_seed, max_inputs)
+        else:
+            provider, session_seed = ReplayInput(script, record=True), seed
+        result = run_session(provider, session_seed, allow_exhausted=kind == "fuzz")
+        results.append(result)
+        if not result['successful']:
+            failure = {'seed': session_seed, 'error': result['error'].strip().splitlines()[-1], 'script': None}
+            if fail_dir:
+                os.makedirs(fail_dir, exist_ok=True)
+                failure['script'] = _save_script(os.path.join(fail_dir, f"{kind}-{session_seed}.txt"), session_seed, provider.lines)
+            failures.append(failure)
+    elapsed = time.perf_counter() - start
+    session_ms = sorted(result['seconds'] * 1e3 for result in results)
+    inputs = sum(result['inputs'] or 0 for result in results)
+    statuses = {}
+    for result in results:
+        statuses[result['status']] = statuses.get(result['status'], 0) + 1
+    return {
+        'kind': kind,
+        'sessions': sessions,
+        'statuses': statuses,
+        'games': sum(result['games'] for result in results),
+        'inputs': inputs,
+        'seconds': elapsed,
+        'sessions_per_min': sessions / elapsed * 60 if elapsed else 0.0,
+        'inputs_per_sec': inputs / elapsed if elapsed else 0.0,
+        'p50_ms': statistics.median(session_ms) if session_ms else 0.0,
+        'p99_ms': session_ms[min(int(len(session_ms) * 0.99), len(session_ms) - 1)] if session_ms else 0.0,
+        'failures': failures,
+    }
+
+def show_report(report, baseline=None, threshold:float=0.25):
+    """Displays the throughput of a run, and its change from a baseline run if given. Returns True if throughput regressed."""
+    statuses = ", ".join(f"{status}: {count}" for status, count in sorted(report['statuses'].items()))
+    print(f"{report['sessions']} {report['kind']} sessions ({statuses}) | {report['games']} games | {report['inputs']} inputs | {report['seconds']:.2f}s")
+    print(f"| Throughput: {report['sessions_per_min']:10.0f} sessions/min | {report['inputs_per_sec']:10.0f} inputs/s |")
+    print(f"| Session time: p50 {report['p50_ms']:8.2f}ms | p99 {report['p99_ms']:8.2f}ms |")
+    for failure in report['failures']:
+        print(f"FAILED seed {failure['seed']}: {failure['error']}{' -> ' + failure['script'] if failure['script'] else ''}")
+    if baseline is None:
+        return False
+    ratio = report['sessions_per_min'] / baseline['sessions_per_min'] if baseline['sessions_per_min'] else 1.0
+    is_regression = ratio < 1 - threshold
+    print(f"Baseline: {baseline['sessions_per_min']:.0f} -> {report['sessions_per_min']:.0f} sessions/min ({ratio:5.2f}x){'  REGRESSION' if is_regression else ''}")
+    return is_regression
+
+def _save_script(path, seed, lines):
+    """Writes a replay script with its seed in the header. Returns the path."""
+    with open(path, "w") as f:
+        f.write(f"# seed: {seed}\n")
+        f.writelines(f"{line}\n" for line in lines)
+    return path
+
+def _script_seed(path):
+    """Returns the seed recorded in the header of a replay script, or 0."""
+    with open(path) as f:
+        for line in f:
+            if not line.startswith("#"):
+                break
+            if line.startswith("# seed:"):
+                return int(line.split(":", 1)[1])
+    return 0
+
+
+
+if __name__ == '__main__':
+    # Usage: python -m hangman_pkg.driver fuzz [--sessions 1000] [--seed 0] [--fail-dir DIR] [--json OUT] [--baseline BASELINE]
+    #        python -m hangman_pkg.driver replay SCRIPT [--sessions 100] [--echo]
+    #        python -m hangman_pkg.driver record SCRIPT [--seed 0]
+    parser = argparse.ArgumentParser(description="Drives end-to-end sessions of the hangman CLI with scripted input.")
+    parser.add_argument("command", choices=("fuzz", "replay", "record"))
+    parser.add_argument("script", nargs="?", help="replay script to read (replay) or write (record)")
+    parser.add_argument("--sessions", type=int, default=100)
+    parser.add_argument("--seed", type=int, help="seed of the first session (default: the script's, or 0)")
+    parser.add_argument("--max-inputs", type=int, default=500, help="lines of input per fuzz session")
+    parser.add_argument("--echo", action="store_true", help="replay a single session with its output")
+    parser.add_argument("--fail-dir", help="save the input of failed sessions here")
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--baseline", help="compare throughput against a report written with --json")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed throughput loss before failing (0.25 = 25%%)")
+    args = parser.parse_args(sys.argv[1:])
+
+    if args.command != "fuzz" and not args.script:
+        parser.error(f"{args.command} needs a SCRIPT")
+    seed = args.seed if args.seed is not None else (_script_seed(args.script) if args.command == "replay" else 0)
+
+    if args.command == "record":
+        provider = ConsoleInput(record=True)
+        try:
+            result = run_session(provider, seed, silent=False, persist=True)
+            print(result['error'] or result['status'])
+        finally:
+            _save_script(args.script, seed, provider.lines)
+        sys.exit(0)
+    if args.echo:
+        result = run_session(ReplayInput.from_file(args.script, echo=True), seed, silent=False)
+        print(result['error'] or result['status'])
+        sys.exit(0 if result['successful'] else 1)
+
+    script = ReplayInput.from_file(args.script).script if args.command == "replay" else None
+    report = run_sessions(args.command, args.sessions, seed, script, args.max_inputs, args.fail_dir)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    is_regression = show_report(report, baseline, args.threshold)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if report['failures'] or is_regression:
+        sys.exit(1)
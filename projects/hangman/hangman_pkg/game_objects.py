@@ -1,10 +1,24 @@
+import sys
 import random
 import time
 import datetime
 import threading
 
-import pyttsx3
-import speech_recognition as sr
+from .audio import AudioUnavailable, available
+from .cache import word_cache
+from .context import default_context
+from .difficulty import tier_words
+from .history_store import history_store
+from .inputs import read_input
+from .instrument import traced
+from .render import BoardRenderer, board_lines, gallows_frames
+from .scheduler import ScheduledTimer
+from .speech import speech_service
+from .word_index import get_index
+from .word_sources import WordSource
+
+
+LETTER_BITS = {chr(ord("a") + idx): 1 << idx for idx in range(26)}
 
 
 #========================================
@@ -22,15 +36,17 @@ class Option:
         The display name of an option.
     action : func
         A callback function to execute the selected option.
+    context : GameContext
+        The context whose menu the option is registered in.
 
     Class Variables
     ---------------
-    menu : list
-        A list of all instantiated 'Option' objects.
+    menu : Registry
+        The options registered in the default context.
     """
-    menu = []
+    menu = default_context.menu
 
-    def __init__(self, name:str, label:str, action):
+    def __init__(self, name:str, label:str, action, context=default_context):
         """Constructor method for the 'Option' class.
 
         Parameters
@@ -41,11 +57,14 @@ class Option:
             The display name of an option.
         action : func
             A callback function to execute the selected option.
+        context : GameContext, default = default_context
+            The context whose menu the option is registered in.
         """
         self.name = name
         self.label = label
         self.action = action
-        Option.menu.append(self)
+        self.context = context
+        context.menu.add(self)
 
     def __str__(self):
         return f"{self.name.upper()}"
@@ -68,36 +87,49 @@ class Game:
         An event object that manages the state of gameplay.
     time_limit : int, default = 180
         The maximum time, in seconds, allotted for a timed game.
+    context : GameContext
+        The context that records the outcome of the game.
 
     Class Variables
     ---------------
-    history : list
-        A list of instances for the 'Outcome' class.
-    victories : dict
-        A dictionary that maintains a tally for the number of wins per game mode played during a session.
+    history : OutcomeBuffer
+        The 100 most recent 'Outcome' instances of the default context (its `history_limit`). Older outcomes are dropped from memory, so this is no longer the full game history: every outcome is persisted by `history_store`, which holds the complete record.
+    history_store : HistoryStore
+        The durable, append-only store that outcomes are written to in the background.
+    stats : dict
+        A dictionary of running 'ModeStats' aggregates (wins, games, streaks, means and rolling windows) per game mode played in the default context.
+    PRAISE : tuple
+        The praises spoken after a correct guess.
+    TAUNT : tuple
+        The taunts spoken after an incorrect guess.
     """
-    history = []
-    victories = {}
+    history = default_context.history
+    history_store = history_store
+    stats = default_context.stats
+    PRAISE = ("Success!","Fantastic!","Awesome!","Phenomenal!")
+    TAUNT = ("Tough luck.","Bollocks, you can do better.","Are you serious?!","Aww... so close.")
 
-    def __init__(self, active_game=threading.Event(), time_limit=180):
+    def __init__(self, active_game=None, time_limit=180, context=default_context):
         """Constructor method for the 'Game' class.
 
         Parameters
         ----------
-        active_game : threading.Event
-            An event object that manages state of gameplay.
+        active_game : threading.Event, optional
+            An event object that manages state of gameplay. A new event is created if omitted.
         time_limit : int, default = 300
             The maximum time, in seconds, allotted for a timed game.
+        context : GameContext, default = default_context
+            The context that records the outcome of the game.
         """
-        self.active_game = active_game
+        self.active_game = active_game or threading.Event()
         self.time_limit = time_limit
+        self.context = context
 
     @staticmethod
+    @traced()
     def speak(text):
-        """A method that converts text to speech using the pyttsx3 library."""
-        engine = pyttsx3.init()
-        engine.say(text)
-        engine.runAndWait()
+        """A method that queues text to be spoken by the shared speech service without blocking gameplay."""
+        speech_service.say(text)
 
     @staticmethod
     def _communicate(condition:bool, f1, f2, text):
@@ -118,14 +150,12 @@ class Game:
     @staticmethod
     def _praise():
         """A randomly-selected praise made by the computer during gameplay."""
-        praise = ["Success!","Fantastic!","Awesome!","Phenomenal!"]
-        return random.choice(praise)
+        return random.choice(Game.PRAISE)
 
     @staticmethod
     def _taunt():
         """A randomly-selected taunt made by the computer during gameplay."""
-        taunt = ["Tough luck.","Bollocks, you can do better.","Are you serious?!","Aww... so close."]
-        return random.choice(taunt)
+        return random.choice(Game.TAUNT)
 
     @staticmethod
     def _time_label(interval):
@@ -133,9 +163,10 @@ class Game:
         mins, secs = divmod(interval, 60)
         return f"{mins:.0f} minutes and {secs:.0f} seconds"
 
+    @traced()
     def _save_results(self, outcome_obj):
-        """Appends an 'Outcome' object to the `history` class variable."""
-        Game.history.append(outcome_obj)
+        """Records an 'Outcome' object in the history and statistics of the game's context, and queues it to be persisted."""
+        self.context.record(outcome_obj)
     
     def _end_game(self):
         """Resets the flag of the `active_game` event to False."""
@@ -143,16 +174,17 @@ class Game:
         self.active_game.clear()
 
     def _create_timer(self):
-        """Creates a 'Timer' thread object that triggers a callback function."""
-        return threading.Timer(interval=self.time_limit, function=self._end_game)
+        """Creates a 'ScheduledTimer' on the shared deadline scheduler that triggers a callback function."""
+        return ScheduledTimer(interval=self.time_limit, function=self._end_game)
 
     @classmethod
-    def summary(cls):
-        """A class method that displays a tally of wins for each game mode played during the current session."""
+    def summary(cls, context=None):
+        """A class method that displays a tally of wins for each game mode played in a context (by default, the current session)."""
+        context = context or default_context
         print("Gameplay Summary".center(27))
         print(f"/{'-'*25}\\")
-        for k, v in Game.victories.items():
-            print(f"| {k.title().rjust(8)} Mode: {str(sum(v)).zfill(2)} of {str(len(v)).zfill(2)} |")
+        for k, v in list(context.stats.items()):
+            print(f"| {k.title().rjust(8)} Mode: {str(v.wins).zfill(2)} of {str(v.games).zfill(2)} |")
         print(f"\{'_'*25}/")
         print("\n\n")
 
@@ -177,24 +209,38 @@ class Mode(Game):
     objective : str
         A description of the game mode objective.
     source : str or None, default = None
-        The word source for a selected game mode.
+        The word source for a selected game mode: the name of a registered 'WordSource' (e.g. "dictionary" or "speech"), or the path to a word corpus file.
     min_word_length : int, default = 8
         The minimum number of letters in a target word.
+    difficulty : str or None, default = None
+        The difficulty tier (e.g. "easy" or "hard") that dictionary words are drawn from. None draws from the whole dictionary.
     has_timer : bool, default = False
         Indicates whether the game mode is timed.
     max_errors : int, default = 6
         The maximum number of errors a user is allowed to make before losing the game.
+    context : GameContext
+        The context the game mode is registered in, and that records its outcomes.
     word : str
         An unknown target word determined by the selected game mode.
     chars : set
         A set of all unique letters contained in `word`.
     blanks : list
         A list of placeholders (underscores) equal to the length of `word`.
+    positions : dict
+        A precomputed index of each letter in `word` to a bitmask of the positions where it occurs.
+    unrevealed : int
+        A bitmask of the positions in `word` that have not been guessed yet. The game is won when it reaches 0.
+    revealed : int
+        A bitmask of the positions revealed by the most recent guess.
 
     Class Variables
     ---------------
-    all_modes : list
-        A list of all instantiated 'Mode' objects.
+    all_modes : Registry
+        The game modes registered in the default context.
+    word_cache : WordCache
+        A process-wide cache of word lists shared by every 'Mode' instance and copy.
+    DEFAULT_WORDS : tuple
+        The fallback target words used when a game mode has no word source, or its source is unavailable.
 
     Methods
     -------
@@ -207,19 +253,38 @@ class Mode(Game):
     results(guess_obj)
         A method that communicates the results of a game instance to the user.
     """
-    all_modes = []
+    all_modes = default_context.modes
+    word_cache = word_cache
+    DEFAULT_WORDS = (
+        "resurrection", "osphresiology", "establishment","ridiculous","collection", "querimonious", "experimentation", "zealotry",
+        "international", "vastation", "gemelliparous", "kyriolexy",
+        "totalitarianism", "kaleidophone", "nephralgia",
+        "juxtaposition", "decalescence", "calorifacient",
+        "loquacious", "uniphonous", "abscissa",
+        "differentiation", "kettlestitch", "halitosis",
+        "logarithmic", "ultracrepidate", "biloquist",
+        "quadrennium", "gawdelpus", "acritochromacy",
+        "ethereal", "jactitation", "delaminate",
+        "zwitterion", "oppignorate", "whippletree",
+        "xenobiotic", "otorhinolaryngology", "eldritch",
+        "transient", "oligarchy", "naturalism",
+        "inconsequential", "grandisonant",
+        "reverberate","capricious", "hematology",
+        "whimsical", "xylography", "balatron",
+        "disenfranchise", "neomorphic", "wrackful",)
 
     def __init__(
-        self, active_game=threading.Event(), is_victorious=False,
+        self, active_game=None, is_victorious=False,
         time_limit=180, duration=0, 
         name=None, label=None, 
-        objective=None, source=None, min_word_length=8, has_timer=False, max_errors=6):
+        objective=None, source=None, min_word_length=8, has_timer=False, max_errors=6, context=default_context,
+        difficulty=None):
         """Constructor method for the 'Mode' class.
             
         Attributes
         ----------
-        active_game : threading.Event
-            An event object that manages the state of gameplay.
+        active_game : threading.Event, optional
+            An event object that manages the state of gameplay. A new event is created if omitted.
         is_victorious : bool, default = False
             Indicates whether or not a player won a game instance.
         time_limit : int, default = 300
@@ -233,16 +298,19 @@ class Mode(Game):
         objective : str
             A description of the game mode objective.
         source : str or None, default = None
-            The word source for a selected game mode.
+            The word source for a selected game mode: the name of a registered 'WordSource' (e.g. "dictionary" or "speech"), or the path to a word corpus file.
         min_word_length : int, default = 8
             The minimum number of letters in a target word.
         has_timer : bool, default = False
             Indicates whether or not the game mode is timed.
         max_errors : int, default = 6
             The maximum number of errors a user is allowed to make before losing the game.
+        context : GameContext, default = default_context
+            The context the game mode is registered in, and that records its outcomes.
+        difficulty : str or None, default = None
+            The difficulty tier that dictionary words are drawn from (see `hangman_pkg.difficulty`). None draws from the whole dictionary.
         """
-        super().__init__(active_game, time_limit)
-        self.active_game = active_game
+        super().__init__(active_game, time_limit, context)
         self.is_victorious = is_victorious
         self.time_limit = time_limit
         self.duration = duration
@@ -251,12 +319,17 @@ class Mode(Game):
         self.objective = objective
         self.source = source
         self.min_word_length = min_word_length
+        self.difficulty = difficulty
         self.has_timer = has_timer
         self.max_errors = max_errors
         self._word = ""
         self._chars = set(self._word)
         self._blanks = ["_" for _ in self._word]
-        Mode.all_modes.append(self)
+        self._positions = {}
+        self._unrevealed = 0
+        self._revealed = 0
+        self._session = None
+        context.modes.add(self)
 
     def __str__(self):
         return f"{self.name.upper()}"
@@ -272,8 +345,8 @@ class Mode(Game):
         
         Returns
         -------
-        response['words'] : list
-            A list of words if successful, None otherwise.
+        response['words'] : WordView
+            A list-like view of the indexed words if successful, None otherwise.
         response['successful'] : bool
             True if successful, False otherwise.
         response['error'] : str or None
@@ -285,10 +358,7 @@ class Mode(Game):
             'error': None,
         }
         try:
-            with open("/usr/share/dict/words", "r") as f:
-                raw_list = f.read().split("\n")
-                filtered_list = [word for word in raw_list if (len(word) >= self.min_word_length 
-                and word[0].islower())]
+            filtered_list = get_index().words(self.min_word_length)
         except:
             response["successful"] = False
             response["error"] = "I cannot reach the local system dictionary!"
@@ -297,10 +367,27 @@ class Mode(Game):
         finally:
             return response
 
+    def _tier_words(self):
+        """Returns a list-like view of the words in the game mode's difficulty tier, or None if the tier is missing, stale or empty."""
+        try:
+            return tier_words(self.difficulty, self.min_word_length) or None
+        except LookupError as exc:
+            print(f"{exc}. Drawing `{self.difficulty}` words from the whole dictionary instead.", file=sys.stderr)
+            return None
+
     def _get_from_dictionary(self):
-        """Returns a list of words if call to `contact_local_dictionary` was successful, None otherwise."""
-        response = self._contact_local_dicitionary()
-        return response['words']
+        """Returns a list-like view of words if call to `contact_local_dictionary` was successful, None otherwise.
+
+        The result is shared through `word_cache`, so repeated games with the same source, `min_word_length` and `difficulty` skip the dictionary entirely. If the difficulty tier is unavailable, the whole dictionary is served under the key of a mode without a difficulty, so the tier is picked up as soon as it is built.
+        """
+        if self.difficulty:
+            words = self.word_cache.get_or_load(
+                (self.source, self.min_word_length, self.difficulty), self._tier_words)
+            if words is not None:
+                return words
+        return self.word_cache.get_or_load(
+            (self.source, self.min_word_length, None),
+            lambda: self._contact_local_dicitionary()['words'])
 
     def _eavesdrop(self):
         """This method will convert speech recorded from a user's voice to text and return a response object.
@@ -316,27 +403,34 @@ class Mode(Game):
         response['error'] : str or None
             None if successful, a string error message otherwise.
         """
-        r = sr.Recognizer()
-        mic = sr.Microphone()
-        with mic as source:
-            # r.adjust_for_ambient_noise(source, 0.5)
-            audio = r.listen(source)
+        session = self._speech_session()
+        speech_service.wait()  # <-- let the prompt finish before recording
+        try:
+            transcript = session.transcribe(session.capture())
+        except AudioUnavailable:
+            transcript = {'text': None, 'successful': False, 'error': "I cannot reach a microphone without the SpeechRecognition package"}
         response = {
             'words': None,
-            'successful': True,
-            'error': None,
+            'successful': transcript['successful'],
+            'error': transcript['error'],
         }
-        try:  # <-- recognize speech w/ Google Speech Recognition
-            raw_word_list = r.recognize_google(audio).lower().split(" ")
+        if transcript['successful']:
+            raw_word_list = transcript['text'].split(" ")
             response['words'] = list(filter(lambda word: len(word) >= self.min_word_length, raw_word_list))
-        except sr.UnknownValueError:
-            response['successful'] = False
-            response['error'] = "I cannot recognize your speech"
-        except sr.RequestError:
-            response['successful'] = False
-            response['error'] = "I cannot contact the API"
         return response
 
+    @property
+    def _speaks(self):
+        """Indicates whether the game is played by voice: the word source is speech, and speech recognition is installed."""
+        return self.source == "speech" and available("speech_recognition")
+
+    def _speech_session(self):
+        """Returns the speech session owned by this game, creating it on first use."""
+        if self._session is None:
+            from .speech_pipeline import SpeechSession  # <-- asyncio and the audio stack load only for speech mode
+            self._session = SpeechSession()
+        return self._session
+
     def _get_from_speech(self):
         """Returns a list of words if call to `eavesdrop` was successful, None otherwise."""
         while True:
@@ -353,37 +447,27 @@ class Mode(Game):
                 self.speak(f"{response['error']}. Please return to the main menu and select a different game mode.")
                 return None
 
+    @traced()
     def get_word(self):
         """Randomly selects a word from a source specified by the game mode, or a list of default words."""
-        DEFAULT_WORDS = [
-            "resurrection", "osphresiology", "establishment","ridiculous","collection", "querimonious", "experimentation", "zealotry",
-            "international", "vastation", "gemelliparous", "kyriolexy",
-            "totalitarianism", "kaleidophone", "nephralgia",
-            "juxtaposition", "decalescence", "calorifacient",
-            "loquacious", "uniphonous", "abscissa",
-            "differentiation", "kettlestitch", "halitosis",
-            "logarithmic", "ultracrepidate", "biloquist",
-            "quadrennium", "gawdelpus", "acritochromacy",
-            "ethereal", "jactitation", "delaminate",
-            "zwitterion", "oppignorate", "whippletree",
-            "xenobiotic", "otorhinolaryngology", "eldritch",
-            "transient", "oligarchy", "naturalism",
-            "inconsequential", "grandisonant",
-            "reverberate","capricious", "hematology",
-            "whimsical", "xylography", "balatron",
-            "disenfranchise", "neomorphic", "wrackful",]
-        if self.source == "dictionary":
-            words = self._get_from_dictionary()
-        elif self.source == "speech":
-            words = self._get_from_speech()
-        if not self.source or (not words and self.source):
-            words = DEFAULT_WORDS
-        self._word = random.choice(words).lower()
-        for char in self._word:
-            self._chars.add(char)
+        source = WordSource.for_mode(self)
+        word = source.choose(self.min_word_length) if source else None
+        self._word = (word or random.choice(self.DEFAULT_WORDS)).lower()
+        self._index_word()
+        self._communicate(self._speaks, self.speak, print, f"The mystery word contains {len(self._word)} letters.")
+
+    def _index_word(self):
+        """Builds the letter-to-positions index and the placeholders for the target word."""
+        positions = {}
+        for idx, char in enumerate(self._word):
+            positions[char] = positions.get(char, 0) | (1 << idx)
+        self._positions = positions
+        self._chars = set(positions)
         self._blanks = ["_" for _ in self._word]
-        self._communicate(self.source == "speech", self.speak, print, f"The mystery word contains {len(self._word)} letters.")
+        self._unrevealed = (1 << len(self._word)) - 1
+        self._revealed = 0
 
+    @traced()
     def _grade_guess(self, guess_obj):
         """Validates whether or not a user's guess equal to the target word or a letter contained within it.
 
@@ -397,19 +481,25 @@ class Mode(Game):
         bool
             True if successful, False otherwise.
         """
-        guess_obj.attempts.append(guess_obj.value)
-        if len(guess_obj.value) == 1 and guess_obj._is_in_word(self._word):
-            guess_obj.hits.append(guess_obj.value)
+        if len(guess_obj.value) == 1 and guess_obj.value in self._positions:
+            guess_obj._record(True)
+            self._reveal(self._positions[guess_obj.value])
             return True
         elif len(guess_obj.value) == len(self._word) and guess_obj._is_word(self._word):
-            guess_obj.hits.clear()
-            guess_obj.hits.extend([char for char in guess_obj.value])
+            guess_obj._record(True)
+            self._reveal(self._unrevealed)
             return True
         else:
-            guess_obj.misses.append(guess_obj.value)
+            guess_obj._record(False)
+            self._revealed = 0
             return False
+
+    def _reveal(self, mask):
+        """Marks the positions in the bitmask `mask` as revealed, recording which of them are new."""
+        self._revealed = mask & self._unrevealed
+        self._unrevealed &= ~mask
         
-    def _update_user(self, is_correct, is_speaking):
+    def _update_user(self, is_correct, is_speaking, speak=None):
         """Communicates whether or not a user's guess was successful, and displays an updated game board to reflect the most recent attempt.
 
         Parameters
@@ -418,27 +508,44 @@ class Mode(Game):
             Indicates whether or not the user's current guess is correct.
         is_speaking : bool
             Indicates whether or not the game speaks to the user.
+        speak : func, optional
+            The callback that speaks to the user, e.g. the speak stage of a 'SpeechPipeline'. Defaults to `speak`.
 
         Returns
         -------
         None
         """
+        speak = speak or self.speak
         if is_correct:
-            self._communicate(is_speaking, self.speak, print, self._praise())
+            self._communicate(is_speaking, speak, print, self._praise())
         else:
-            self._communicate(is_speaking, self.speak, print, self._taunt())
+            self._communicate(is_speaking, speak, print, self._taunt())
 
+    @traced()
     def play(self):
         """A method that initializes an untimed game instance. Returns a 'Guess' object."""
         start_time = time.time()
-        g = Guess()
-        does_game_speak = self.source == "speech"
+        if self.active_game.is_set():  # <-- never share a running game's event
+            self.active_game = threading.Event()
+        does_game_speak = self._speaks
+        if does_game_speak:
+            session = self._speech_session()
+            from .speech_pipeline import SpeechPipeline
+            with SpeechPipeline(capture=session, backend=session) as pipeline:
+                return self._play(start_time, does_game_speak, Guess(pipeline=pipeline, session=session))
+        return self._play(start_time, does_game_speak, Guess())
+
+    def _play(self, start_time, does_game_speak, g):
+        """Runs the game loop for `play` with a prepared 'Guess' object. Returns the 'Guess' object."""
+        with BoardRenderer() as renderer:
+            return self._play_turns(start_time, does_game_speak, g, renderer)
+
+    def _play_turns(self, start_time, does_game_speak, g, renderer):
+        """Runs the turns of `_play`, drawing the board with `renderer`. Returns the 'Guess' object."""
         win_clause = False
         loss_clause = False
-        for _ in range(2):
-            print()
         g.show_board(
-            g._hit_string(self._word, self._blanks), g.miss_string())
+            g._hit_string(self._word, self._blanks, self._revealed), g.miss_string(), renderer)
         self.active_game.set()
         while self.active_game.is_set() and not (win_clause or loss_clause):
             # Obtain and evaluate input from user
@@ -453,15 +560,13 @@ class Mode(Game):
             if self.active_game.is_set():
                 print()
                 is_correct = self._grade_guess(g)
-                self._update_user(is_correct, does_game_speak)
-                for _ in range(2):
-                    print()
+                self._update_user(is_correct, does_game_speak, g.pipeline.speak if g.pipeline is not None else None)
                 g.show_board(
-                    g._hit_string(self._word, self._blanks), g.miss_string())
+                    g._hit_string(self._word, self._blanks, self._revealed), g.miss_string(), renderer)
 
             # Conditions to end game
-            win_clause = len(set(g.hits)) == len(set([char for char in self._word]))
-            loss_clause = len(g.misses) == self.max_errors
+            win_clause = self._unrevealed == 0
+            loss_clause = g.miss_count == self.max_errors
             if win_clause:
                 self.is_victorious = True
                 break
@@ -475,15 +580,13 @@ class Mode(Game):
 
     def timed_play(self):
         """A method that initializes an timed game instance. Returns a 'Guess' object."""
-        does_game_speak = self.source == "speech"
+        does_game_speak = self._speaks
         announce=f"You will have {self._time_label(self.time_limit)} to complete the game.\nGood luck.\n"
         t = self._create_timer()
         self._communicate(does_game_speak, self.speak, print, announce)
         t.start()
         guess_obj = self.play()
-        if self.duration < self.time_limit:
-            t.cancel()
-        else:
+        if not t.cancel() or self.duration >= self.time_limit:  # <-- the timer fired: the game ran out of time
             self.duration = self.time_limit
         return guess_obj
 
@@ -506,7 +609,7 @@ class Mode(Game):
             duration=f"Game Duration: {self._time_label(self.duration)}",
         )
         print()
-        does_game_speak = self.source == "speech"
+        does_game_speak = self._speaks
         self._communicate(does_game_speak, self.speak, print, announce['word'])
         if self.is_victorious:
             self._communicate(does_game_speak, self.speak, print, announce['win'])
@@ -514,6 +617,8 @@ class Mode(Game):
             self._communicate(does_game_speak, self.speak, print, announce['lose'])
         self._communicate(does_game_speak, self.speak, print, announce['duration'])
         self._save_results(Outcome(self, guess_obj))
+        if self._session is not None:
+            self._session.close()
 
 # `Mode` instances
 standard = Mode(
@@ -547,12 +652,27 @@ class Guess():
         A list of all distinct letters contained within the target word that are guessed correctly by the user.
     misses : list
         A list of all distinct letters guessed by the user that are not contained within the target word. The list may also include whole words that are equal in length to the target word.
+    pipeline : SpeechPipeline or None
+        The asynchronous capture/recognition pipeline used for spoken guesses, if any.
+    session : SpeechSession or None
+        The open speech session of the game, if any.
+    typed : bool
+        Indicates whether a speech game has fallen back to typed guesses because its pipeline crashed.
 
     Class Variables
     ---------------
     BODY : tuple
         The components of the 'Hangman' graphic displayed to a user.
+    FRAMES : tuple
+        The static text of the board rows for each entry of `BODY`, precomputed once.
+    PROMPTS : tuple
+        The spoken prompts for a guess: the standard prompt, and the phonetic-alphabet alternative.
+
+    Guesses are stored compactly as an ordered attempt log plus 26-bit masks of the correct and incorrect letters, so duplicate checks are O(1). `attempts`, `hits` and `misses` are list views derived from them.
     """
+    __slots__ = (
+        "value", "pipeline", "session", "typed",
+        "_log", "_hit_mask", "_miss_mask", "_others", "_miss_count", "_solved")
     BODY = (
     [r'     ',r'     ',r'     ',r'     ',r'     '],
     [r'  O  ',r'     ',r'     ',r'     ',r'     '],
@@ -561,26 +681,101 @@ class Guess():
     [r'\ O /',r' \|/ ',r'  |  ',r'     ',r'     '],
     [r'\ O /',r' \|/ ',r'  |  ',r' /   ',r'/    '],
     [r'\ O /',r' \|/ ',r'  |  ',r' / \ ','/   \\'])
+    FRAMES = gallows_frames(BODY)
+    PROMPTS = (
+        "Say a single letter in the target word, or say the entire word itself.",
+        "It would seem that I may have difficulty understanding you clearly. As an alternative, please state a word from the phonetic alphabet and I will extract the first letter of the word I hear as your guess.")
 
-    def __init__(self, value:str=""):
+    def __init__(self, value:str="", pipeline=None, session=None):
         """Constructor method for the 'Guess' class.
 
         Parameters
         ----------
-        The user's current guess.
+        value : str
+            The user's current guess.
+        pipeline : SpeechPipeline, optional
+            The asynchronous capture/recognition pipeline used for spoken guesses.
+        session : SpeechSession, optional
+            The open speech session of the game, reused by `listen`.
         """
         self.value = value
-        self.attempts = []
-        self.hits = []
-        self.misses = []
+        self.pipeline = pipeline
+        self.session = session
+        self.typed = False
+        self._log = []
+        self._hit_mask = 0
+        self._miss_mask = 0
+        self._others = None
+        self._miss_count = 0
+        self._solved = False
 
     def __str__(self):
         return self.value
 
     def __repr__(self):
-        param_str = ", ".join(f"{k}='{v}'" for k,v in vars(self).items())
+        params = dict(value=self.value, attempts=self.attempts, hits=self.hits, misses=self.misses)
+        param_str = ", ".join(f"{k}='{v}'" for k,v in params.items())
         return f"{self.__class__.__name__}({param_str})"
 
+    @property
+    def attempts(self):
+        """A list of all unique guesses, in the order they were made."""
+        return list(self._log)
+
+    @property
+    def hits(self):
+        """A list of the correctly guessed letters, or every letter of the target word once it is solved."""
+        if self._solved:
+            return list(self._log[-1])
+        return [value for value in self._log if self._status(value)]
+
+    @property
+    def misses(self):
+        """A list of the incorrect guesses, in the order they were made."""
+        return [value for value in self._log if self._status(value) is False]
+
+    @property
+    def miss_count(self):
+        """The number of incorrect guesses."""
+        return self._miss_count
+
+    def _status(self, value):
+        """Returns True if `value` was a correct guess, False if it was incorrect, or None if it was never guessed."""
+        bit = LETTER_BITS.get(value)
+        if bit is None:
+            return self._others.get(value) if self._others else None
+        if self._hit_mask & bit:
+            return True
+        return False if self._miss_mask & bit else None
+
+    def _record(self, is_hit:bool):
+        """Logs the current guess as a correct or an incorrect attempt."""
+        value = self.value
+        self._log.append(value)
+        bit = LETTER_BITS.get(value)
+        if bit is None:  # <-- whole words and non-ASCII letters
+            if self._others is None:
+                self._others = {}
+            self._others[value] = is_hit
+            self._solved = is_hit and len(value) > 1
+        elif is_hit:
+            self._hit_mask |= bit
+        else:
+            self._miss_mask |= bit
+        if not is_hit:
+            self._miss_count += 1
+
+    def snapshot(self):
+        """Returns a detached copy of the guess history, without any speech resources."""
+        copy_obj = Guess(self.value)
+        copy_obj._log = list(self._log)
+        copy_obj._hit_mask = self._hit_mask
+        copy_obj._miss_mask = self._miss_mask
+        copy_obj._others = dict(self._others) if self._others else None
+        copy_obj._miss_count = self._miss_count
+        copy_obj._solved = self._solved
+        return copy_obj
+
     def _is_valid(self, target):
         """Validates whether or not the user's guess is a single letter or a word of equal length to the target word.
         
@@ -599,17 +794,18 @@ class Guess():
     @property
     def _is_unique(self):
         """Indicates whether or not the user's guess is unique."""
-        if self.value in self.misses or self.value in self.hits:
+        if self._status(self.value) is not None:
             print("You already used this guess.")
-        return not(self.value in self.misses or self.value in self.hits)
+            return False
+        return True
 
     @staticmethod
+    @traced()
     def _speak(text):
-        """A method that converts text to speech using the pyttsx3 library."""
-        engine = pyttsx3.init()
-        engine.say(text)
-        engine.runAndWait()
+        """A method that queues text to be spoken by the shared speech service without blocking gameplay."""
+        speech_service.say(text)
 
+    @traced()
     def listen(self, *args):
         """This method will convert speech from a user's voice to text and return a single letter, or a word if the response is equal to the target word.
 
@@ -621,23 +817,50 @@ class Guess():
             A string response of the user's current guess.
         """
         target = args[0] if args else None
-        r = sr.Recognizer()
-        mic = sr.Microphone()
-        with mic as source:
-            # r.adjust_for_ambient_noise(source, 0.5)
-            audio = r.listen(source)
-        response = None
-        try:  # <-- recognize speech w/ Google Speech Recognition
-            response = r.recognize_google(audio).lower().split(" ")[0]
-        except sr.UnknownValueError:
-            self._speak("I cannot recognize your speech.")
-            return response
-        except sr.RequestError:
-            self._speak("I cannot contact the API.")
-            return response
-        else:
-            return response if response == target else response[0]
-
+        if self.pipeline is not None:
+            return self._listen_from_pipeline(target)
+        session = self.session
+        if session is None:
+            from .speech_pipeline import SpeechSession
+            session = SpeechSession()
+        speech_service.wait()  # <-- let the prompt finish before recording
+        try:
+            transcript = session.transcribe(session.capture())
+        finally:
+            if self.session is None:
+                session.close()
+        if not transcript['successful']:
+            self._speak(f"{transcript['error']}.")
+            return None
+        response = transcript['text'].split(" ")[0]
+        if not response:
+            return None
+        return response if response == target else response[0]
+
+    def _listen_from_pipeline(self, target):
+        """Returns the next guess recognized by the speech pipeline, or None if it was not understood.
+
+        If a stage of the pipeline has crashed, the rest of the game is played with typed guesses.
+        """
+        from .speech_pipeline import PipelineError  # <-- already imported by the running pipeline
+        try:
+            response = self.pipeline.next_response()
+        except TimeoutError:
+            response = {'text': None, 'successful': False, 'error': "I did not hear anything"}
+        except PipelineError as exc:
+            print(f"Speech recognition stopped working ({exc.__cause__ or exc}). Please type your guesses instead.")
+            self.pipeline = None
+            self.typed = True
+            return self._get_guess(target)
+        if not response['successful']:
+            self.pipeline.speak(f"{response['error']}.")
+            return None
+        response = response['text'].split(" ")[0]
+        if not response:
+            return None
+        return response if response == target else response[0]
+
+    @traced()
     def _get_guess(self, target):
         """Prompts a user to input a guess of the target word.
         
@@ -653,10 +876,11 @@ class Guess():
         """
         base_prompt = "Enter a single letter in the target word, or enter the entire word itself: "
         while True:
-            self.value = input(base_prompt).lower()
+            self.value = read_input(base_prompt).lower()
             if self._is_valid(target):
                 return self.value.lower()
 
+    @traced()
     def _ask_guess(self, target):
         """Prompts a user to say a guess of the target word.
         
@@ -670,11 +894,13 @@ class Guess():
         str
             The user's current guess.
         """
-        base_prompt = "Say a single letter in the target word, or say the entire word itself."
-        alt_prompt = "It would seem that I may have difficulty understanding you clearly. As an alternative, please state a word from the phonetic alphabet and I will extract the first letter of the word I hear as your guess."
+        if self.typed:
+            return self._get_guess(target)
+        base_prompt, alt_prompt = self.PROMPTS
         err_count = 0
+        speak = self.pipeline.prompt if self.pipeline is not None else self._speak
         while True:
-            self._speak(base_prompt if err_count == 0 else alt_prompt)
+            speak(base_prompt if err_count == 0 else alt_prompt)
             self.value = self.listen(target)
             if self.value == None:
                 err_count += 1
@@ -682,26 +908,11 @@ class Guess():
             else:
                 return self.value.lower()
 
-    def _is_in_word(self, word):
-        """A method that indicates whether or not the guess is in the target word.
-        
-        Parameters
-        ----------
-        target : str
-            The target word for a game instance.
-
-        Returns
-        -------
-        bool
-            True if successful, False otherwise.
-        """
-        return word.find(self.value) != -1
-
     def _is_word(self, word):
         """Returns a bool that indictates if the guess is the target word."""
         return self.value == word
 
-    def _hit_string(self, target, placeholder):
+    def _hit_string(self, target, placeholder, revealed=None):
         """A string display of placeholder text that is updated with correct guesses.
         
         Parameters
@@ -710,12 +921,21 @@ class Guess():
             The target word for a game instance.
         placeholder : list
             A list equal in length to the number of characters in the target word.
+        revealed : int, optional
+            A bitmask of the positions revealed by the current guess. If given, only those positions are updated; otherwise the whole target word is scanned.
 
         Returns
         -------
         str
             Displays all correctly guessed letters in their corresponding location in the placeholder text.
         """
+        if revealed is not None:
+            while revealed:
+                low_bit = revealed & -revealed
+                idx = low_bit.bit_length() - 1
+                placeholder[idx] = target[idx].upper()
+                revealed ^= low_bit
+            return " ".join(placeholder)
         for idx in range(len(target)):
             if len(self.value) == 1 and self.value == target[idx]:
                 placeholder[idx] = self.value.upper()
@@ -727,24 +947,24 @@ class Guess():
         """Returns a string of all incorrect guesses."""
         return ", ".join(self.misses).upper()
 
-    def show_board(self, h_string, m_string):
-        """Displays an updated gameboard with all attempted guesses."""
-        err = len(self.misses)
-        placeholder = [
-            f"{'_'*5}[]".rjust(11),
-            f"{'I'.center(9)}{'||'.ljust(6)}Word:   {h_string}",
-            f"{'I'.center(9)}{'||'.ljust(6)}",
-            f"{self.BODY[err][0].center(9)}{'||'.ljust(6)}",
-            f"{self.BODY[err][1].center(9)}{'||'.ljust(6)}Guess:  {self.value.upper()}",
-            f"{self.BODY[err][2].center(9)}{'||'.ljust(6)}",
-            f"{self.BODY[err][3].center(9)}{'||'.ljust(6)}",
-            f"{self.BODY[err][4].center(9)}{'||'.ljust(6)}Misses: {m_string}",
-            f"{' '*9}{'||'.ljust(6)}",
-            f"{' '*9}{'||'.ljust(6)}",
-            f"[{'='*8}[]",
-        ]
-        for i in placeholder:
-            print(i)
+    @traced()
+    def show_board(self, h_string, m_string, renderer=None):
+        """Displays an updated gameboard with all attempted guesses.
+
+        Parameters
+        ----------
+        h_string : str
+            The placeholder text of the target word (see `_hit_string`).
+        m_string : str
+            The incorrect guesses (see `miss_string`).
+        renderer : BoardRenderer, optional
+            The renderer that redraws only the changed cells of the board. If omitted, the whole board is printed.
+        """
+        frame = self.FRAMES[self._miss_count]
+        if renderer is not None:
+            renderer.render(frame, h_string, self.value.upper(), m_string)
+        else:
+            print("\n".join(board_lines(frame, h_string, self.value.upper(), m_string)))
 
 
 class Outcome():
@@ -760,6 +980,8 @@ class Outcome():
         The string identifier for the game mode.
     target_word : str
         The target word for the game instance.
+    duration : float
+        The duration of the game instance measured in seconds.
     tries : int
         The total number of unique guesses made by a user during the game instance.
     attempts : list
@@ -783,22 +1005,36 @@ class Outcome():
         self.is_victorious = mode_obj.is_victorious
         self.game_mode = mode_obj.name
         self.target_word = mode_obj._word
-        self.attempts = guess_obj.attempts
-        self.tries = len(self.attempts)
-        self.hits = guess_obj.hits
-        self.misses = guess_obj.misses
-
-        if not self.game_mode in Game.victories.keys():
-            Game.victories[self.game_mode] = []
-        Game.victories[self.game_mode].append(self.is_victorious)
+        self.duration = mode_obj.duration
+        self.tries = len(guess_obj._log)
+        self._guess = guess_obj.snapshot()
 
     def __str__(self):
         return f"{self.timestamp.strftime('%Y-%m-%d %H:%M:%S')} | Victorious?: {str(self.is_victorious).ljust(5)} | Game Mode: {str(self.game_mode).title()}"
 
     def __repr__(self):
-        param_str = ", ".join(f"{k}='{v}'" for k,v in vars(self).items())
+        params = {k:v for k,v in vars(self).items() if not k.startswith("_")}
+        params.update(attempts=self.attempts, hits=self.hits, misses=self.misses)
+        param_str = ", ".join(f"{k}='{v}'" for k,v in params.items())
         return f"{self.__class__.__name__}({param_str})"
 
+    @property
+    def attempts(self):
+        """A list of all unique guesses made during the game instance."""
+        return self._guess.attempts
+
+    @property
+    def hits(self):
+        """A list of the letters guessed correctly during the game instance."""
+        return self._guess.hits
+
+    @property
+    def misses(self):
+        """A list of the incorrect guesses made during the game instance."""
+        return self._guess.misses
+
+
+speech_service.register_phrases(Game.PRAISE + Game.TAUNT + Guess.PROMPTS)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,291 @@
+import os
+import sys
+import time
+import queue
+import atexit
+import sqlite3
+import threading
+import traceback
+
+
+#========================================
+# STORE CONFIGURATION
+#========================================
+
+DATA_DIR = os.environ.get(
+    "HANGMAN_DATA_DIR", os.path.join(os.path.expanduser("~"), ".local", "share", "hangman"))
+HISTORY_PATH = os.environ.get("HANGMAN_HISTORY", os.path.join(DATA_DIR, "history.db"))
+
+FSYNC_POLICIES = {  # <-- policy: SQLite `synchronous` setting
+    'full': "FULL",        # fsync on every committed batch
+    'normal': "NORMAL",    # fsync at WAL checkpoints only
+    'off': "OFF",          # leave flushing to the operating system
+}
+COLUMNS = ("timestamp", "is_victorious", "game_mode", "target_word", "tries", "duration", "attempts", "hits", "misses")
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outcomes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    is_victorious INTEGER NOT NULL,
+    game_mode TEXT,
+    target_word TEXT NOT NULL,
+    tries INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    attempts TEXT NOT NULL,
+    hits TEXT NOT NULL,
+    misses TEXT NOT NULL
+)"""
+
+
+#========================================
+# HISTORY STORE
+#========================================
+
+class HistoryStoreError(Exception):
+    """Raised by a blocking store operation when the writer thread failed to write or maintain the database."""
+
+
+class _Request(threading.Event):
+    """A queued command that a caller waits on. The writer sets it when it is done, with `error` set if it failed."""
+    error = None
+
+class HistoryStore:
+    """A durable, append-only store of game outcomes backed by SQLite in WAL mode.
+
+    Outcomes are queued and written in batches by a background writer thread, so recording a result never waits on disk I/O.
+
+    Attributes
+    ----------
+    path : str
+        The path to the SQLite database. An empty string disables persistence.
+    fsync : str, default = "normal"
+        The durability policy: "full", "normal", or "off" (see `FSYNC_POLICIES`).
+    batch_size : int, default = 64
+        The maximum number of outcomes written per transaction.
+    flush_interval : float, default = 0.25
+        The maximum number of seconds an outcome waits in the queue before its batch is written.
+
+    Methods
+    -------
+    record(outcome_obj)
+        Queues an 'Outcome' to be written.
+    flush()
+        Blocks until every queued outcome has been written.
+    load(limit, game_mode)
+        Returns the most recent persisted outcome records.
+    compact(keep)
+        Deletes all but the newest `keep` outcomes and reclaims disk space.
+    close()
+        Flushes the queue and stops the writer thread.
+    """
+    def __init__(self, path=HISTORY_PATH, fsync="normal", batch_size:int=64, flush_interval:float=0.25):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy `{fsync}`. Expected one of: {', '.join(FSYNC_POLICIES)}")
+        self.path = path
+        self.fsync = fsync
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._thread = None
+        self._failure = None    # <-- an error that no waiting caller has been told about yet
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(path='{self.path}', fsync='{self.fsync}')"
+
+    @property
+    def enabled(self):
+        """Indicates whether outcomes are persisted."""
+        return bool(self.path)
+
+    def _connect(self):
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={FSYNC_POLICIES[self.fsync]}")
+        conn.execute(SCHEMA)
+        conn.commit()
+        return conn
+
+    def _put(self, item):
+        """Queues an item for the writer thread, starting the thread if it is not running."""
+        with self._lock:  # <-- the writer only exits while holding the lock and with an empty queue, so no item is left behind
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="history-writer", daemon=True)
+                self._thread.start()
+            self._queue.put(item)
+
+    def _fail(self, exc, context):
+        """Reports a writer error, and keeps it for the next caller that waits on the writer."""
+        print(f"History store: {context} `{self.path}` failed: {exc!r}", file=sys.stderr)
+        traceback.print_exc()
+        self._failure = exc
+
+    def _finish(self, items):
+        """Marks a batch of queued items as done, passing any writer error to the callers waiting on them."""
+        for command, payload in items:
+            if command != "row":
+                payload[-1].error = self._failure
+                payload[-1].set()
+            self._queue.task_done()
+        if any(command != "row" for command, _ in items):
+            self._failure = None
+
+    def _run(self):
+        """The writer loop: groups queued rows into batches and runs queued maintenance commands.
+
+        Errors never kill the loop silently: they are printed, and raised by the next `flush`, `compact` or `load`. If the database cannot be opened, the queue is drained and the thread exits; the next queued item starts a new writer. After a stop command, the writer keeps writing until the queue is empty, so items queued while it stops are not left behind.
+        """
+        try:
+            conn = self._connect()
+        except Exception as exc:
+            self._fail(exc, "opening")
+            with self._lock:
+                items = []
+                while not self._queue.empty():
+                    items.append(self._queue.get_nowait())
+                self._finish(items)
+                self._thread = None
+            return
+        stopping = False
+        while True:
+            if stopping:
+                with self._lock:  # <-- exit only with an empty queue, under the lock, so `_put` starts a new writer for later items
+                    if self._queue.empty():
+                        self._thread = None
+                        break
+            items = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while items[-1][0] == "row" and len(items) < self.batch_size:
+                try:
+                    items.append(self._queue.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+            rows = [payload for command, payload in items if command == "row"]
+            try:
+                if rows:
+                    with conn:  # <-- one transaction per batch
+                        conn.executemany(
+                            f"INSERT INTO outcomes ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})", rows)
+                for command, payload in items:
+                    if command == "compact":
+                        self._compact(conn, payload[0])
+            except Exception as exc:
+                self._fail(exc, f"writing {len(rows)} outcomes to" if rows else "compacting")
+            self._finish(items)
+            stopping = stopping or any(command == "stop" for command, _ in items)
+        conn.close()
+
+    def _compact(self, conn, keep):
+        with conn:
+            conn.execute(
+                "DELETE FROM outcomes WHERE id NOT IN (SELECT id FROM outcomes ORDER BY id DESC LIMIT ?)", (keep,))
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+
+    def _send(self, command, *args):
+        """Queues a command for the writer. Returns a '_Request' that is set once it has run (immediately if the store is disabled)."""
+        done = _Request()
+        if not self.enabled:
+            done.set()
+            return done
+        self._put((command, (*args, done)))
+        return done
+
+    @staticmethod
+    def _wait(done):
+        done.wait()
+        if done.error is not None:
+            raise HistoryStoreError(f"The history writer failed: {done.error}") from done.error
+
+    @staticmethod
+    def to_row(outcome_obj):
+        """Returns the database row for an 'Outcome' object."""
+        return (
+            outcome_obj.timestamp.isoformat(),
+            int(outcome_obj.is_victorious),
+            outcome_obj.game_mode,
+            outcome_obj.target_word,
+            outcome_obj.tries,
+            float(outcome_obj.duration),
+            ",".join(outcome_obj.attempts),
+            ",".join(outcome_obj.hits),
+            ",".join(outcome_obj.misses),
+        )
+
+    def record(self, outcome_obj):
+        """Queues an 'Outcome' to be written without blocking."""
+        if self.enabled:
+            self._put(("row", self.to_row(outcome_obj)))
+
+    def flush(self):
+        """Blocks until every queued outcome has been written.
+
+        Raises
+        ------
+        HistoryStoreError
+            If the writer failed since the last blocking call.
+        """
+        self._wait(self._send("flush"))
+
+    def compact(self, keep:int=10000):
+        """Deletes all but the newest `keep` outcomes and reclaims disk space. Blocks until it finishes."""
+        self._wait(self._send("compact", keep))
+
+    def load(self, limit=None, game_mode=None):
+        """Returns the most recent persisted outcomes, oldest first.
+
+        Parameters
+        ----------
+        limit : int, optional
+            The maximum number of outcomes to return.
+        game_mode : str, optional
+            Only return outcomes for this game mode.
+
+        Returns
+        -------
+        list
+            A list of dictionaries keyed by `COLUMNS`.
+        """
+        self.flush()
+        if not self.enabled or not os.path.isfile(self.path):
+            return []
+        where, params = ("WHERE game_mode = ?", [game_mode]) if game_mode else ("", [])
+        query = f"SELECT {', '.join(COLUMNS)} FROM outcomes {where} ORDER BY id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        conn = self._connect()
+        try:
+            rows = conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
+        records = [dict(zip(COLUMNS, row)) for row in reversed(rows)]
+        for record in records:
+            record['is_victorious'] = bool(record['is_victorious'])
+            for key in ("attempts", "hits", "misses"):
+                record[key] = record[key].split(",") if record[key] else []
+        return records
+
+    def close(self):
+        """Writes every queued outcome and stops the writer thread."""
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._send("stop").wait()  # <-- errors were already printed by the writer
+            thread.join()
+
+
+# Process-wide store used by 'Game'
+history_store = HistoryStore()
+
+
+
+if __name__ == '__main__':
+    # Usage: python -m hangman_pkg.history_store [compact [KEEP]]
+    args = sys.argv[1:]
+    if args and args[0] == "compact":
+        history_store.compact(int(args[1]) if len(args) > 1 else 10000)
+    for record in history_store.load(limit=20):
+        print(f"{record['timestamp'][:19].replace('T', ' ')} | Victorious?: {str(record['is_victorious']).ljust(5)} | Game Mode: {str(record['game_mode']).title()}")
@@ -0,0 +1,199 @@
+import random
+import string
+import threading
+import contextlib
+
+
+#========================================
+# INPUT PROVIDERS
+#========================================
+
+class ScriptExhausted(EOFError):
+    """Raised by a scripted provider when it has no more input to give."""
+
+
+class InputProvider:
+    """The base class for a source of user input. Every prompt of the CLI reads through the current provider (see `read_input`).
+
+    Subclasses that set `name` are registered automatically.
+
+    Class Variables
+    ---------------
+    name : str or None
+        The identifier of the provider. Providers without a name are not registered.
+    providers : dict
+        A registry of every named 'InputProvider' subclass.
+
+    Attributes
+    ----------
+    lines : list or None
+        Every line given so far, if the provider records its input. None otherwise.
+
+    Methods
+    -------
+    read(prompt, choices)
+        Returns the next line of input for a prompt.
+    save(path)
+        Writes the recorded lines as a replay script.
+    """
+    name = None
+    providers = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.name:
+            InputProvider.providers[cls.name] = cls
+
+    def __init__(self, record:bool=False):
+        self.lines = [] if record else None
+
+    def __repr__(self):
+        param_str = ", ".join(f"{k}='{v}'" for k,v in vars(self).items() if k != "lines")
+        return f"{self.__class__.__name__}({param_str})"
+
+    def _read(self, prompt, choices):
+        raise NotImplementedError
+
+    def read(self, prompt:str="", choices=None):
+        """Returns the next line of input.
+
+        Parameters
+        ----------
+        prompt : str
+            The message shown to the user.
+        choices : list, optional
+            The options offered by a menu prompt. Providers that generate input may use them; the others ignore them.
+
+        Returns
+        -------
+        str
+            The line of input, without its line break.
+
+        Raises
+        ------
+        EOFError
+            If there is no more input.
+        """
+        line = self._read(prompt, choices)
+        if self.lines is not None:
+            self.lines.append(line)
+        return line
+
+    def save(self, path):
+        """Writes the recorded lines to a replay script (see 'ReplayInput')."""
+        with open(path, "w") as f:
+            f.writelines(f"{line}\n" for line in self.lines or ())
+
+
+class ConsoleInput(InputProvider):
+    """Reads input typed at the console, echoing the prompt like `input()`."""
+    name = "console"
+
+    def _read(self, prompt, choices):
+        return input(prompt)
+
+
+class ReplayInput(InputProvider):
+    """Replays the lines of a recorded keystroke script, one line per prompt.
+
+    Attributes
+    ----------
+    script : list
+        The lines to replay.
+    position : int
+        The number of lines replayed so far.
+    echo : bool, default = False
+        Indicates whether each prompt and its replayed line are printed, as they would appear on the console.
+    """
+    name = "replay"
+
+    def __init__(self, script, echo:bool=False, record:bool=False):
+        super().__init__(record)
+        self.script = list(script)
+        self.position = 0
+        self.echo = echo
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        """Returns a provider that replays a script file. Lines beginning with `#` are comments; blank lines are replayed as empty input."""
+        with open(path) as f:
+            script = [line.rstrip("\n") for line in f if not line.startswith("#")]
+        return cls(script, **kwargs)
+
+    def _read(self, prompt, choices):
+        if self.position == len(self.script):
+            raise ScriptExhausted(f"The replay script ended after {self.position} lines")
+        line = self.script[self.position]
+        self.position += 1
+        if self.echo:
+            print(f"{prompt}{line}")
+        return line
+
+
+class FuzzInput(InputProvider):
+    """Generates a random session: menu choices, guesses, and a share of invalid input.
+
+    Menu prompts are answered from the options offered, skipping game modes that are played by voice (they need a microphone). Every other prompt is answered with a random letter, and sometimes with junk that the CLI must reject. The generated lines are recorded, so a failing session can be saved and replayed.
+
+    Attributes
+    ----------
+    seed : int
+        The seed of the session's random number generator.
+    max_inputs : int, default = 500
+        The number of lines given before the provider reports the end of input.
+    junk_rate : float, default = 0.05
+        The share of prompts answered with invalid input.
+    """
+    name = "fuzz"
+    JUNK = ("", " ", "0", "-1", "99", "abc", "?", "1.5", "!")
+
+    def __init__(self, seed:int=0, max_inputs:int=500, junk_rate:float=0.05, record:bool=True):
+        super().__init__(record)
+        self.seed = seed
+        self.max_inputs = max_inputs
+        self.junk_rate = junk_rate
+        self._rng = random.Random(seed)
+        self._count = 0
+
+    def _read(self, prompt, choices):
+        if self._count == self.max_inputs:
+            raise ScriptExhausted(f"The fuzz session ended after {self._count} lines")
+        self._count += 1
+        rng = self._rng
+        if rng.random() < self.junk_rate:
+            return rng.choice(self.JUNK)
+        if choices is not None:
+            options = [idx for idx, obj in enumerate(choices, 1) if not getattr(obj, "_speaks", False)]
+            return str(rng.choice(options))
+        return rng.choice(string.ascii_lowercase)
+
+
+#========================================
+# CURRENT PROVIDER
+#========================================
+
+_local = threading.local()  # <-- the provider of each thread, so concurrent drivers do not share input
+console = ConsoleInput()
+
+def get_provider():
+    """Returns the input provider of the current thread (by default, the console)."""
+    return getattr(_local, "provider", None) or console
+
+@contextlib.contextmanager
+def use_provider(provider):
+    """Routes every prompt read on the current thread through `provider` inside the block. None keeps the current provider."""
+    previous = getattr(_local, "provider", None)
+    _local.provider = provider or previous
+    try:
+        yield get_provider()
+    finally:
+        _local.provider = previous
+
+def read_input(prompt:str="", choices=None):
+    """Reads one line of user input from the current provider. A drop-in replacement for `input()` (see 'InputProvider.read')."""
+    return get_provider().read(prompt, choices)
+
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,270 @@
+import os
+import sys
+import json
+import time
+import atexit
+import argparse
+import threading
+import functools
+from collections import deque
+
+
+#========================================
+# INSTRUMENTATION CONFIGURATION
+#========================================
+
+TRACE_PATH = os.environ.get("HANGMAN_TRACE", "")    # <-- a Chrome trace is written here at exit; empty disables tracing
+MAX_EVENTS = 100000                                 # <-- trace events kept in memory (the oldest are dropped first)
+BUCKETS = 64                                        # <-- power-of-two nanosecond buckets
+
+
+#========================================
+# HISTOGRAMS
+#========================================
+
+class Histogram:
+    """A running distribution of span durations, bucketed by powers of two nanoseconds.
+
+    Recording is O(1) and the memory used is fixed, however many spans are recorded.
+
+    Attributes
+    ----------
+    count : int
+        The number of recorded durations.
+    total_ns : int
+        The combined duration, in nanoseconds.
+    min_ns, max_ns : int
+        The shortest and longest durations, in nanoseconds.
+    """
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * BUCKETS
+
+    def __repr__(self):
+        param_str = ", ".join(f"{k}='{v}'" for k,v in self.report().items())
+        return f"{self.__class__.__name__}({param_str})"
+
+    def record(self, duration_ns:int):
+        """Adds one duration, in nanoseconds."""
+        if not self.count or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.count += 1
+        self.total_ns += duration_ns
+        self.buckets[min(duration_ns.bit_length(), BUCKETS - 1)] += 1
+
+    def percentile(self, fraction:float):
+        """Returns an estimate of a percentile (e.g. 0.99), in nanoseconds: the upper edge of the bucket that holds it."""
+        if not self.count:
+            return 0
+        rank = fraction * self.count
+        seen = 0
+        for bucket, hits in enumerate(self.buckets):
+            seen += hits
+            if seen >= rank:
+                return min(max((1 << bucket) - 1, self.min_ns), self.max_ns)
+        return self.max_ns
+
+    def report(self):
+        """Returns the summary of the distribution, in milliseconds."""
+        return {
+            'count': self.count,
+            'total_ms': self.total_ns / 1e6,
+            'mean_ms': self.total_ns / self.count / 1e6 if self.count else 0.0,
+            'min_ms': self.min_ns / 1e6,
+            'p50_ms': self.percentile(0.50) / 1e6,
+            'p99_ms': self.percentile(0.99) / 1e6,
+            'max_ms': self.max_ns / 1e6,
+        }
+
+
+#========================================
+# TRACER
+#========================================
+
+class _NullSpan:
+    """The span returned while tracing is disabled: entering and leaving it does nothing."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """A timed section of code. Created by 'Tracer.span'."""
+    __slots__ = ("tracer", "name", "start_ns")
+
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.tracer._finish(self.name, self.start_ns, time.perf_counter_ns())
+        return False
+
+
+class Tracer:
+    """Records the durations of named spans into per-process histograms, and keeps a bounded log of trace events.
+
+    While disabled, `span` returns a shared no-op context manager and `traced` functions check one attribute before calling straight through, so instrumented hot paths cost next to nothing.
+
+    Attributes
+    ----------
+    enabled : bool
+        Indicates whether spans are recorded.
+    histograms : dict
+        The 'Histogram' of each span name.
+    events : collections.deque
+        The most recent trace events, as (name, start_ns, duration_ns, thread id) tuples.
+
+    Methods
+    -------
+    span(name)
+        Returns a context manager that times the code inside it.
+    traced(name)
+        A decorator that times every call of a function.
+    report()
+        Returns the summary of every histogram.
+    dump(path)
+        Writes the trace events and histograms as a Chrome trace file.
+    """
+    def __init__(self, enabled:bool=False, max_events:int=MAX_EVENTS):
+        self.enabled = enabled
+        self.histograms = {}
+        self.events = deque(maxlen=max_events)
+        self._origin_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(enabled='{self.enabled}', spans='{len(self.histograms)}', events='{len(self.events)}')"
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """Discards every recorded histogram and event."""
+        with self._lock:
+            self.histograms = {}
+            self.events.clear()
+
+    def span(self, name:str):
+        """Returns a context manager that records the duration of the code inside it under `name`."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name)
+
+    def traced(self, name:str=None):
+        """A decorator that records the duration of every call of a function under `name` (by default, its qualified name)."""
+        def decorate(func):
+            span_name = name or func.__qualname__
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start_ns = time.perf_counter_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self._finish(span_name, start_ns, time.perf_counter_ns())
+            return wrapper
+        return decorate
+
+    def _finish(self, name, start_ns, end_ns):
+        duration_ns = end_ns - start_ns
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.record(duration_ns)
+            self.events.append((name, start_ns, duration_ns, threading.get_ident()))
+
+    def report(self):
+        """Returns the summary of each span's histogram (see 'Histogram.report'), by span name."""
+        with self._lock:
+            return {name: histogram.report() for name, histogram in sorted(self.histograms.items())}
+
+    def chrome_trace(self):
+        """Returns the recorded events in the Chrome trace event format, with the histograms in `otherData`."""
+        pid = os.getpid()
+        with self._lock:
+            events = list(self.events)
+        trace_events = [{
+            'name': name,
+            'cat': "hangman",
+            'ph': "X",  # <-- complete event: a start and a duration
+            'ts': (start_ns - self._origin_ns) / 1e3,
+            'dur': duration_ns / 1e3,
+            'pid': pid,
+            'tid': tid,
+        } for name, start_ns, duration_ns, tid in events]
+        trace_events.extend({
+            'name': "thread_name", 'ph': "M", 'pid': pid, 'tid': thread.ident, 'args': {'name': thread.name},
+        } for thread in threading.enumerate())
+        return {
+            'traceEvents': trace_events,
+            'displayTimeUnit': "ms",
+            'otherData': {'histograms': self.report()},
+        }
+
+    def dump(self, path:str):
+        """Writes a Chrome trace file (open it in chrome://tracing or Perfetto). Returns the path."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+        return path
+
+
+def show_report(report, total:str="Mode.play"):
+    """Displays span histograms, with each span's share of the `total` span's time if it was recorded."""
+    total_ms = report.get(total, {}).get('total_ms')
+    print(f"{'span'.ljust(28)} {'count'.rjust(7)} {'total'.rjust(11)} {'mean'.rjust(10)} {'p50'.rjust(10)} {'p99'.rjust(10)} {'share'.rjust(7)}")
+    for name, summary in sorted(report.items(), key=lambda item: -item[1]['total_ms']):
+        share = f"{summary['total_ms'] / total_ms:7.1%}" if total_ms else ""
+        print(f"{name.ljust(28)} {summary['count']:7d} {summary['total_ms']:9.2f}ms {summary['mean_ms']:8.3f}ms "
+              f"{summary['p50_ms']:8.3f}ms {summary['p99_ms']:8.3f}ms {share}")
+
+
+# Process-wide tracer used by the instrumented hot paths
+tracer = Tracer(enabled=bool(TRACE_PATH))
+span = tracer.span
+traced = tracer.traced
+
+def _dump_at_exit():
+    if tracer.histograms:  # <-- never overwrite a trace with an empty one
+        tracer.dump(TRACE_PATH)
+
+if TRACE_PATH:
+    atexit.register(_dump_at_exit)
+
+
+
+if __name__ == '__main__':
+    # Usage: HANGMAN_TRACE=trace.json python app.py
+    #        python -m hangman_pkg.instrument trace.json
+    parser = argparse.ArgumentParser(description="Summarizes the span histograms of a hangman trace file.")
+    parser.add_argument("trace", help="a trace file written with HANGMAN_TRACE")
+    parser.add_argument("--total", default="Mode.play", help="span that the shares are relative to")
+    args = parser.parse_args(sys.argv[1:])
+
+    with open(args.trace) as f:
+        trace = json.load(f)
+    show_report(trace['otherData']['histograms'], args.total)
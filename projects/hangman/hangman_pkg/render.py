@@ -0,0 +1,154 @@
+import os
+import sys
+import shutil
+
+
+#========================================
+# GALLOWS FRAMES
+#========================================
+
+WORD_ROW, GUESS_ROW, MISSES_ROW = 1, 4, 7   # <-- rows of the board with dynamic text
+
+def gallows_frames(body):
+    """Precomputes the static text of every board row for each stage of the 'Hangman' graphic.
+
+    Parameters
+    ----------
+    body : tuple
+        The components of the graphic for each number of errors (see `Guess.BODY`).
+
+    Returns
+    -------
+    tuple
+        One tuple of eleven row prefixes per number of errors. The word, guess and misses are appended to rows `WORD_ROW`, `GUESS_ROW` and `MISSES_ROW`.
+    """
+    post = '||'.ljust(6)
+    frames = []
+    for parts in body:
+        frames.append((
+            f"{'_'*5}[]".rjust(11),
+            f"{'I'.center(9)}{post}Word:   ",
+            f"{'I'.center(9)}{post}",
+            f"{parts[0].center(9)}{post}",
+            f"{parts[1].center(9)}{post}Guess:  ",
+            f"{parts[2].center(9)}{post}",
+            f"{parts[3].center(9)}{post}",
+            f"{parts[4].center(9)}{post}Misses: ",
+            f"{' '*9}{post}",
+            f"{' '*9}{post}",
+            f"[{'='*8}[]",
+        ))
+    return tuple(frames)
+
+def board_lines(frame, h_string, guess, m_string):
+    """Returns the eleven lines of a board: a precomputed frame with the word, guess and misses filled in."""
+    lines = list(frame)
+    lines[WORD_ROW] += h_string
+    lines[GUESS_ROW] += guess
+    lines[MISSES_ROW] += m_string
+    return lines
+
+
+#========================================
+# BOARD RENDERER
+#========================================
+
+class BoardRenderer:
+    """Draws the game board, rewriting only the cells that changed since the previous turn.
+
+    On a terminal, the board is pinned to the top of the screen and the rest of the screen becomes a scrolling region for prompts and messages. Nothing on screen is cleared: the text printed before the first board (e.g. the length of the mystery word) is pushed down below it. Each turn, the changed cells are moved to with ANSI cursor movement and written in a single buffered write. When the stream is not a terminal (or `TERM` is "dumb", or `HANGMAN_PLAIN` is set), every board is printed in full, like 'Guess.show_board'.
+
+    Attributes
+    ----------
+    stream : file
+        The stream the board is written to. Defaults to `sys.stdout`.
+    ansi : bool
+        Indicates whether cursor movement is used.
+
+    Methods
+    -------
+    render(frame, h_string, guess, m_string)
+        Draws a board.
+    close()
+        Releases the screen so later output appears below the board.
+    """
+    def __init__(self, stream=None, ansi=None):
+        self.stream = stream or sys.stdout
+        self.ansi = self.supports_ansi(self.stream) if ansi is None else ansi
+        self._screen = None     # <-- the lines currently on screen
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(ansi='{self.ansi}')"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def supports_ansi(stream):
+        """Indicates whether a stream is a terminal that understands ANSI cursor movement."""
+        if os.environ.get("HANGMAN_PLAIN") or os.environ.get("TERM") == "dumb":
+            return False
+        try:
+            return stream.isatty()
+        except (AttributeError, ValueError):
+            return False
+
+    def render(self, frame, h_string, guess, m_string):
+        """Draws a board from a precomputed frame (see `gallows_frames`) and its dynamic text."""
+        lines = board_lines(frame, h_string, guess, m_string)
+        if not self.ansi:
+            self.stream.write("\n\n" + "\n".join(lines) + "\n")
+        elif self._screen is None:
+            self.stream.write(self._first_frame(lines))
+        else:
+            self.stream.write(self._diff(lines))
+        self.stream.flush()
+        self._screen = lines
+
+    def _first_frame(self, lines):
+        """Pushes the text on screen down to make room, draws the full board above it, and confines scrolling to the rows below the board."""
+        rows = len(lines) + 1
+        height = shutil.get_terminal_size().lines
+        return (
+            "\n" * rows +                   # <-- scrolls only if the cursor is within `rows` of the bottom
+            "\x1b7"                         # <-- save cursor: where the next line of text goes
+            f"\x1b[H\x1b[{rows}L" +         # <-- insert blank rows at the top, moving the text down
+            "\n".join(lines) +
+            f"\x1b[{rows + 1};{height}r"    # <-- scrolling region below the board
+            "\x1b8")                        # <-- restore cursor
+
+    def _diff(self, lines):
+        """Returns the escape sequences that turn the board on screen into `lines`, keeping the cursor in place."""
+        out = ["\x1b7"]     # <-- save cursor
+        for row, (old, new) in enumerate(zip(self._screen, lines)):
+            if old == new:
+                continue
+            col = 0
+            for a, b in zip(old, new):
+                if a != b:
+                    break
+                col += 1
+            if len(old) == len(new):  # <-- only the changed span
+                end = len(new)
+                while old[end - 1] == new[end - 1]:
+                    end -= 1
+                out.append(f"\x1b[{row + 1};{col + 1}H{new[col:end]}")
+            else:
+                out.append(f"\x1b[{row + 1};{col + 1}H{new[col:]}\x1b[K")
+        out.append("\x1b8")  # <-- restore cursor
+        return "".join(out)
+
+    def close(self):
+        """Restores normal scrolling, so later output is not confined below the board."""
+        if self.ansi and self._screen is not None:
+            self.stream.write("\x1b7\x1b[r\x1b8\n")
+            self.stream.flush()
+        self._screen = None
+
+
+
+if __name__ == '__main__':
+    pass
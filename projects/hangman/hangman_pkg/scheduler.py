@@ -0,0 +1,169 @@
+import time
+import heapq
+import itertools
+import threading
+import traceback
+
+
+#========================================
+# DEADLINE SCHEDULER
+#========================================
+
+class TimerHandle:
+    """A callback scheduled to run at a deadline. Returned by 'DeadlineScheduler.schedule'.
+
+    Attributes
+    ----------
+    deadline : float
+        The `time.monotonic()` value at which the callback runs.
+    cancelled : bool
+        Indicates whether the callback was cancelled before it ran.
+    fired : bool
+        Indicates whether the callback has run.
+    """
+    __slots__ = ("deadline", "callback", "args", "cancelled", "fired", "_scheduler")
+
+    def __init__(self, deadline, callback, args, scheduler):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self.fired = False
+        self._scheduler = scheduler
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(deadline='{self.deadline}', cancelled='{self.cancelled}')"
+
+    def cancel(self):
+        """Prevents the callback from running. Returns True if it was stopped, False if it already ran (or is running) or was already cancelled."""
+        return self._scheduler._cancel(self)
+
+
+class DeadlineScheduler:
+    """A single thread that runs callbacks at their deadlines, using a heap of pending timers.
+
+    One scheduler serves every timed game in the process, so thousands of concurrent timers cost one thread. Callbacks run on the scheduler thread and should return quickly.
+
+    Methods
+    -------
+    schedule(delay, callback, *args)
+        Runs `callback(*args)` after `delay` seconds. Returns a 'TimerHandle'.
+    """
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._heap = []
+        self._counter = itertools.count()   # <-- tie-breaker for equal deadlines
+        self._cancelled_count = 0
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(pending='{self.pending}')"
+
+    @property
+    def pending(self):
+        """The number of timers waiting to run."""
+        with self._condition:
+            return len(self._heap) - self._cancelled_count
+
+    def _start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="deadline-scheduler", daemon=True)
+            self._thread.start()
+
+    def schedule(self, delay:float, callback, *args):
+        """Runs `callback(*args)` on the scheduler thread after `delay` seconds.
+
+        Parameters
+        ----------
+        delay : float
+            The number of seconds to wait.
+        callback : func
+            The function to call.
+
+        Returns
+        -------
+        TimerHandle
+            A handle that can cancel the callback.
+        """
+        with self._condition:
+            handle = TimerHandle(self._clock() + delay, callback, args, self)
+            heapq.heappush(self._heap, (handle.deadline, next(self._counter), handle))
+            self._start()
+            self._condition.notify()
+        return handle
+
+    def _cancel(self, handle):
+        """Cancels a timer under the run loop's lock, so it cannot fire once this returns True. Purges cancelled timers once they make up most of the heap."""
+        with self._condition:
+            if handle.cancelled or handle.fired:
+                return False
+            handle.cancelled = True
+            self._cancelled_count += 1
+            if self._cancelled_count > 64 and self._cancelled_count * 2 > len(self._heap):
+                self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+                heapq.heapify(self._heap)
+                self._cancelled_count = 0
+            self._condition.notify()
+            return True
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    while self._heap and self._heap[0][2].cancelled:
+                        heapq.heappop(self._heap)
+                        self._cancelled_count -= 1
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+                    timeout = self._heap[0][0] - self._clock()
+                    if timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+                handle = heapq.heappop(self._heap)[2]
+                handle.fired = True     # <-- under the lock: `cancel` now returns False
+            try:
+                handle.callback(*handle.args)
+            except Exception:
+                traceback.print_exc()
+
+
+# Process-wide scheduler shared by every timed game
+scheduler = DeadlineScheduler()
+
+
+class ScheduledTimer:
+    """A drop-in replacement for 'threading.Timer' that runs on a shared 'DeadlineScheduler' instead of its own thread.
+
+    Attributes
+    ----------
+    interval : float
+        The number of seconds to wait after `start()`.
+    function : func
+        The callback to run.
+    """
+    def __init__(self, interval:float, function, args=(), scheduler=scheduler):
+        self.interval = interval
+        self.function = function
+        self.args = tuple(args)
+        self._scheduler = scheduler
+        self._handle = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(interval='{self.interval}', handle={self._handle!r})"
+
+    def start(self):
+        """Schedules the callback."""
+        if self._handle is not None:
+            raise RuntimeError("timers can only be started once")
+        self._handle = self._scheduler.schedule(self.interval, self.function, *self.args)
+
+    def cancel(self):
+        """Stops the timer if its callback has not run yet. Returns True if the callback was stopped."""
+        return self._handle is not None and self._handle.cancel()
+
+
+
+if __name__ == '__main__':
+    pass
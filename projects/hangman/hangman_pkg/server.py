@@ -0,0 +1,385 @@
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import itertools
+import threading
+
+from .context import GameContext
+from .game_objects import Mode, Guess, Outcome
+from .history_store import history_store
+from .simulation import percentile, pick_word
+from .solver import FREQUENCY_ORDER
+
+
+#========================================
+# PLAYER SESSIONS
+#========================================
+
+class PlayerSession:
+    """The state of one connected player: the game in progress, and the player's own history and statistics.
+
+    Each session records outcomes in its own 'GameContext', so any number of players can share a server process. Finished games are persisted by the server's store (by default, the shared `history_store`).
+
+    Attributes
+    ----------
+    session_id : int
+        The identifier of the session on its server.
+    modes : dict
+        The game modes available to the player, keyed by name.
+    context : GameContext
+        The player's own outcome history and running statistics.
+    mode : Mode or None
+        A copy of the game mode being played, or None between games.
+    guess : Guess or None
+        The guesses of the game being played, or None between games.
+
+    Methods
+    -------
+    handle(line)
+        Runs a single protocol command and returns a response object.
+    """
+    COMMANDS = ("modes", "new", "guess", "stats", "history", "quit")
+
+    def __init__(self, session_id:int, modes:dict, rng=None, store=history_store):
+        self.session_id = session_id
+        self.modes = modes
+        self.context = GameContext(modes=modes.values(), store=store)
+        self.mode = None
+        self.guess = None
+        self.rng = rng or random.Random()
+        self._started = 0.0
+        self._deadline = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(session_id='{self.session_id}', games='{len(self.context.history)}', playing='{self.mode is not None}')"
+
+    @staticmethod
+    def _response(successful=True, error=None, **fields):
+        response = {  # <-- response object
+            'successful': successful,
+            'error': error,
+        }
+        response.update(fields)
+        return response
+
+    async def handle(self, line:str):
+        """Runs a single protocol command.
+
+        Parameters
+        ----------
+        line : str
+            A command and its argument, e.g. "new standard" or "guess e".
+
+        Returns
+        -------
+        response : dict
+            `successful` and `error` keys, plus the fields of the command.
+        """
+        command, _, arg = line.strip().partition(" ")
+        command = command.lower()
+        if command not in self.COMMANDS:
+            return self._response(False, f"Unknown command `{command}`. Expected one of: {', '.join(self.COMMANDS)}")
+        if command == "new":
+            return await self.new_game(arg.strip())
+        return getattr(self, f"_{command}")(arg.strip())
+
+    def _modes(self, arg):
+        return self._response(modes={
+            name: {'label': mode_obj.label, 'objective': mode_obj.objective, 'has_timer': mode_obj.has_timer}
+            for name, mode_obj in self.modes.items()})
+
+    def _stats(self, arg):
+        return self._response(stats={name: stats.report() for name, stats in list(self.context.stats.items())})
+
+    def _history(self, arg):
+        return self._response(history=[str(outcome_obj) for outcome_obj in self.context.history])
+
+    def _quit(self, arg):
+        return self._response(message="I hope you enjoyed this game. Have a great day!")
+
+    async def new_game(self, mode_name:str):
+        """Starts a game of the named mode, abandoning any game in progress."""
+        template = self.modes.get(mode_name)
+        if template is None:
+            return self._response(False, f"Unknown game mode `{mode_name}`. Expected one of: {', '.join(self.modes)}")
+        if template.source == "speech":
+            return self._response(False, f"The `{mode_name}` game mode needs a microphone and cannot be played over the network")
+        loop = asyncio.get_running_loop()
+        word = await loop.run_in_executor(None, pick_word, template, self.rng)  # <-- word sources may touch the disk
+        mode = self.context.new_game(template)
+        mode._word = word
+        mode._index_word()
+        self.mode = mode
+        self.guess = Guess()
+        self._started = time.time()
+        self._deadline = time.monotonic() + mode.time_limit if mode.has_timer else None
+        return self._board(state="playing", message=f"The mystery word contains {len(word)} letters.")
+
+    def _guess(self, value):
+        """Grades a guess of the game in progress with the rules of 'Mode'."""
+        mode, g = self.mode, self.guess
+        if mode is None:
+            return self._response(False, "No game in progress. Send `new <mode>` to start one")
+        g.value = value.lower()
+        if not g._is_valid(mode._word):
+            return self._response(False, f"Enter a single letter, or a word of {len(mode._word)} letters")
+        if g._status(g.value) is not None:
+            return self._response(False, "You already used this guess")
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            return self._finish(False, "Time's Up! You ran out of time.", duration=mode.time_limit)
+
+        is_correct = mode._grade_guess(g)
+        g._hit_string(mode._word, mode._blanks, mode._revealed)
+        if mode._unrevealed == 0:
+            return self._finish(True, "Congratulations. You won the game!")
+        if g.miss_count == mode.max_errors:
+            return self._finish(False, "Whomp whomp. You lose! Better luck next time.")
+        return self._board(state="playing", message=mode._praise() if is_correct else mode._taunt())
+
+    def _board(self, **fields):
+        mode, g = self.mode, self.guess
+        return self._response(
+            board=" ".join(mode._blanks),
+            misses=g.misses,
+            errors_left=mode.max_errors - g.miss_count,
+            **fields)
+
+    def _finish(self, is_victorious, message, duration=None):
+        """Records the outcome of the game in progress and ends it."""
+        mode = self.mode
+        mode.is_victorious = is_victorious
+        mode.duration = time.time() - self._started if duration is None else duration
+        self.context.record(Outcome(mode, self.guess))
+        response = self._board(
+            state="won" if is_victorious else "lost",
+            message=message,
+            word=mode._word,
+            duration=round(mode.duration, 3))
+        self.mode = None
+        self.guess = None
+        return response
+
+
+#========================================
+# SERVER
+#========================================
+
+class HangmanServer:
+    """An asyncio TCP server that hosts many concurrent hangman sessions.
+
+    The protocol is line-based: the client sends a command per line (`modes`, `new <mode>`, `guess <value>`, `stats`, `history` or `quit`), and the server answers each with one JSON response object per line. A greeting with the session id and the available modes is sent on connect.
+
+    Attributes
+    ----------
+    host : str, default = "127.0.0.1"
+        The interface to listen on.
+    port : int, default = 8765
+        The port to listen on. 0 picks a free port.
+    modes : dict
+        The game modes offered to every session, keyed by name. Defaults to a snapshot of `Mode.all_modes`.
+    sessions : dict
+        The connected 'PlayerSession' objects, keyed by session id.
+    store : HistoryStore or None
+        The durable store that every session persists its outcomes to. None disables persistence (e.g. for load tests).
+
+    Methods
+    -------
+    start()
+        Starts listening. Returns the bound port.
+    serve_forever()
+        Starts listening and serves until cancelled.
+    close()
+        Stops listening.
+    """
+    def __init__(self, host:str="127.0.0.1", port:int=8765, modes=None, store=history_store):
+        self.host = host
+        self.port = port
+        self.modes = modes or {mode_obj.name: mode_obj for mode_obj in Mode.all_modes}
+        self.sessions = {}
+        self.store = store
+        self._ids = itertools.count(1)
+        self._server = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(host='{self.host}', port='{self.port}', sessions='{len(self.sessions)}')"
+
+    async def start(self):
+        """Starts listening, and returns the bound port."""
+        self._server = await asyncio.start_server(self._serve_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def serve_forever(self):
+        """Starts listening and serves clients until the task is cancelled."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def close(self):
+        """Stops listening for new clients."""
+        if self._server is not None:
+            self._server.close()
+
+    async def _serve_client(self, reader, writer):
+        session = PlayerSession(next(self._ids), self.modes, store=self.store)
+        self.sessions[session.session_id] = session
+        try:
+            self._send(writer, session._response(session=session.session_id, modes=list(self.modes)))
+            await writer.drain()
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = await session.handle(line.decode("utf-8", "replace"))
+                self._send(writer, response)
+                await writer.drain()
+                if line.strip().lower() == b"quit":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self.sessions[session.session_id]
+            writer.close()
+
+    @staticmethod
+    def _send(writer, response):
+        writer.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+#========================================
+# LOAD TEST CLIENT
+#========================================
+
+async def _request(reader, writer, line):
+    writer.write(line.encode("utf-8") + b"\n")
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+async def _load_session(host, port, games, mode_name, latencies):
+    """Plays `games` games over one connection, guessing letters by frequency. Returns True if every game finished."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        json.loads(await reader.readline())  # <-- greeting
+        for _ in range(games):
+            response = await _request(reader, writer, f"new {mode_name}")
+            if not response['successful']:
+                return False
+            for letter in FREQUENCY_ORDER:
+                start_time = time.perf_counter()
+                response = await _request(reader, writer, f"guess {letter}")
+                latencies.append((time.perf_counter() - start_time) * 1000)
+                if not response['successful']:
+                    return False
+                if response['state'] != "playing":
+                    break
+        await _request(reader, writer, "quit")
+        return True
+    finally:
+        writer.close()
+
+async def load_test(host:str="127.0.0.1", port:int=8765, sessions:int=100, games:int=5, mode_name="standard"):
+    """Connects `sessions` concurrent players to a server and plays `games` games each.
+
+    Returns
+    -------
+    dict
+        The sessions that finished or failed, the guess throughput, and guess latency percentiles (in milliseconds).
+    """
+    latencies = []
+    start_time = time.perf_counter()
+    results = await asyncio.gather(
+        *(_load_session(host, port, games, mode_name, latencies) for _ in range(sessions)),
+        return_exceptions=True)
+    elapsed = time.perf_counter() - start_time
+    latencies.sort()
+    report = {
+        'sessions': sessions,
+        'completed': sum(1 for result in results if result is True),
+        'failed': sum(1 for result in results if result is not True),
+        'guesses': len(latencies),
+        'elapsed': elapsed,
+        'guesses_per_sec': len(latencies) / elapsed if elapsed else 0.0,
+        'latency_ms': {f"p{pct}": percentile(latencies, pct) for pct in (50, 90, 99)},
+    }
+    report['latency_ms']['max'] = latencies[-1] if latencies else 0.0
+    return report
+
+async def find_capacity(host:str="127.0.0.1", port:int=8765, start:int=50, limit:int=10000, games:int=3, mode_name="standard", target_p99:float=50.0):
+    """Doubles the number of concurrent sessions until a run fails or its p99 guess latency exceeds `target_p99` milliseconds.
+
+    Returns
+    -------
+    dict
+        The largest number of `supported` sessions, and the report of every run.
+    """
+    runs = []
+    supported = 0
+    sessions = start
+    while sessions <= limit:
+        report = await load_test(host, port, sessions, games, mode_name)
+        runs.append(report)
+        if report['failed'] or report['latency_ms']['p99'] > target_p99:
+            break
+        supported = sessions
+        sessions *= 2
+    return {'supported': supported, 'target_p99': target_p99, 'runs': runs}
+
+def show_report(report):
+    """Displays a load test report."""
+    print(f"Sessions: {report['completed']} of {report['sessions']} completed ({report['failed']} failed) | "
+        f"Guesses: {report['guesses']} | Elapsed: {report['elapsed']:.2f}s | Throughput: {report['guesses_per_sec']:.0f} guesses/sec")
+    print("Guess latency (ms): " + ", ".join(f"{k}={v:.3f}" for k,v in report['latency_ms'].items()))
+
+def _serve_in_background(host, port, store=None):
+    """Starts a server on its own event loop thread, and returns the bound port. By default its games are not persisted."""
+    ready = threading.Event()
+    bound = {}
+    def run():
+        async def main():
+            server = HangmanServer(host, port, store=store)
+            bound['port'] = await server.start()
+            ready.set()
+            await server.serve_forever()
+        asyncio.run(main())
+    threading.Thread(target=run, name="hangman-server", daemon=True).start()
+    ready.wait()
+    return bound['port']
+
+
+
+if __name__ == '__main__':
+    # Usage: python -m hangman_pkg.server serve [--port 8765] [--no-history]
+    #        python -m hangman_pkg.server load [--sessions 100 | --capacity] [--local]
+    parser = argparse.ArgumentParser(description="Hosts hangman sessions over TCP, or load tests a running server.")
+    parser.add_argument("command", choices=("serve", "load"))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--sessions", type=int, default=100, help="concurrent sessions per load test")
+    parser.add_argument("--games", type=int, default=5, help="games per session")
+    parser.add_argument("--mode", default="standard")
+    parser.add_argument("--capacity", action="store_true", help="double the sessions until the p99 target is missed")
+    parser.add_argument("--target-p99", type=float, default=50.0, help="p99 guess latency target in milliseconds")
+    parser.add_argument("--local", action="store_true", help="load test a server started in this process (its games are not persisted)")
+    parser.add_argument("--no-history", action="store_true", help="serve without persisting outcomes, e.g. as the target of a load test")
+    args = parser.parse_args(sys.argv[1:])
+
+    if args.command == "serve":
+        server = HangmanServer(args.host, args.port, store=None if args.no_history else history_store)
+        print(f"Serving hangman on {args.host}:{args.port}")
+        try:
+            asyncio.run(server.serve_forever())
+        except KeyboardInterrupt:
+            pass
+    else:
+        port = _serve_in_background(args.host, 0) if args.local else args.port
+        if args.capacity:
+            result = asyncio.run(find_capacity(args.host, port, args.sessions, games=args.games, mode_name=args.mode, target_p99=args.target_p99))
+            for report in result['runs']:
+                show_report(report)
+            print(f"Sessions supported at p99 <= {result['target_p99']:.0f}ms: {result['supported']}")
+        else:
+            show_report(asyncio.run(load_test(args.host, port, args.sessions, args.games, args.mode)))
@@ -0,0 +1,322 @@
+import os
+import sys
+import copy
+import math
+import time
+import random
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from .game_objects import Mode, Guess
+from .solver import FREQUENCY_ORDER, CandidateIndex, Solver, load_corpus
+from .word_sources import WordSource, SpeechSource
+
+
+#========================================
+# GUESSING STRATEGIES
+#========================================
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+def matches(word, board, excluded):
+    """Indicates whether a word is consistent with the board and contains none of the excluded letters.
+
+    Parameters
+    ----------
+    word : str
+        A candidate target word.
+    board : list
+        The placeholders of the game: an uppercase letter for each revealed position, "_" otherwise.
+    excluded : set
+        The letters that cannot appear in an unrevealed position (every letter guessed so far).
+    """
+    for char, cell in zip(word, board):
+        if cell == "_":
+            if char in excluded:
+                return False
+        elif char != cell.lower():
+            return False
+    return True
+
+
+class Strategy:
+    """The base class for a headless guessing strategy.
+
+    Class Variables
+    ---------------
+    name : str or None
+        The identifier used to select a strategy. Strategies without a name are not registered.
+    strategies : dict
+        A registry of every named 'Strategy' subclass.
+
+    Attributes
+    ----------
+    rng : random.Random
+        The random number generator of the strategy.
+    source : str or None
+        The word list that candidate words come from. None uses the system dictionary.
+
+    Methods
+    -------
+    reset(length)
+        Prepares the strategy for a new game with a target word of `length` letters.
+    next_guess(board, guess_obj)
+        Returns the next letter (or word) to guess.
+    """
+    name = None
+    strategies = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.name:
+            Strategy.strategies[cls.name] = cls
+
+    def __init__(self, rng=None, source=None):
+        self.rng = rng or random.Random()
+        self.source = source
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+    def reset(self, length:int):
+        pass
+
+    def _untried(self, guess_obj, order=LETTERS):
+        return [char for char in order if guess_obj._status(char) is None]
+
+    def next_guess(self, board, guess_obj):
+        raise NotImplementedError
+
+
+class RandomStrategy(Strategy):
+    """Guesses an untried letter uniformly at random."""
+    name = "random"
+
+    def next_guess(self, board, guess_obj):
+        return self.rng.choice(self._untried(guess_obj))
+
+
+class FrequencyStrategy(Strategy):
+    """Guesses untried letters from most to least frequent."""
+    name = "frequency"
+
+    def next_guess(self, board, guess_obj):
+        return self._untried(guess_obj, FREQUENCY_ORDER)[0]
+
+
+class EntropyStrategy(Strategy):
+    """Guesses the letter that maximizes the expected information about the remaining candidate words.
+
+    Candidates are the corpus words of the target length that are consistent with the board. The word itself is guessed once a single candidate remains.
+    """
+    name = "entropy"
+
+    def reset(self, length:int):
+        self._candidates = load_corpus(self.source).get(length, [])
+
+    def next_guess(self, board, guess_obj):
+        excluded = {value for value in guess_obj.attempts if len(value) == 1}
+        self._candidates = [word for word in self._candidates
+            if matches(word, board, excluded) and guess_obj._status(word) is None]
+        if len(self._candidates) == 1:
+            return self._candidates[0]
+        untried = self._untried(guess_obj, FREQUENCY_ORDER)
+        if not self._candidates:
+            return untried[0]
+        return max(untried, key=lambda char: self._entropy(char))
+
+    def _entropy(self, char):
+        """Returns the entropy (in bits) of the reveal pattern of `char` across the candidates."""
+        patterns = {}
+        for word in self._candidates:
+            mask = 0
+            for idx, letter in enumerate(word):
+                if letter == char:
+                    mask |= 1 << idx
+            patterns[mask] = patterns.get(mask, 0) + 1
+        total = len(self._candidates)
+        return -sum(n / total * math.log2(n / total) for n in patterns.values())
+
+
+class SolverStrategy(Strategy):
+    """Guesses with the 'Solver', narrowing its candidate bitset incrementally after every guess."""
+    name = "solver"
+    _solvers = {}   # <-- one index per process and word list
+
+    def reset(self, length:int):
+        self._solver = self._solvers.get(self.source)
+        if self._solver is None:
+            self._solver = self._solvers[self.source] = Solver(CandidateIndex(load_corpus(self.source)))
+        self._bits = self._solver.index.all_candidates(length)
+        self._seen = 0
+
+    def next_guess(self, board, guess_obj):
+        for value in guess_obj._log[self._seen:]:
+            self._bits = self._solver.update(self._bits, board, value)
+        self._seen = len(guess_obj._log)
+        return self._solver.best_guess(self._bits, len(board), guess_obj)
+
+
+#========================================
+# HEADLESS GAMEPLAY
+#========================================
+
+def _find_mode(name):
+    for mode_obj in Mode.all_modes:
+        if mode_obj.name == name:
+            return mode_obj
+    raise ValueError(f"Unknown game mode: {name}")
+
+def pick_word(mode_obj, rng):
+    """Selects a target word for a headless game. Speech sources fall back to the default words."""
+    source = WordSource.for_mode(mode_obj)
+    word = None
+    if source is not None and not isinstance(source, SpeechSource):
+        word = source.choose(mode_obj.min_word_length, rng)
+    return (word or rng.choice(Mode.DEFAULT_WORDS)).lower()
+
+def play_headless(mode_obj, strategy, word):
+    """Plays a single game without any input or output, using the real grading logic.
+
+    Parameters
+    ----------
+    mode_obj : Mode
+        The game mode to play. It is copied, not modified.
+    strategy : Strategy
+        The strategy that supplies each guess.
+    word : str
+        The target word.
+
+    Returns
+    -------
+    Mode, Guess
+        The finished game and its guesses.
+    """
+    mode = copy.copy(mode_obj)
+    mode._word = word
+    mode._index_word()
+    strategy.reset(len(word))
+    g = Guess()
+    while True:
+        g.value = strategy.next_guess(mode._blanks, g)
+        if g._status(g.value) is not None:
+            raise RuntimeError(f"{strategy!r} repeated the guess `{g.value}`")
+        mode._grade_guess(g)
+        g._hit_string(word, mode._blanks, mode._revealed)
+        if mode._unrevealed == 0:
+            mode.is_victorious = True
+            return mode, g
+        if g.miss_count == mode.max_errors:
+            mode.is_victorious = False
+            return mode, g
+
+def _simulate_chunk(mode_name, strategy_name, games, seed):
+    """Plays `games` headless games and returns a list of (won, seconds, tries) tuples."""
+    rng = random.Random(seed)
+    mode_obj = _find_mode(mode_name)
+    strategy = Strategy.strategies[strategy_name](rng)
+    results = []
+    for _ in range(games):
+        word = pick_word(mode_obj, rng)
+        start_time = time.perf_counter()
+        mode, g = play_headless(mode_obj, strategy, word)
+        results.append((mode.is_victorious, time.perf_counter() - start_time, len(g._log)))
+    return results
+
+
+#========================================
+# BATCH SIMULATION
+#========================================
+
+def percentile(sorted_values, pct):
+    """Returns the nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+def run_simulation(games:int=1000, strategy="frequency", modes=None, workers=None, seed=None):
+    """Plays `games` headless games per mode, fanned out over a process pool, and returns a report.
+
+    Parameters
+    ----------
+    games : int, default = 1000
+        The number of games played per mode.
+    strategy : str, default = "frequency"
+        The name of a registered 'Strategy'.
+    modes : list, optional
+        The names of the game modes to simulate. Defaults to every mode.
+    workers : int or None, default = None
+        The number of worker processes. None uses every CPU; 0 runs in the current process.
+    seed : int, optional
+        The seed for reproducible runs.
+
+    Returns
+    -------
+    dict
+        Throughput, per-mode win rates, and per-game latency percentiles (in milliseconds).
+    """
+    modes = modes or [mode_obj.name for mode_obj in Mode.all_modes]
+    seeds = random.Random(seed)
+    workers = os.cpu_count() if workers is None else workers
+    chunk = max(games // max(workers * 4, 1), 1)
+    tasks = []
+    for mode_name in modes:
+        for start in range(0, games, chunk):
+            tasks.append((mode_name, strategy, min(chunk, games - start), seeds.randrange(2**32)))
+
+    start_time = time.perf_counter()
+    if workers:
+        with ProcessPoolExecutor(workers) as pool:
+            chunks = list(pool.map(_simulate_chunk, *zip(*tasks)))
+    else:
+        chunks = [_simulate_chunk(*task) for task in tasks]
+    elapsed = time.perf_counter() - start_time
+
+    report = {
+        'strategy': strategy,
+        'games': 0,
+        'elapsed': elapsed,
+        'games_per_sec': 0.0,
+        'modes': {},
+        'latency_ms': {},
+    }
+    latencies = []
+    for (mode_name, *_), results in zip(tasks, chunks):
+        tally = report['modes'].setdefault(mode_name, {'games': 0, 'wins': 0, 'tries': 0})
+        for won, seconds, tries in results:
+            tally['games'] += 1
+            tally['wins'] += won
+            tally['tries'] += tries
+            latencies.append(seconds * 1000)
+    for tally in report['modes'].values():
+        tally['win_rate'] = tally['wins'] / tally['games'] if tally['games'] else 0.0
+        tally['mean_tries'] = tally.pop('tries') / tally['games'] if tally['games'] else 0.0
+    latencies.sort()
+    report['games'] = len(latencies)
+    report['games_per_sec'] = len(latencies) / elapsed if elapsed else 0.0
+    report['latency_ms'] = {f"p{pct}": percentile(latencies, pct) for pct in (50, 90, 99)}
+    report['latency_ms']['max'] = latencies[-1] if latencies else 0.0
+    return report
+
+def show_report(report):
+    """Displays a simulation report."""
+    print(f"Strategy: {report['strategy']} | Games: {report['games']} | "
+        f"Elapsed: {report['elapsed']:.2f}s | Throughput: {report['games_per_sec']:.0f} games/sec")
+    for name, tally in report['modes'].items():
+        print(f"| {name.title().rjust(8)} Mode: {tally['wins']} of {tally['games']} won "
+            f"({tally['win_rate']:.1%}), {tally['mean_tries']:.1f} tries/game |")
+    print("Latency (ms): " + ", ".join(f"{k}={v:.3f}" for k,v in report['latency_ms'].items()))
+
+
+
+if __name__ == '__main__':
+    # Usage: python -m hangman_pkg.simulation --games 1000 --strategy entropy
+    parser = argparse.ArgumentParser(description="Plays headless hangman games and reports throughput and win rates.")
+    parser.add_argument("--games", type=int, default=1000, help="games per mode")
+    parser.add_argument("--strategy", default="frequency", choices=sorted(Strategy.strategies))
+    parser.add_argument("--modes", nargs="*", help="game modes to simulate (default: all)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (0 = in-process)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(sys.argv[1:])
+    show_report(run_simulation(args.games, args.strategy, args.modes, args.workers, args.seed))
@@ -0,0 +1,205 @@
+import math
+
+from .game_objects import Mode
+from .word_index import get_index
+
+
+#========================================
+# CORPUS
+#========================================
+
+FREQUENCY_ORDER = "esiarntolcdupmghbyfvkwzxqj"  # <-- letter frequency of dictionary words
+
+_corpora = {}   # <-- source: words grouped by length
+
+def load_corpus(source=None):
+    """Returns the lowercase words available to the solver and strategies, grouped by length. Loaded once per process and word list (by default, the system dictionary)."""
+    corpus = _corpora.get(source)
+    if corpus is None:
+        words = set(Mode.DEFAULT_WORDS)
+        try:
+            words.update(word for word in get_index(source).words(0) if word.isalpha())
+        except OSError:
+            pass
+        corpus = _corpora[source] = {}
+        for word in sorted(words):
+            corpus.setdefault(len(word), []).append(word.lower())
+    return corpus
+
+def popcount(bits:int):
+    """Returns the number of set bits in an integer."""
+    return bin(bits).count("1")
+
+
+#========================================
+# CANDIDATE-PATTERN INDEX
+#========================================
+
+class CandidateIndex:
+    """An index from (length, letter, position-mask) to a bitset of the words that produce that reveal pattern.
+
+    Words of each length are numbered, and a set of candidates is an integer bitset over those numbers, so narrowing the candidates after a guess is a single bitwise AND.
+
+    Attributes
+    ----------
+    words : dict
+        The indexed words, grouped by length.
+    """
+    def __init__(self, words=None):
+        """Constructor method for the 'CandidateIndex' class.
+
+        Parameters
+        ----------
+        words : dict, optional
+            Lists of lowercase words grouped by length. Defaults to `load_corpus()`.
+        """
+        self.words = words if words is not None else load_corpus()
+        self._patterns = {}   # <-- (length, letter): {mask: bitset}
+        self._numbers = {}    # <-- length: {word: number}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(lengths='{len(self.words)}')"
+
+    def patterns(self, length:int, letter:str):
+        """Returns the reveal-pattern table for a letter among words of `length` letters, building it on first use."""
+        key = (length, letter)
+        table = self._patterns.get(key)
+        if table is None:
+            table = {}
+            for number, word in enumerate(self.words.get(length, ())):
+                mask = 0
+                for idx, char in enumerate(word):
+                    if char == letter:
+                        mask |= 1 << idx
+                table[mask] = table.get(mask, 0) | (1 << number)
+            self._patterns[key] = table
+        return table
+
+    def numbers(self, length:int):
+        """Returns the map from each word of `length` letters to its number, building it on first use."""
+        table = self._numbers.get(length)
+        if table is None:
+            table = self._numbers[length] = {word: number for number, word in enumerate(self.words.get(length, ()))}
+        return table
+
+    def all_candidates(self, length:int):
+        """Returns the bitset of every word of `length` letters."""
+        return (1 << len(self.words.get(length, ()))) - 1
+
+    def narrow(self, bits:int, length:int, letter:str, mask:int):
+        """Returns the candidates in `bits` that reveal exactly the positions in `mask` for `letter` (0 for a miss)."""
+        return bits & self.patterns(length, letter).get(mask, 0)
+
+    def exclude(self, bits:int, length:int, word:str):
+        """Returns the candidates in `bits` without `word`."""
+        number = self.numbers(length).get(word)
+        return bits if number is None else bits & ~(1 << number)
+
+    def candidates(self, bits:int, length:int):
+        """Returns the list of words in a candidate bitset."""
+        words = self.words.get(length, ())
+        found = []
+        while bits:
+            low_bit = bits & -bits
+            found.append(words[low_bit.bit_length() - 1])
+            bits ^= low_bit
+        return found
+
+
+#========================================
+# SOLVER
+#========================================
+
+class Solver:
+    """A hangman solver that tracks the dictionary words consistent with the board and picks the most informative letter.
+
+    Attributes
+    ----------
+    index : CandidateIndex
+        The candidate-pattern index over the word list.
+
+    Methods
+    -------
+    candidates_for(board, guess_obj)
+        Returns the candidate bitset consistent with a board and its guesses.
+    best_guess(bits, length, guess_obj)
+        Returns the word (if one candidate remains) or the letter that maximizes the expected information.
+    hint(board, guess_obj)
+        Returns a hint for the current board.
+    """
+    def __init__(self, index=None):
+        self.index = index or CandidateIndex()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(index={self.index!r})"
+
+    @staticmethod
+    def reveal_mask(board, letter):
+        """Returns the bitmask of the board positions that show `letter`."""
+        mask = 0
+        for idx, cell in enumerate(board):
+            if cell.lower() == letter:
+                mask |= 1 << idx
+        return mask
+
+    def update(self, bits:int, board, value:str):
+        """Narrows the candidates in `bits` with the outcome of a single guess shown on `board`."""
+        length = len(board)
+        if len(value) == 1:
+            return self.index.narrow(bits, length, value, self.reveal_mask(board, value))
+        return self.index.exclude(bits, length, value)
+
+    def candidates_for(self, board, guess_obj):
+        """Returns the candidate bitset consistent with a board and every guess made so far."""
+        bits = self.index.all_candidates(len(board))
+        for value in guess_obj.attempts:
+            bits = self.update(bits, board, value)
+        return bits
+
+    def entropy(self, bits:int, length:int, letter:str):
+        """Returns the entropy (in bits) of the reveal pattern of `letter` across the candidates."""
+        total = popcount(bits)
+        result = 0.0
+        for pattern_bits in self.index.patterns(length, letter).values():
+            count = popcount(bits & pattern_bits)
+            if count:
+                result -= count / total * math.log2(count / total)
+        return result
+
+    def best_guess(self, bits:int, length:int, guess_obj):
+        """Returns the only remaining candidate word, or the untried letter with the highest expected information."""
+        untried = [char for char in FREQUENCY_ORDER if guess_obj._status(char) is None]
+        count = popcount(bits)
+        if count == 1:
+            word = self.index.candidates(bits, length)[0]
+            if guess_obj._status(word) is None:
+                return word
+        if count == 0:
+            return untried[0]
+        return max(untried, key=lambda char: self.entropy(bits, length, char))
+
+    def hint(self, board, guess_obj):
+        """Returns a hint for the current board.
+
+        Parameters
+        ----------
+        board : list
+            The placeholders of the game: an uppercase letter for each revealed position, "_" otherwise.
+        guess_obj : Guess
+            The guesses made so far.
+
+        Returns
+        -------
+        dict
+            The suggested `guess` and the number of remaining `candidates`.
+        """
+        bits = self.candidates_for(board, guess_obj)
+        return {
+            'guess': self.best_guess(bits, len(board), guess_obj),
+            'candidates': popcount(bits),
+        }
+
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,231 @@
+import os
+import queue
+import shutil
+import hashlib
+import threading
+import subprocess
+
+from .audio import AudioUnavailable, available, load
+from .instrument import traced
+from .word_index import INDEX_DIR
+
+
+#========================================
+# SPEECH CONFIGURATION
+#========================================
+
+SPEECH_CACHE_DIR = os.path.join(INDEX_DIR, "speech")
+PLAYERS = (  # <-- command-line players for cached audio, in order of preference
+    ("afplay",),
+    ("aplay", "-q"),
+    ("paplay",),
+)
+
+
+#========================================
+# PHRASE CACHE
+#========================================
+
+class PhraseCache:
+    """An on-disk cache of pre-rendered audio files for fixed phrases.
+
+    The cache is bounded: once it holds more than `max_files` phrases, the least recently played ones are deleted. A file's modification time records when it was last rendered or played.
+
+    Attributes
+    ----------
+    directory : str
+        The directory that holds the rendered audio files.
+    max_files : int, default = 256
+        The maximum number of phrases kept on disk.
+    player : tuple or None
+        The command used to play a cached file, or None if no player is installed.
+    """
+    def __init__(self, directory=SPEECH_CACHE_DIR, max_files:int=256):
+        self.directory = directory
+        self.max_files = max_files
+        self.player = next((cmd for cmd in PLAYERS if shutil.which(cmd[0])), None)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(directory='{self.directory}', max_files='{self.max_files}', player='{self.player}')"
+
+    def path(self, text):
+        """Returns the cache file path for a phrase."""
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.wav")
+
+    def has(self, text):
+        """Indicates whether a phrase can be played from the cache."""
+        return self.player is not None and os.path.isfile(self.path(text))
+
+    def render(self, engine, text):
+        """Renders a phrase to the cache with a pyttsx3 engine."""
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.path(text) + ".tmp.wav"
+        engine.save_to_file(text, tmp_path)
+        engine.runAndWait()
+        if os.path.isfile(tmp_path) and os.path.getsize(tmp_path):
+            os.replace(tmp_path, self.path(text))
+            self.evict()
+
+    def play(self, text):
+        """Plays a cached phrase. Returns True if successful, False otherwise."""
+        path = self.path(text)
+        try:
+            subprocess.run([*self.player, path], check=True,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            os.utime(path)  # <-- mark as recently used
+        except (OSError, subprocess.CalledProcessError):
+            return False
+        return True
+
+    def evict(self):
+        """Deletes the least recently used phrases beyond `max_files`. Returns the number of files deleted."""
+        try:
+            with os.scandir(self.directory) as entries:
+                files = [(entry.stat().st_mtime, entry.path) for entry in entries
+                    if entry.name.endswith(".wav") and not entry.name.endswith(".tmp.wav")]
+        except OSError:
+            return 0
+        files.sort()
+        deleted = 0
+        for _, path in files[:max(len(files) - self.max_files, 0)]:
+            try:
+                os.remove(path)
+                deleted += 1
+            except OSError:  # <-- already gone
+                pass
+        return deleted
+
+
+#========================================
+# SPEECH SERVICE
+#========================================
+
+class SpeechService:
+    """A long-lived text-to-speech service that owns a single pyttsx3 engine on a dedicated worker thread.
+
+    Callers enqueue text and return immediately. Registered phrases are pre-rendered to a 'PhraseCache' while the worker is idle, and are played from disk from then on. `pyttsx3` is imported by the worker on first use; if it is not installed, or its engine fails to start, text is printed instead of spoken.
+
+    Attributes
+    ----------
+    cache : PhraseCache
+        The on-disk cache of pre-rendered phrases.
+    phrases : set
+        The fixed phrases that are pre-rendered to the cache.
+
+    Methods
+    -------
+    say(text)
+        Queues text to be spoken. Returns an event that is set once it has been spoken.
+    wait()
+        Blocks until every queued utterance has been spoken.
+    register_phrases(phrases)
+        Adds fixed phrases to be pre-rendered in the background.
+    """
+    def __init__(self, cache=None):
+        self.cache = cache or PhraseCache()
+        self.phrases = set()
+        self._pending = []
+        self._queue = queue.Queue()
+        self._engine = None
+        self._failed = False
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(cache={self.cache!r}, phrases='{len(self.phrases)}')"
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="speech-service", daemon=True)
+                self._thread.start()
+
+    @property
+    def available(self):
+        """Indicates whether text can be spoken (`pyttsx3` is installed and its engine started)."""
+        return available("pyttsx3") and not self._failed
+
+    def _init_engine(self):
+        try:
+            self._engine = load("pyttsx3").init()
+        except (AudioUnavailable, OSError, RuntimeError):
+            self._failed = True  # <-- degrade to printing
+
+    def _run(self):
+        """The worker loop: speaks queued text, and pre-renders phrases whenever the queue is empty."""
+        self._init_engine()
+        while True:
+            try:
+                text, done = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                self._render_next()
+                continue
+            try:
+                if text is not None:
+                    self._speak(text)
+            finally:
+                done.set()
+                self._queue.task_done()
+
+    @traced()
+    def _speak(self, text):
+        if self.cache.has(text) and self.cache.play(text):
+            return
+        if self._engine is None:
+            print(text)
+            return
+        self._engine.say(text)
+        self._engine.runAndWait()
+
+    def _render_next(self):
+        """Renders one uncached phrase, if any remain."""
+        if self.cache.player is None or self._engine is None:
+            return
+        while self._pending:
+            text = self._pending.pop()
+            if not self.cache.has(text):
+                self.cache.render(self._engine, text)
+                return
+
+    def register_phrases(self, phrases):
+        """Adds fixed phrases to be pre-rendered to the cache in the background."""
+        new_phrases = set(phrases) - self.phrases
+        self.phrases.update(new_phrases)
+        self._pending.extend(new_phrases)
+
+    def say(self, text):
+        """Queues text to be spoken without blocking.
+
+        Parameters
+        ----------
+        text : str
+            The message to be spoken.
+
+        Returns
+        -------
+        threading.Event
+            An event that is set once the message has been spoken.
+        """
+        done = threading.Event()
+        if not self.available:  # <-- print in order with the rest of the game's output
+            print(text)
+            done.set()
+            return done
+        self._start()
+        self._queue.put((text, done))
+        return done
+
+    def wait(self):
+        """Blocks until every queued utterance has been spoken."""
+        if self._thread is not None:
+            self._queue.join()
+
+
+# Process-wide service shared by 'Game' and 'Guess'
+speech_service = SpeechService()
+
+
+
+if __name__ == '__main__':
+    pass
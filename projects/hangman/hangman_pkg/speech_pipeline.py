@@ -0,0 +1,468 @@
+import os
+import time
+import asyncio
+import threading
+import concurrent.futures
+
+from .audio import load
+from .instrument import traced
+from .speech import speech_service
+
+
+#========================================
+# RECOGNIZER BACK ENDS
+#========================================
+
+class UnknownValueError(Exception):
+    """Raised by a back end when speech cannot be recognized."""
+
+class RequestError(Exception):
+    """Raised by a back end when its recognition service cannot be reached."""
+
+class PipelineError(RuntimeError):
+    """Raised by 'SpeechPipeline.next_response' when one of the pipeline's stages has crashed."""
+
+
+class RecognizerBackend:
+    """The base class for a speech-to-text back end used by the 'SpeechPipeline'.
+
+    Subclasses implement `_recognize`, which returns the recognized text or raises `UnknownValueError` / `RequestError`.
+
+    Class Variables
+    ---------------
+    name : str or None
+        The identifier used to select a back end. Back ends without a name are not registered.
+    backends : dict
+        A registry of every named 'RecognizerBackend' subclass.
+    """
+    name = None
+    backends = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.name:
+            RecognizerBackend.backends[cls.name] = cls
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+    def _recognize(self, audio):
+        raise NotImplementedError
+
+    @traced()
+    def transcribe(self, audio):
+        """This method converts captured audio to text and returns a response object.
+
+        (audio) -> response : dict
+
+        Returns
+        -------
+        response['text'] : str or None
+            The lowercase transcript if successful, None otherwise.
+        response['successful'] : bool
+            True if successful, False otherwise.
+        response['error'] : str or None
+            None if successful, a string error message otherwise.
+        """
+        response = {
+            'text': None,
+            'successful': True,
+            'error': None,
+        }
+        try:
+            response['text'] = self._recognize(audio).lower()
+        except UnknownValueError:
+            response['successful'] = False
+            response['error'] = "I cannot recognize your speech"
+        except RequestError:
+            response['successful'] = False
+            response['error'] = "I cannot contact the API"
+        return response
+
+
+class SpeechRecognitionBackend(RecognizerBackend):
+    """The base class for back ends of the `speech_recognition` package, which is imported on first use.
+
+    Class Variables
+    ---------------
+    method : str
+        The name of the `sr.Recognizer` method that performs the recognition.
+    """
+    method = None
+
+    def __init__(self):
+        self.recognizer = None
+
+    def _recognize(self, audio):
+        sr = load("speech_recognition")
+        if self.recognizer is None:
+            self.recognizer = sr.Recognizer()
+        try:
+            return getattr(self.recognizer, self.method)(audio)
+        except sr.UnknownValueError:
+            raise UnknownValueError()
+        except sr.RequestError:
+            raise RequestError()
+
+
+class GoogleBackend(SpeechRecognitionBackend):
+    """Online recognition with the Google Web Speech API."""
+    name = "google"
+    method = "recognize_google"
+
+
+class SphinxBackend(SpeechRecognitionBackend):
+    """Offline recognition with CMU Sphinx (requires the `pocketsphinx` package)."""
+    name = "sphinx"
+    method = "recognize_sphinx"
+
+
+class FakeBackend(RecognizerBackend):
+    """A local stand-in back end that returns scripted transcripts, for tests and headless runs.
+
+    Attributes
+    ----------
+    transcripts : list
+        The transcripts returned in order. A None entry simulates unrecognizable speech.
+    delay : float, default = 0
+        The number of seconds each recognition takes.
+    """
+    name = "fake"
+
+    def __init__(self, transcripts=(), delay:float=0):
+        self.transcripts = list(transcripts)
+        self.delay = delay
+
+    def _recognize(self, audio):
+        time.sleep(self.delay)
+        text = self.transcripts.pop(0) if self.transcripts else None
+        if text is None:
+            raise UnknownValueError()
+        return text
+
+
+#========================================
+# CAPTURE SOURCES & SESSIONS
+#========================================
+
+class SpeechSession:
+    """A speech session that keeps one audio source open and calibrated for the length of a game.
+
+    A session can serve as both the capture callable and the recognizer back end of a 'SpeechPipeline'. Every stage is timed, so `report()` shows where speech-mode latency goes. The `speech_recognition` package is imported when the session is first opened, not when it is created.
+
+    Attributes
+    ----------
+    source_factory : func, default = sr.Microphone
+        A callable that returns an audio source, e.g. `sr.Microphone` or a recorded `sr.AudioFile`. None selects the microphone when the session opens.
+    backend : RecognizerBackend
+        The back end that converts captured audio to text.
+    calibration : float, default = 0.5
+        The number of seconds of ambient noise sampled once, when the source is opened. 0 disables calibration.
+    recognizer : sr.Recognizer
+        The recognizer used to capture utterances.
+    timings : dict
+        The elapsed seconds of every `open`, `capture` and `recognize` stage.
+
+    Methods
+    -------
+    open()
+        Opens and calibrates the audio source.
+    capture()
+        Records one utterance from the open source.
+    transcribe(audio)
+        Converts captured audio to text and returns a response object.
+    close()
+        Closes the audio source.
+    report()
+        Returns the count, mean and maximum timing of each stage.
+    """
+    STAGES = ("open", "capture", "recognize")
+
+    def __init__(self, source_factory=None, backend=None, calibration:float=0.5):
+        self.source_factory = source_factory
+        self.backend = backend or RecognizerBackend.backends[
+            os.environ.get("HANGMAN_RECOGNIZER", "google")]()
+        self.calibration = calibration
+        self.recognizer = None
+        self.timings = {stage: [] for stage in self.STAGES}
+        self._source = None
+        self._context = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(backend={self.backend!r}, is_open='{self.is_open}')"
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __call__(self):
+        return self.capture()
+
+    @classmethod
+    def from_recording(cls, path, backend=None):
+        """Returns an uncalibrated session that reads utterances from a recorded audio file instead of a microphone."""
+        return cls(lambda: load("speech_recognition").AudioFile(path), backend or FakeBackend(), calibration=0)
+
+    @property
+    def is_open(self):
+        """Indicates whether the audio source is open."""
+        return self._source is not None
+
+    def _record(self, stage, start_time):
+        self.timings[stage].append(time.perf_counter() - start_time)
+
+    def open(self):
+        """Opens the audio source and calibrates it for ambient noise. Returns the session.
+
+        Raises `AudioUnavailable` if the `speech_recognition` package is not installed.
+        """
+        with self._lock:
+            if self._source is None:
+                start_time = time.perf_counter()
+                sr = load("speech_recognition")
+                if self.recognizer is None:
+                    self.recognizer = sr.Recognizer()
+                self._context = (self.source_factory or sr.Microphone)()
+                self._source = self._context.__enter__()
+                if self.calibration:
+                    self.recognizer.adjust_for_ambient_noise(self._source, self.calibration)
+                self._record("open", start_time)
+        return self
+
+    def capture(self):
+        """Records one utterance from the open audio source, opening it first if necessary."""
+        self.open()
+        start_time = time.perf_counter()
+        audio = self.recognizer.listen(self._source)
+        self._record("capture", start_time)
+        return audio
+
+    def transcribe(self, audio):
+        """Converts captured audio to text with the session's back end. See `RecognizerBackend.transcribe`."""
+        start_time = time.perf_counter()
+        response = self.backend.transcribe(audio)
+        self._record("recognize", start_time)
+        return response
+
+    def close(self):
+        """Closes the audio source."""
+        with self._lock:
+            if self._source is not None:
+                self._context.__exit__(None, None, None)
+                self._source = self._context = None
+
+    def report(self):
+        """Returns a dictionary of the count, mean and maximum seconds spent in each stage."""
+        return {
+            stage: {
+                'count': len(times),
+                'mean': sum(times) / len(times) if times else 0.0,
+                'max': max(times, default=0.0),
+            } for stage, times in self.timings.items()}
+
+
+class FakeCapture:
+    """Returns pre-recorded audio clips in order, taking `delay` seconds per clip."""
+    def __init__(self, clips=(), delay:float=0):
+        self.clips = list(clips)
+        self.delay = delay
+
+    def __call__(self):
+        time.sleep(self.delay)
+        return self.clips.pop(0) if self.clips else None
+
+
+#========================================
+# SPEECH PIPELINE
+#========================================
+
+RESPONSE_TIMEOUT = 60   # <-- seconds `next_response` waits before giving up
+
+
+class SpeechPipeline:
+    """An asyncio pipeline that runs text-to-speech, audio capture and recognition as concurrent stages on a private event loop.
+
+    Everything the game says during play goes through the speak stage, in order. Capture is one-shot: it only starts when a prompt that asks for an answer has finished playing, so neither prompts nor praise are ever recorded. Queueing a new prompt discards any answer still buffered for an earlier one. Recognition of an utterance overlaps the speaking of whatever follows it.
+
+    Attributes
+    ----------
+    capture : func
+        A blocking callable that returns one captured utterance, such as a 'SpeechSession'.
+    backend : RecognizerBackend
+        The back end that converts captured audio to text.
+    speaker : func
+        A blocking callable that speaks a string.
+
+    Methods
+    -------
+    start()
+        Starts the pipeline thread and its stages.
+    speak(text)
+        Queues text for the text-to-speech stage.
+    prompt(text)
+        Queues a prompt, and one capture to run once it has been spoken.
+    next_response(timeout)
+        Blocks until the response to the latest prompt is available and returns it.
+    stop()
+        Cancels the stages and joins the pipeline thread.
+    """
+    def __init__(self, capture=None, backend=None, speaker=None):
+        self.capture = capture or SpeechSession()
+        self.backend = backend or RecognizerBackend.backends[
+            os.environ.get("HANGMAN_RECOGNIZER", "google")]()
+        self.speaker = speaker or (lambda text: speech_service.say(text).wait())
+        self._loop = None
+        self._thread = None
+        self._error = None
+        self._generation = 0    # <-- the number of prompts queued; responses to older prompts are stale
+        self._ready = threading.Event()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(backend={self.backend!r}, generation='{self._generation}')"
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    async def _speak_stage(self):
+        while True:
+            text, generation = await self._speech.get()
+            if text:
+                await self._loop.run_in_executor(None, self.speaker, text)
+            if generation is not None:  # <-- the prompt has been spoken: record the answer
+                self._captures.put_nowait(generation)
+
+    async def _capture_stage(self):
+        while True:
+            generation = await self._captures.get()
+            if generation != self._generation:
+                continue
+            audio = await self._loop.run_in_executor(None, self.capture)
+            await self._audio.put((generation, audio))
+
+    async def _recognize_stage(self):
+        while True:
+            generation, audio = await self._audio.get()
+            if generation != self._generation:
+                continue
+            if audio is None:  # <-- the source is exhausted or silent
+                response = {'text': None, 'successful': False, 'error': "I did not hear anything"}
+            else:
+                response = await self._loop.run_in_executor(None, self.backend.transcribe, audio)
+            self._responses.put_nowait((generation, response))
+
+    async def _guard(self, stage):
+        """Runs a stage, and hands its error to `next_response` if it crashes."""
+        try:
+            await stage()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self._error = exc
+            self._responses.put_nowait((None, exc))
+
+    async def _main(self):
+        self._speech = asyncio.Queue()      # <-- (text, generation of the prompt or None)
+        self._captures = asyncio.Queue()    # <-- generations of the prompts awaiting an answer
+        self._audio = asyncio.Queue(1)
+        self._responses = asyncio.Queue()
+        self._stages = [
+            asyncio.ensure_future(self._guard(self._speak_stage)),
+            asyncio.ensure_future(self._guard(self._capture_stage)),
+            asyncio.ensure_future(self._guard(self._recognize_stage)),
+        ]
+        self._ready.set()
+        await asyncio.gather(*self._stages, return_exceptions=True)
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._main())
+
+    def start(self):
+        """Starts the pipeline thread and its stages. Returns the pipeline."""
+        if self._thread is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._run, name="speech-pipeline", daemon=True)
+            self._thread.start()
+            self._ready.wait()
+        return self
+
+    def speak(self, text):
+        """Queues text for the text-to-speech stage without blocking. Nothing is recorded for it."""
+        self._loop.call_soon_threadsafe(self._speech.put_nowait, (text, None))
+
+    def _queue_prompt(self, text, generation):
+        for queue in (self._audio, self._responses):  # <-- drop answers to earlier prompts
+            while not queue.empty():
+                item = queue.get_nowait()
+                if isinstance(item[1], BaseException):
+                    queue.put_nowait(item)
+                    break
+        self._speech.put_nowait((text, generation))
+
+    def prompt(self, text):
+        """Queues a prompt without blocking, and a single capture that starts once the prompt has been spoken.
+
+        Any answer still buffered for an earlier prompt is discarded, so `next_response` returns the answer to this one.
+        """
+        generation = self._generation + 1
+        self._generation = generation
+        self._loop.call_soon_threadsafe(self._queue_prompt, text, generation)
+
+    async def _next_response(self):
+        while True:
+            generation, response = await self._responses.get()
+            if isinstance(response, BaseException):
+                self._responses.put_nowait((generation, response))  # <-- every later call fails too
+                raise PipelineError(f"The speech pipeline stopped: {response!r}") from response
+            if generation == self._generation:
+                return response
+
+    def next_response(self, timeout=RESPONSE_TIMEOUT):
+        """Blocks until the response to the latest prompt is available.
+
+        Parameters
+        ----------
+        timeout : float or None, default = RESPONSE_TIMEOUT
+            The maximum number of seconds to wait. None waits indefinitely.
+
+        Returns
+        -------
+        dict
+            A response object from `RecognizerBackend.transcribe`.
+
+        Raises
+        ------
+        PipelineError
+            If a stage of the pipeline has crashed.
+        TimeoutError
+            If no response arrived within `timeout` seconds.
+        """
+        if self._error is not None:
+            raise PipelineError(f"The speech pipeline stopped: {self._error!r}") from self._error
+        future = asyncio.run_coroutine_threadsafe(self._next_response(), self._loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"No speech was recognized within {timeout} seconds")
+
+    def stop(self):
+        """Cancels the stages and joins the pipeline thread."""
+        if self._thread is None:
+            return
+        for stage in self._stages:
+            self._loop.call_soon_threadsafe(stage.cancel)
+        self._thread.join()
+        self._loop.close()
+        self._thread = None
+
+
+
+if __name__ == '__main__':
+    pass
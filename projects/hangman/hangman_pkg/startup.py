@@ -0,0 +1,85 @@
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+from .audio import AUDIO_PACKAGES
+
+
+#========================================
+# IMPORT-TIME PROFILE
+#========================================
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def profile_imports(target="app", cwd=PROJECT_DIR):
+    """Imports a module in a fresh interpreter with `-X importtime` and returns the parsed profile.
+
+    Parameters
+    ----------
+    target : str, default = "app"
+        The module to import.
+    cwd : str
+        The directory the interpreter runs in. Defaults to the hangman project directory.
+
+    Returns
+    -------
+    dict
+        The total import time, every imported module with its self and cumulative time (in milliseconds), and the optional audio packages that were imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=cwd, capture_output=True, text=True)
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        modules.append({
+            'module': name.strip(),
+            'depth': (len(name) - len(name.lstrip()) - 1) // 2,
+            'self_ms': int(self_us) / 1000,
+            'cumulative_ms': int(cumulative_us) / 1000,
+        })
+    top_level = [entry for entry in modules if entry['depth'] == 0]
+    imported = {entry['module'].split(".")[0] for entry in modules}
+    return {
+        'target': target,
+        'successful': result.returncode == 0,
+        'error': result.stderr.strip().splitlines()[-1] if result.returncode else None,
+        'total_ms': sum(entry['cumulative_ms'] for entry in top_level),
+        'modules': modules,
+        'audio_imported': sorted(name for name in AUDIO_PACKAGES if name in imported),
+    }
+
+def show_report(report, limit:int=15):
+    """Displays the slowest imports of a profile, by cumulative time."""
+    print(f"Import profile of `{report['target']}`: {report['total_ms']:.1f}ms across {len(report['modules'])} modules")
+    if report['error']:
+        print(f"Import failed: {report['error']}")
+    for entry in sorted(report['modules'], key=lambda entry: -entry['cumulative_ms'])[:limit]:
+        print(f"| {entry['module'].ljust(40)} self: {entry['self_ms']:8.2f}ms | cumulative: {entry['cumulative_ms']:8.2f}ms |")
+    print(f"Audio packages imported at startup: {', '.join(report['audio_imported']) or 'none'}")
+
+
+
+if __name__ == '__main__':
+    # Usage: python -m hangman_pkg.startup [TARGET] [--budget MS] [--json OUT]
+    parser = argparse.ArgumentParser(description="Profiles the import time of the hangman application.")
+    parser.add_argument("target", nargs="?", default="app", help="module to import (default: app)")
+    parser.add_argument("--budget", type=float, help="fail if the total import time exceeds this many milliseconds")
+    parser.add_argument("--limit", type=int, default=15, help="number of modules to list")
+    parser.add_argument("--json", help="write the profile to this file")
+    args = parser.parse_args(sys.argv[1:])
+
+    report = profile_imports(args.target)
+    show_report(report, args.limit)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if not report['successful']:
+        sys.exit(2)
+    if args.budget is not None and report['total_ms'] > args.budget:
+        print(f"Startup budget exceeded: {report['total_ms']:.1f}ms > {args.budget:.1f}ms")
+        sys.exit(1)
@@ -0,0 +1,123 @@
+import time
+from collections import deque
+
+
+#========================================
+# RUNNING AGGREGATES
+#========================================
+
+class ModeStats:
+    """Running gameplay statistics for one game mode, updated in O(1) as each 'Outcome' is recorded.
+
+    Attributes
+    ----------
+    games : int
+        The number of games played.
+    wins : int
+        The number of games won.
+    streak : int
+        The number of consecutive wins up to the most recent game.
+    best_streak : int
+        The longest run of consecutive wins.
+    total_duration : float
+        The combined duration of every game, in seconds.
+    total_tries : int
+        The combined number of guesses of every game.
+    window : int, default = 10
+        The number of most recent games covered by the `recent_*` statistics.
+    period : float, default = 3600
+        The number of seconds covered by the `period_*` statistics.
+    """
+    def __init__(self, window:int=10, period:float=3600):
+        self.games = 0
+        self.wins = 0
+        self.streak = 0
+        self.best_streak = 0
+        self.total_duration = 0.0
+        self.total_tries = 0
+        self.window = window
+        self.period = period
+        self._recent = deque(maxlen=window)     # <-- ring buffer of results
+        self._recent_wins = 0
+        self._timeline = deque()                # <-- (timestamp, is_victorious) within `period`
+        self._period_wins = 0
+
+    def __repr__(self):
+        param_str = ", ".join(f"{k}='{v}'" for k,v in self.report().items())
+        return f"{self.__class__.__name__}({param_str})"
+
+    def record(self, outcome_obj):
+        """Adds the result of an 'Outcome' object to every running aggregate."""
+        won = bool(outcome_obj.is_victorious)
+        self.games += 1
+        self.wins += won
+        self.streak = self.streak + 1 if won else 0
+        self.best_streak = max(self.best_streak, self.streak)
+        self.total_duration += outcome_obj.duration
+        self.total_tries += outcome_obj.tries
+
+        if len(self._recent) == self._recent.maxlen:
+            self._recent_wins -= self._recent[0]
+        self._recent.append(won)
+        self._recent_wins += won
+
+        self._timeline.append((outcome_obj.timestamp.timestamp(), won))
+        self._period_wins += won
+        self._trim()
+
+    def _trim(self, now=None):
+        """Drops results older than `period` from the time window."""
+        cutoff = (time.time() if now is None else now) - self.period
+        while self._timeline and self._timeline[0][0] < cutoff:
+            self._period_wins -= self._timeline.popleft()[1]
+
+    @property
+    def win_rate(self):
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def mean_duration(self):
+        return self.total_duration / self.games if self.games else 0.0
+
+    @property
+    def mean_tries(self):
+        return self.total_tries / self.games if self.games else 0.0
+
+    @property
+    def recent_games(self):
+        return len(self._recent)
+
+    @property
+    def recent_wins(self):
+        return self._recent_wins
+
+    @property
+    def period_games(self):
+        self._trim()
+        return len(self._timeline)
+
+    @property
+    def period_wins(self):
+        self._trim()
+        return self._period_wins
+
+    def report(self):
+        """Returns a dictionary of every aggregate."""
+        return {
+            'games': self.games,
+            'wins': self.wins,
+            'win_rate': round(self.win_rate, 3),
+            'streak': self.streak,
+            'best_streak': self.best_streak,
+            'mean_duration': round(self.mean_duration, 1),
+            'mean_tries': round(self.mean_tries, 1),
+            'recent_wins': self.recent_wins,
+            'recent_games': self.recent_games,
+            'period_wins': self.period_wins,
+            'period_games': self.period_games,
+        }
+
+
+
+if __name__ == '__main__':
+    pass
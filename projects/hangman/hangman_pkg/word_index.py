@@ -0,0 +1,284 @@
+import os
+import sys
+import mmap
+import struct
+import random
+import threading
+
+
+#========================================
+# INDEX CONFIGURATION
+#========================================
+
+DICTIONARY_PATH = os.environ.get("HANGMAN_DICTIONARY", "/usr/share/dict/words")
+INDEX_DIR = os.environ.get(
+    "HANGMAN_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "hangman"))
+
+MAGIC = b"HMWI"
+VERSION = 1
+MAX_LENGTH = 255        # <-- longer words share the last length bucket
+CLASSES = 2             # <-- 0: lowercase first letter, 1: everything else
+
+# magic, version, source size, source mtime (ns), word count
+HEADER = struct.Struct("<4sIQQI")
+BUCKETS = CLASSES * (MAX_LENGTH + 1) + 1
+
+
+def _letter_class(word):
+    """Returns the first-letter class of a word (0 if it begins with a lowercase letter, 1 otherwise)."""
+    return 0 if word[0].islower() else 1
+
+def _bucket(word_class, length):
+    """Returns the bucket number for a word class and word length."""
+    return word_class * (MAX_LENGTH + 1) + min(length, MAX_LENGTH)
+
+
+#========================================
+# WORD INDEX
+#========================================
+
+class WordView:
+    """A read-only, list-like window over a contiguous range of words in a 'WordIndex'.
+
+    The view supports `len()` and indexing, so it can be handed to `random.choice` without materializing the words it covers. A view reads from the mapping of the index that it was taken from, so a concurrent rebuild never closes the map under it; once the index is remapped, the view is stale (see `is_current`).
+
+    Attributes
+    ----------
+    index : WordIndex
+        The index that owns the words.
+    start : int
+        The position of the first word in the view.
+    stop : int
+        The position after the last word in the view.
+    generation : int
+        The load of the index that the view was taken from.
+    """
+    def __init__(self, index, start:int, stop:int, mapping=None):
+        self.index = index
+        self.start = start
+        self.stop = stop
+        self._mapping = mapping or index._mapping
+        self.generation = self._mapping.generation
+
+    def __len__(self):
+        return max(self.stop - self.start, 0)
+
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("word view index out of range")
+        return self._mapping.word_at(self.start + idx)
+
+    def __iter__(self):
+        word_at = self._mapping.word_at
+        for pos in range(self.start, self.stop):
+            yield word_at(pos)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(start='{self.start}', stop='{self.stop}', generation='{self.generation}')"
+
+    def is_current(self):
+        """Indicates whether the view still points into the mapped index, reloading the index first if its source changed."""
+        try:
+            self.index.open()
+        except OSError:
+            return False
+        return self.generation == self.index.generation
+
+
+class _Mapping:
+    """One load of an index file: the memory map and the tables parsed from its header.
+
+    A mapping is never modified or closed explicitly. When the index is remapped, the old mapping stays valid for the views that still hold it, and is unmapped once the last of them is garbage collected.
+    """
+    __slots__ = ("file", "map", "stamp", "buckets", "offsets_at", "strings_at", "generation")
+
+    def __init__(self, f, mapped, stamp, buckets, offsets_at, strings_at, generation):
+        self.file = f
+        self.map = mapped
+        self.stamp = stamp
+        self.buckets = buckets
+        self.offsets_at = offsets_at
+        self.strings_at = strings_at
+        self.generation = generation
+
+    def word_at(self, pos:int):
+        start, stop = struct.unpack_from("<II", self.map, self.offsets_at + 4 * pos)
+        return self.map[self.strings_at + start:self.strings_at + stop].decode("utf-8")
+
+
+class WordIndex:
+    """A compact, memory-mapped index of a word list, bucketed by first-letter class and word length.
+
+    Words are stored sorted by (class, length), so every "lowercase words with at least N letters" query resolves to a single contiguous range that is located with two table lookups.
+
+    File Layout
+    -----------
+    header : HEADER
+        Magic number, format version, and the size/mtime of the source file the index was built from.
+    buckets : uint32[BUCKETS]
+        The position of the first word in each (class, length) bucket, followed by the total word count.
+    offsets : uint32[count + 1]
+        The byte offset of each word in the string table.
+    strings : bytes
+        The UTF-8 encoded words, concatenated.
+
+    Attributes
+    ----------
+    source : str
+        The path to the plain-text word list.
+    path : str
+        The path to the on-disk index file.
+    generation : int
+        The number of times the index file has been mapped. Views taken before the latest load are stale.
+    """
+    def __init__(self, source=DICTIONARY_PATH, path=None):
+        """Constructor method for the 'WordIndex' class.
+
+        Parameters
+        ----------
+        source : str, default = DICTIONARY_PATH
+            The path to the plain-text word list (one word per line).
+        path : str, optional
+            The path to the index file. Defaults to a file in `INDEX_DIR` named after `source`.
+        """
+        self.source = source
+        self.path = path or os.path.join(
+            INDEX_DIR, os.path.abspath(source).strip(os.sep).replace(os.sep, "_") + ".idx")
+        self._lock = threading.Lock()
+        self._mapping = None    # <-- replaced as a whole, so readers never see a half-updated index
+        self.generation = 0
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(source='{self.source}', path='{self.path}')"
+
+    def _source_stamp(self):
+        """Returns the (size, mtime) pair of the source word list."""
+        stat = os.stat(self.source)
+        return stat.st_size, stat.st_mtime_ns
+
+    def build(self):
+        """Reads the source word list and writes a fresh index file. Returns the number of indexed words."""
+        stamp = self._source_stamp()
+        with open(self.source, "r") as f:
+            words = [word for word in f.read().split("\n") if word]
+        words.sort(key=lambda word: _bucket(_letter_class(word), len(word)))
+
+        buckets = [0] * BUCKETS
+        for word in words:
+            buckets[_bucket(_letter_class(word), len(word)) + 1] += 1
+        for idx in range(1, BUCKETS):
+            buckets[idx] += buckets[idx - 1]
+
+        encoded = [word.encode("utf-8") for word in words]
+        offsets = [0] * (len(encoded) + 1)
+        for idx, raw in enumerate(encoded):
+            offsets[idx + 1] = offsets[idx] + len(raw)
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, stamp[0], stamp[1], len(words)))
+            f.write(struct.pack(f"<{BUCKETS}I", *buckets))
+            f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+            f.write(b"".join(encoded))
+        os.replace(tmp_path, self.path)  # <-- atomic swap for concurrent readers
+        return len(words)
+
+    def _load(self):
+        """Memory-maps the index file. Returns False if it is missing, corrupt, or stale."""
+        try:
+            f = open(self.path, "rb")
+        except OSError:
+            return False
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # <-- empty file
+            f.close()
+            return False
+        try:
+            magic, version, size, mtime, count = HEADER.unpack_from(mapped, 0)
+            if magic != MAGIC or version != VERSION or (size, mtime) != self._source_stamp():
+                raise ValueError("stale index")
+            buckets = struct.unpack_from(f"<{BUCKETS}I", mapped, HEADER.size)
+            offsets_at = HEADER.size + 4 * BUCKETS
+            strings_at = offsets_at + 4 * (count + 1)
+            if buckets[-1] != count or len(mapped) < strings_at or list(buckets) != sorted(buckets):
+                raise ValueError("corrupt index")
+            string_bytes, = struct.unpack_from("<I", mapped, offsets_at + 4 * count)
+            if len(mapped) != strings_at + string_bytes:  # <-- truncated
+                raise ValueError("corrupt index")
+        except (struct.error, ValueError):
+            mapped.close()
+            f.close()
+            return False
+        self.generation += 1
+        self._mapping = _Mapping(f, mapped, (size, mtime), buckets, offsets_at, strings_at, self.generation)
+        return True
+
+    def _open(self):
+        """Ensures an up-to-date index is mapped (see `open`), and returns its mapping."""
+        with self._lock:
+            mapping = self._mapping
+            if mapping is not None and mapping.stamp == self._source_stamp():
+                return mapping
+            if not self._load():
+                self.build()
+                if not self._load():
+                    raise OSError(f"Unable to load the word index at {self.path}")
+            return self._mapping
+
+    def open(self):
+        """Ensures an up-to-date index is mapped, rebuilding it when the source file's size or mtime changed."""
+        self._open()
+        return self
+
+    def close(self):
+        """Releases the index's mapping. Views taken from it keep it open until they are garbage collected."""
+        with self._lock:
+            self._mapping = None
+
+    def word_at(self, pos:int):
+        """Returns the word stored at position `pos` of the index."""
+        return self._open().word_at(pos)
+
+    def words(self, min_word_length:int=0, word_class:int=0):
+        """Returns a 'WordView' of every word in `word_class` with at least `min_word_length` letters.
+
+        Words longer than `MAX_LENGTH` share the last length bucket, so a `min_word_length` above it returns an empty view rather than shorter words.
+        """
+        mapping = self._open()  # <-- one consistent load, even if another thread remaps the index
+        stop = mapping.buckets[_bucket(word_class + 1, 0)]
+        if min_word_length > MAX_LENGTH:
+            return WordView(self, stop, stop, mapping)
+        start = mapping.buckets[_bucket(word_class, min_word_length)]
+        return WordView(self, start, stop, mapping)
+
+    def random_word(self, min_word_length:int=0, word_class:int=0):
+        """Returns a random word with at least `min_word_length` letters, or None if there is none."""
+        view = self.words(min_word_length, word_class)
+        return random.choice(view) if view else None
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+def get_index(source=None):
+    """Returns the shared, opened 'WordIndex' for a word list (by default, `DICTIONARY_PATH`), building it on first use."""
+    source = source or DICTIONARY_PATH
+    with _indexes_lock:
+        index = _indexes.get(source)
+        if index is None:
+            index = _indexes[source] = WordIndex(source)
+    return index.open()
+
+
+
+if __name__ == '__main__':
+    # Usage: python -m hangman_pkg.word_index [build] [SOURCE]
+    args = sys.argv[1:]
+    if args and args[0] == "build":
+        args = args[1:]
+    index = WordIndex(args[0] if args else DICTIONARY_PATH)
+    print(f"Indexed {index.build()} words from {index.source} into {index.path}")
@@ -0,0 +1,203 @@
+import os
+import sys
+import bz2
+import gzip
+import lzma
+import random
+
+
+#========================================
+# WORD SOURCE PLUGINS
+#========================================
+
+class WordSource:
+    """The base class for a source of candidate target words.
+
+    A source yields words as a stream, and `choose` selects one of them with single-pass reservoir sampling, so a corpus of any size is handled in constant memory. Subclasses that set `name` are registered automatically and can be selected through `Mode.source`.
+
+    Class Variables
+    ---------------
+    name : str or None
+        The identifier used for `Mode.source`. Sources without a name are not registered.
+    sources : dict
+        A registry of every named 'WordSource' subclass.
+
+    Methods
+    -------
+    stream()
+        Yields every word offered by the source.
+    choose(min_word_length)
+        Returns a random word that passes the length filter, or None if there is none.
+    """
+    name = None
+    sources = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.name:
+            WordSource.sources[cls.name] = cls
+
+    def __repr__(self):
+        param_str = ", ".join(f"{k}='{v}'" for k,v in vars(self).items())
+        return f"{self.__class__.__name__}({param_str})"
+
+    @classmethod
+    def from_mode(cls, mode_obj):
+        """Returns a source configured for a 'Mode' instance."""
+        return cls()
+
+    @classmethod
+    def for_mode(cls, mode_obj):
+        """Returns the source selected by `mode_obj.source`, or None if the mode uses the default words.
+
+        `mode_obj.source` may be the name of a registered source, or the path to a word corpus file.
+        """
+        if not mode_obj.source:
+            return None
+        if mode_obj.source in cls.sources:
+            return cls.sources[mode_obj.source].from_mode(mode_obj)
+        if os.path.isfile(mode_obj.source):
+            return FileSource.from_mode(mode_obj)
+        return None
+
+    def stream(self):
+        """Yields every word offered by the source."""
+        raise NotImplementedError
+
+    def is_candidate(self, word, min_word_length):
+        """Indicates whether a word is long enough and begins with a lowercase letter."""
+        return len(word) >= min_word_length and word[:1].islower()
+
+    def choose(self, min_word_length:int=0, rng=random):
+        """Selects a random word from the stream with reservoir sampling, applying the length filter inline.
+
+        Parameters
+        ----------
+        min_word_length : int, default = 0
+            The minimum number of letters in the selected word.
+        rng : random.Random, default = random
+            The random number generator.
+
+        Returns
+        -------
+        str or None
+            A uniformly selected candidate word, or None if the stream has no candidates.
+        """
+        choice = None
+        seen = 0
+        for word in self.stream():
+            if not self.is_candidate(word, min_word_length):
+                continue
+            seen += 1
+            if rng.randrange(seen) == 0:
+                choice = word
+        return choice
+
+
+class ListSource(WordSource):
+    """A word source backed by an in-memory sequence of words."""
+    def __init__(self, words):
+        self.words = words
+
+    def stream(self):
+        yield from self.words
+
+
+class FileSource(WordSource):
+    """A word source that streams one word per line from a text file, which may be compressed.
+
+    The source has no name: it is selected by setting `Mode.source` to the path of the corpus.
+
+    Attributes
+    ----------
+    path : str
+        The path to the word corpus. Files ending in `.gz`, `.xz`/`.lzma` or `.bz2` are decompressed on the fly.
+    encoding : str, default = "utf-8"
+        The text encoding of the corpus.
+    fallback : WordSource or None, default = None
+        The source that `choose` uses instead if the corpus cannot be read (e.g. it was deleted, or a compressed file is corrupt).
+    """
+    OPENERS = {
+        ".gz": gzip.open,
+        ".xz": lzma.open,
+        ".lzma": lzma.open,
+        ".bz2": bz2.open,
+    }
+    READ_ERRORS = (OSError, EOFError, lzma.LZMAError)  # <-- gzip and bz2 errors are OSError or EOFError
+
+    def __init__(self, path, encoding="utf-8", fallback=None):
+        self.path = path
+        self.encoding = encoding
+        self.fallback = fallback
+
+    @classmethod
+    def from_mode(cls, mode_obj):
+        return cls(mode_obj.source, fallback=DictionarySource(mode_obj))
+
+    def _open(self):
+        opener = self.OPENERS.get(os.path.splitext(self.path)[1].lower(), open)
+        return opener(self.path, "rt", encoding=self.encoding, errors="replace")
+
+    def stream(self):
+        with self._open() as f:
+            for line in f:
+                word = line.strip()
+                if word:
+                    yield word
+
+    def choose(self, min_word_length:int=0, rng=random):
+        """Selects a random word from the corpus (see 'WordSource.choose'). If the corpus cannot be read, selects from `fallback` instead, or returns None without one."""
+        try:
+            return super().choose(min_word_length, rng)
+        except self.READ_ERRORS as exc:
+            if self.fallback is None:
+                return None
+            print(f"Unable to read the word corpus {self.path} ({exc}). Using the {self.fallback.name} instead.", file=sys.stderr)
+            return self.fallback.choose(min_word_length, rng)
+
+
+class DictionarySource(WordSource):
+    """The local system dictionary, served from the shared word index and cache of a 'Mode'.
+
+    The index already stores words bucketed by length, so `choose` is a constant-time pick rather than a scan, unless it is asked for words longer than the mode's own `min_word_length`.
+    """
+    name = "dictionary"
+
+    def __init__(self, mode_obj):
+        self.mode = mode_obj
+
+    @classmethod
+    def from_mode(cls, mode_obj):
+        return cls(mode_obj)
+
+    def stream(self):
+        yield from self.mode._get_from_dictionary() or ()
+
+    def choose(self, min_word_length:int=0, rng=random):
+        if min_word_length > self.mode.min_word_length:
+            return super().choose(min_word_length, rng)  # <-- the cached words only meet the mode's minimum
+        words = self.mode._get_from_dictionary()
+        return rng.choice(words) if words else None
+
+
+class SpeechSource(WordSource):
+    """The words recognized from a recording of the user's speech."""
+    name = "speech"
+
+    def __init__(self, mode_obj):
+        self.mode = mode_obj
+
+    @classmethod
+    def from_mode(cls, mode_obj):
+        return cls(mode_obj)
+
+    def stream(self):
+        yield from self.mode._get_from_speech() or ()
+
+    def is_candidate(self, word, min_word_length):
+        return len(word) >= min_word_length
+
+
+
+if __name__ == '__main__':
+    pass
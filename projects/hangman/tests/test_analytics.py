@@ -0,0 +1,56 @@
+import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from hangman_pkg import analytics
+from hangman_pkg.analytics import OutcomeColumns
+
+
+def outcome(game_mode, word, is_victorious, hits="", misses=""):
+    return SimpleNamespace(
+        timestamp=datetime.datetime(2024, 1, 1), is_victorious=is_victorious, game_mode=game_mode,
+        target_word=word, tries=len(hits) + len(misses), duration=10.0, hits=list(hits), misses=list(misses))
+
+@pytest.fixture(params=["numpy", "python"])
+def batch(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(analytics, "np", None)
+    return OutcomeColumns().extend([
+        outcome("Easy", "apple", True, "aple", "z"),
+        outcome("Hard", "banana", False, "a", "xyz"),
+        outcome("Easy", "cherry", False, "c", "q"),
+        outcome("Easy", "grape", True, "grape"),
+    ])
+
+
+def test_win_rate_by_length(batch):
+    assert batch.win_rate_by_length() == {5: (1.0, 2), 6: (0.0, 2)}
+
+def test_win_rate_of_one_mode(batch):
+    assert batch.win_rate_by_length("Hard") == {6: (0.0, 1)}
+    assert batch.win_rate_by_length("Easy") == {5: (1.0, 2), 6: (0.0, 1)}
+    assert batch.win_rate_by_length("Unknown") == {}
+
+def test_round_trip(batch, tmp_path):
+    path = str(tmp_path / "outcomes.hmc")
+    batch.write(path)
+    assert OutcomeColumns.read(path).win_rate_by_length("Easy") == batch.win_rate_by_length("Easy")
+
+def test_masks_are_four_bytes(batch):
+    for name in ("word_code", "hit_mask", "miss_mask"):
+        assert batch.columns[name].itemsize == 4
+    assert batch.hardest_letters(2) == [("z", 1.0, 2), ("q", 1.0, 1)]
+
+def test_truncated_file_is_rejected(batch, tmp_path):
+    path = tmp_path / "outcomes.hmc"
+    batch.write(str(path))
+    data = path.read_bytes()
+    path.write_bytes(data[:-1])     # <-- the last column loses a byte
+    with pytest.raises(ValueError, match="truncated: column `miss_mask` has 3 of 4 rows"):
+        OutcomeColumns.read(str(path))
+    path.write_bytes(data[:-4 * 4])
+    with pytest.raises(ValueError, match="`miss_mask` has 0 of 4 rows"):
+        OutcomeColumns.read(str(path))
@@ -0,0 +1,44 @@
+import pytest
+
+from hangman_pkg import benchmark
+from hangman_pkg.benchmark import BENCHMARKS, compare, run_benchmarks, show_report
+
+
+def report(**medians):
+    return {'python': "3.9", 'platform': "test", 'benchmarks': {
+        name: {'min_us': median, 'median_us': median, 'mean_us': median, 'rounds': 1, 'calls': 1} for name, median in medians.items()}}
+
+
+def test_run_benchmarks_times_each_operation(monkeypatch):
+    calls = []
+    monkeypatch.setitem(BENCHMARKS, "counted", (lambda: lambda: calls.append(None), 4))
+    result = run_benchmarks(["counted"], repeat=3, min_time=0.001)
+    timing = result['benchmarks']['counted']
+    assert list(result['benchmarks']) == ["counted"]
+    assert timing['rounds'] == 3 and timing['calls'] >= 1
+    assert 0 < timing['min_us'] <= timing['median_us']
+    assert len(calls) >= 3 * timing['calls']    # <-- calibration calls come on top of the timed rounds
+
+@pytest.mark.parametrize("name", ["grade_guess", "show_board_diff"])
+def test_registered_benchmarks_run(name):
+    timing = run_benchmarks([name], repeat=1, min_time=0.001)['benchmarks'][name]
+    assert timing['median_us'] > 0
+
+def test_compare_flags_regressions():
+    rows = compare(report(fast=1.0, slow=2.0, new=1.0), report(fast=1.0, slow=1.0, gone=1.0), threshold=0.25)
+    assert rows == [("fast", 1.0, 1.0, 1.0, False), ("slow", 1.0, 2.0, 2.0, True)]
+    assert compare(report(fast=1.2), report(fast=1.0))[0][-1] is False  # <-- within the threshold
+
+def test_show_report(capsys):
+    current, baseline = report(slow=2.0), report(slow=1.0)
+    show_report(current, compare(current, baseline))
+    out = capsys.readouterr().out
+    assert "Python 3.9 | test" in out
+    assert "Baseline comparison:" in out and "( 2.00x)  REGRESSION" in out
+
+def test_benchmark_decorator_registers(monkeypatch):
+    monkeypatch.setattr(benchmark, "BENCHMARKS", {})
+    @benchmark.benchmark("example", inner=10)
+    def setup():
+        return lambda: None
+    assert benchmark.BENCHMARKS == {"example": (setup, 10)}
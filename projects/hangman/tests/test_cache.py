@@ -0,0 +1,47 @@
+import os
+
+from hangman_pkg.cache import WordCache
+from hangman_pkg.word_index import WordIndex
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction():
+    cache = WordCache(max_entries=2, ttl=None)
+    cache.put("a", [1])
+    cache.put("b", [2])
+    cache.get("a")
+    cache.put("c", [3])
+    assert cache.get("b") is None
+    assert cache.get("a") == [1] and cache.get("c") == [3]
+    assert cache.stats()['evictions'] == 1
+
+def test_entries_expire():
+    clock = Clock()
+    cache = WordCache(ttl=10, clock=clock)
+    cache.put("a", [1])
+    clock.now = 9
+    assert cache.get("a") == [1]
+    clock.now = 10
+    assert cache.get("a") is None
+
+def test_rebuilt_index_invalidates_its_views(tmp_path):
+    source = tmp_path / "words"
+    source.write_text("apple\nbanana\n")
+    os.utime(source, ns=(10**18, 10**18))
+    index = WordIndex(str(source), str(tmp_path / "words.idx"))
+    cache = WordCache(ttl=None)
+    key = (None, 0, None)
+    assert sorted(cache.get_or_load(key, lambda: index.words(0))) == ["apple", "banana"]
+
+    source.write_text("cherry\ndamson\nelderberry\n")
+    os.utime(source, ns=(2 * 10**18, 2 * 10**18))
+    words = cache.get_or_load(key, lambda: index.words(0))
+    assert sorted(words) == ["cherry", "damson", "elderberry"]   # <-- not a view into the closed map
+    assert cache.stats()['misses'] == 2
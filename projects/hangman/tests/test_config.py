@@ -0,0 +1,62 @@
+import io
+import os
+import sys
+import threading
+
+import pytest
+
+from hangman_pkg import config
+
+
+class Stream(io.StringIO):
+    def __init__(self, tty):
+        super().__init__()
+        self.tty = tty
+
+    def isatty(self):
+        return self.tty
+
+@pytest.fixture
+def attended(monkeypatch):
+    monkeypatch.setattr(config, "HEADLESS", False)
+
+
+def test_is_interactive(attended):
+    assert config.is_interactive(Stream(True))
+    assert not config.is_interactive(Stream(False))
+    assert not config.is_interactive(object())      # <-- no isatty
+    closed = io.StringIO()
+    closed.close()
+    assert not config.is_interactive(closed)      # <-- isatty raises ValueError
+
+def test_headless_is_never_interactive(monkeypatch):
+    monkeypatch.setattr(config, "HEADLESS", True)
+    assert not config.is_interactive(Stream(True))
+
+def test_pause_is_skipped_without_a_terminal(attended, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "stdin", Stream(False))
+    monkeypatch.setattr(config, "_wait_for_key", lambda timeout: pytest.fail("waited for a key"))
+    assert config.pause(5) is False
+    assert capsys.readouterr().out == ""
+
+def test_pause_waits_for_a_key(attended, monkeypatch, capsys):
+    waits = []
+    monkeypatch.setattr(sys, "stdin", Stream(True))
+    monkeypatch.setattr(config, "_wait_for_key", lambda timeout: waits.append(timeout) or True)
+    assert config.pause(2.5, "Continue?") is True
+    assert waits == [2.5]
+    assert capsys.readouterr().out == "Continue?\n"
+
+@pytest.mark.skipif(os.name == "nt", reason="needs a pseudo-terminal")
+def test_wait_for_key_on_a_terminal(monkeypatch):
+    pty = pytest.importorskip("pty")
+    master, slave = pty.openpty()
+    with os.fdopen(slave, "r") as stdin:
+        monkeypatch.setattr(sys, "stdin", stdin)
+        assert config._wait_for_key(0.05) is False
+        key = threading.Timer(0.1, os.write, (master, b"\x1b[A"))  # <-- an arrow key: one keypress, several bytes
+        key.start()
+        assert config._wait_for_key(5) is True
+        key.join()
+        assert config._wait_for_key(0.05) is False
+    os.close(master)
@@ -0,0 +1,36 @@
+import datetime
+import threading
+from types import SimpleNamespace
+
+from hangman_pkg.context import GameContext, OutcomeBuffer
+
+
+def test_threads_spread_across_shards():
+    buffer = OutcomeBuffer(maxlen=100, shards=4)
+    barrier = threading.Barrier(4)
+    def append(idx):
+        barrier.wait()  # <-- every thread is alive at once, so none reuses another's ident
+        buffer.append(SimpleNamespace(timestamp=idx))
+    threads = [threading.Thread(target=append, args=(idx,)) for idx in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [len(shard) for shard in buffer._shards] == [1, 1, 1, 1]
+    assert [outcome.timestamp for outcome in buffer.recent()] == [0, 1, 2, 3]
+
+def test_recent_is_bounded_and_ordered():
+    buffer = OutcomeBuffer(maxlen=3, shards=2)
+    for idx in range(5):
+        buffer.append(SimpleNamespace(timestamp=idx))
+    assert [outcome.timestamp for outcome in buffer.recent()] == [2, 3, 4]
+    assert len(buffer) == 3
+
+def test_context_history_keeps_only_the_last_100_outcomes():
+    context = GameContext(store=None)
+    start = datetime.datetime(2024, 1, 1)
+    for idx in range(150):
+        context.record(SimpleNamespace(game_mode="easy", is_victorious=True, duration=1.0, tries=1, timestamp=start + datetime.timedelta(seconds=idx)))
+    assert len(context.history) == 100
+    assert context.history.recent()[0].timestamp == start + datetime.timedelta(seconds=50)
+    assert context.stats["easy"].games == 150   # <-- the statistics still cover every game
@@ -0,0 +1,54 @@
+import os
+import sys
+import subprocess
+
+import pytest
+
+from hangman_pkg import difficulty, word_index
+from hangman_pkg.cache import WordCache
+from hangman_pkg.context import GameContext
+from hangman_pkg.game_objects import Mode
+from hangman_pkg.difficulty import build_tiers, load_manifest, tier_words
+from hangman_pkg.solver import load_corpus
+
+WORDS = ["jazz", "fuzz", "buzz", "jinx", "quiz", "zephyr", "rhythm", "sphinx", "banana", "apple", "orange", "lemon"]
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    monkeypatch.setattr(word_index, "INDEX_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(difficulty, "TIER_DIR", str(tmp_path / "cache" / "difficulty"))
+    path = tmp_path / "words"
+    path.write_text("\n".join(WORDS) + "\n")
+    monkeypatch.setattr(word_index, "DICTIONARY_PATH", str(path))
+    return str(path)
+
+
+def test_scores_against_the_selected_source(source):
+    assert set(load_corpus(source)[6]) >= {"zephyr", "rhythm", "sphinx", "banana", "orange"}
+    rows = difficulty.score_words(WORDS, "solver", workers=0, source=source)
+    assert [row[0] for row in rows] == WORDS
+    assert all(0 <= row[3] <= 6 for row in rows)    # <-- misses are capped by the game's error limit
+
+def test_build_tiers(source):
+    manifest = build_tiers(source, ("easy", "hard"), workers=0)
+    assert load_manifest(source) == manifest
+    assert sum(info['words'] for info in manifest['tiers'].values()) == len(WORDS)
+    tiers = [set(tier_words(tier, 0, source)) for tier in ("easy", "hard")]
+    assert tiers[0] | tiers[1] == set(WORDS) and not tiers[0] & tiers[1]
+
+def test_missing_tier_is_not_cached_as_the_tier(source, capsys):
+    mode = Mode(name="easy", source="dictionary", min_word_length=3, difficulty="easy", context=GameContext(store=None))
+    mode.word_cache = WordCache()
+    assert sorted(mode._get_from_dictionary()) == sorted(WORDS)    # <-- the whole dictionary, with a warning
+    assert "easy" in capsys.readouterr().err
+
+    build_tiers(source, ("easy", "hard"), workers=0)
+    easy = set(mode._get_from_dictionary())
+    assert easy == set(tier_words("easy", 3, source)) and len(easy) < len(WORDS)
+
+def test_games_do_not_import_multiprocessing():
+    code = "import sys, hangman_pkg.game_objects; print('multiprocessing' in sys.modules, 'concurrent.futures' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert result.stdout.split() == ["False", "False"]
@@ -0,0 +1,53 @@
+import pytest
+
+from hangman_pkg import difficulty, word_index
+from hangman_pkg.cache import word_cache
+from hangman_pkg.context import default_context
+from hangman_pkg.driver import run_session, run_sessions
+from hangman_pkg.inputs import FuzzInput, ReplayInput
+
+WORDS = ["abbreviation", "battleground", "candlelight", "daydreaming", "earthenware", "fingerprints"]
+
+
+@pytest.fixture(autouse=True)
+def dictionary(tmp_path, monkeypatch):
+    """Plays every session against a small dictionary of its own."""
+    monkeypatch.setattr(word_index, "INDEX_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(difficulty, "TIER_DIR", str(tmp_path / "cache" / "difficulty"))
+    path = tmp_path / "words"
+    path.write_text("\n".join(WORDS) + "\n")
+    monkeypatch.setattr(word_index, "DICTIONARY_PATH", str(path))
+    word_cache.invalidate()
+    yield
+    word_cache.invalidate()
+
+def target_words(games):
+    return [outcome_obj.target_word for outcome_obj in default_context.history.recent()[-games:]] if games else []
+
+
+def test_end_option_exits():
+    result = run_session(ReplayInput(["3"], record=True))
+    assert result['status'] == "exit" and result['successful']
+    assert result['games'] == 0 and result['inputs'] == 1
+
+def test_script_that_runs_out_is_a_divergence():
+    result = run_session(ReplayInput(["1"]))
+    assert result['status'] == "exhausted" and not result['successful']
+    assert "ended after 1 lines" in result['error']
+
+def test_seeded_session_replays_the_same_games():
+    fuzz = FuzzInput(seed=4, max_inputs=300)     # <-- a session that plays several games before choosing END
+    first = run_session(fuzz, seed=4, allow_exhausted=True)
+    assert first['successful'] and first['games'] > 1, first['error']
+    words = target_words(first['games'])
+
+    replay = run_session(ReplayInput(fuzz.lines, record=True), seed=4, allow_exhausted=True)
+    assert (replay['status'], replay['games'], replay['inputs']) == (first['status'], first['games'], first['inputs'])
+    assert target_words(replay['games']) == words
+
+def test_sessions_are_not_persisted(monkeypatch):
+    monkeypatch.setattr(default_context, "store", "unchanged")
+    report = run_sessions("fuzz", sessions=3, seed=0, max_inputs=100)
+    assert report['sessions'] == 3 and not report['failures']
+    assert sum(report['statuses'].values()) == 3
+    assert default_context.store == "unchanged"     # <-- restored after each session
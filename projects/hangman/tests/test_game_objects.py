@@ -0,0 +1,150 @@
+import io
+
+import pytest
+
+from hangman_pkg.context import GameContext
+from hangman_pkg.game_objects import LETTER_BITS, Guess, Mode
+from hangman_pkg.inputs import ReplayInput, use_provider
+from hangman_pkg.render import BoardRenderer, board_lines
+
+
+def game(word, **kwargs):
+    """Returns a mode with `word` as its target word, recording into a context of its own."""
+    mode = Mode(name="test", context=GameContext(store=None), **kwargs)
+    mode._word = word
+    mode._index_word()
+    return mode
+
+def guess(mode, g, value):
+    g.value = value
+    return mode._grade_guess(g)
+
+
+def test_correct_letter_reveals_every_position():
+    mode, g = game("banana"), Guess()
+    assert guess(mode, g, "a")
+    assert mode._revealed == 0b101010 and mode._unrevealed == 0b010101
+    assert g._hit_string(mode._word, mode._blanks, mode._revealed) == "_ A _ A _ A"
+    assert g.hits == ["a"] and g.misses == [] and g.miss_count == 0
+
+def test_incorrect_letter_is_a_miss():
+    mode, g = game("banana"), Guess()
+    assert not guess(mode, g, "z")
+    assert mode._revealed == 0 and mode._unrevealed == 0b111111
+    assert g.misses == ["z"] and g.miss_count == 1 and g.miss_string() == "Z"
+
+def test_repeated_guess_is_rejected(capsys):
+    mode, g = game("banana"), Guess()
+    guess(mode, g, "a")
+    guess(mode, g, "z")
+    for value in ("a", "z"):
+        g.value = value
+        assert not g._is_unique
+    g.value = "n"
+    assert g._is_unique
+    assert capsys.readouterr().out.count("You already used this guess.") == 2
+
+def test_whole_word_guesses():
+    mode, g = game("banana"), Guess()
+    assert not guess(mode, g, "bandan")
+    assert g.misses == ["bandan"] and g.miss_count == 1
+    guess(mode, g, "n")
+    assert guess(mode, g, "banana")
+    assert mode._unrevealed == 0 and mode._revealed == 0b101011     # <-- only the positions the word revealed
+    assert g.hits == list("banana") and g.attempts == ["bandan", "n", "banana"]
+
+def test_guesses_must_be_a_letter_or_the_word_length():
+    g = Guess()
+    for value, is_valid in (("a", True), ("banana", True), ("ban", False), ("1", False), ("", False)):
+        g.value = value
+        assert g._is_valid("banana") == is_valid
+
+@pytest.mark.parametrize("inputs, is_victorious, misses", [
+    (["n", "x", "a", "b"], True, 1),
+    (["q", "w", "e", "r", "t", "y"], False, 6),
+    (["a", "a", "banana"], True, 0),    # <-- the repeated "a" is asked again, not graded
+])
+def test_play(inputs, is_victorious, misses, capsys):
+    mode = game("banana")
+    with use_provider(ReplayInput(inputs)):
+        g = mode.play()
+    assert mode.is_victorious == is_victorious
+    assert g.miss_count == misses
+    out = capsys.readouterr().out
+    assert out.count("Word:") == len(set(inputs)) + 1   # <-- a board per graded guess, and the first one
+    if is_victorious:
+        assert "Word:   B A N A N A" in out
+
+def test_masks_hold_one_bit_per_letter():
+    mode, g = game("banana"), Guess()
+    for value in ("a", "z", "n", "q"):
+        guess(mode, g, value)
+    assert g._hit_mask == LETTER_BITS["a"] | LETTER_BITS["n"]
+    assert g._miss_mask == LETTER_BITS["z"] | LETTER_BITS["q"]
+    assert [g._status(value) for value in "anzqb"] == [True, True, False, False, None]
+
+def test_non_ascii_letters_are_kept_outside_the_masks():
+    mode, g = game("café"), Guess()
+    assert guess(mode, g, "é")
+    assert not guess(mode, g, "ü")
+    assert g._hit_mask == g._miss_mask == 0
+    assert g.hits == ["é"] and g.misses == ["ü"] and g.miss_count == 1
+
+def test_word_positions_are_masks():
+    mode = game("banana")
+    assert mode._positions == {'b': 0b000001, 'a': 0b101010, 'n': 0b010100}
+    assert mode._unrevealed == 0b111111
+
+def test_snapshot_is_detached():
+    mode, g = game("banana"), Guess()
+    guess(mode, g, "a")
+    guess(mode, g, "z")
+    copy_obj = g.snapshot()
+    guess(mode, g, "q")
+    guess(mode, g, "banana")
+    assert copy_obj.attempts == ["a", "z"] and copy_obj.hits == ["a"] and copy_obj.misses == ["z"]
+    assert copy_obj.miss_count == 1 and copy_obj._status("q") is None
+    assert copy_obj.pipeline is None and copy_obj.session is None
+
+BOARD_AFTER_A_MISS = """\
+    _____[]
+    I    ||    Word:   _ A _ A _ A
+    I    ||    
+    O    ||    
+         ||    Guess:  Z
+         ||    
+         ||    
+         ||    Misses: Z
+         ||    
+         ||    
+[========[]
+"""
+
+def played(word, values):
+    mode, g = game(word), Guess()
+    for value in values:
+        guess(mode, g, value)
+        h_string = g._hit_string(mode._word, mode._blanks, mode._revealed)
+    return g, h_string
+
+def test_board_is_printed(capsys):
+    g, h_string = played("banana", ["a", "z"])
+    g.show_board(h_string, g.miss_string())
+    assert capsys.readouterr().out == BOARD_AFTER_A_MISS
+
+def test_board_through_a_renderer():
+    g, h_string = played("banana", ["a", "z"])
+    stream = io.StringIO()
+    g.show_board(h_string, g.miss_string(), BoardRenderer(stream, ansi=False))
+    assert stream.getvalue() == "\n\n" + BOARD_AFTER_A_MISS    # <-- plain renderers space out the boards
+
+def test_board_shows_every_stage():
+    g, h_string = played("banana", ["q", "w", "e", "r", "t", "y"])
+    lines = board_lines(g.FRAMES[g.miss_count], h_string, g.value.upper(), g.miss_string())
+    assert lines[3:8] == [
+        "  \\ O /  ||    ",
+        "   \\|/   ||    Guess:  Y",
+        "    |    ||    ",
+        "   / \\   ||    ",
+        "  /   \\  ||    Misses: Q, W, E, R, T, Y",
+    ]
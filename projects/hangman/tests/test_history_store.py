@@ -0,0 +1,81 @@
+import sqlite3
+import datetime
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from hangman_pkg.history_store import HistoryStore, HistoryStoreError
+
+
+def outcome(word="gallows", won=True):
+    return SimpleNamespace(
+        timestamp=datetime.datetime.now(), is_victorious=won, game_mode="standard", target_word=word,
+        tries=3, duration=1.5, attempts=["g", "a", "l"], hits=["g", "a", "l"], misses=[])
+
+def in_thread(func, timeout=5):
+    """Runs `func` on a thread and fails the test if it does not return within `timeout` seconds."""
+    result = {}
+    def run():
+        try:
+            result['value'] = func()
+        except Exception as exc:
+            result['error'] = exc
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), f"{func} is blocked"
+    if 'error' in result:
+        raise result['error']
+    return result.get('value')
+
+
+def test_disabled_store_never_blocks():
+    store = HistoryStore(path="")
+    store.record(outcome())
+    in_thread(store.flush)
+    in_thread(store.compact)
+    assert in_thread(store.load) == []
+    in_thread(store.close)
+
+def test_round_trip(tmp_path):
+    store = HistoryStore(path=str(tmp_path / "history.db"), flush_interval=0.01)
+    for word in ("gallows", "noose", "scaffold"):
+        store.record(outcome(word))
+    records = in_thread(store.load)
+    assert [record['target_word'] for record in records] == ["gallows", "noose", "scaffold"]
+    assert records[0]['attempts'] == ["g", "a", "l"] and records[0]['is_victorious'] is True
+    in_thread(lambda: store.compact(keep=1))
+    assert [record['target_word'] for record in in_thread(store.load)] == ["scaffold"]
+    in_thread(store.close)
+
+def test_writer_error_reaches_callers(tmp_path):
+    store = HistoryStore(path=str(tmp_path))  # <-- a directory cannot be opened as a database
+    store.record(outcome())
+    with pytest.raises(HistoryStoreError):
+        in_thread(store.flush)
+
+    store.path = str(tmp_path / "history.db")  # <-- the next writer recovers
+    store.record(outcome("noose"))
+    assert [record['target_word'] for record in in_thread(store.load)] == ["noose"]
+    in_thread(store.close)
+
+def test_items_queued_while_stopping_are_written(tmp_path):
+    path = str(tmp_path / "history.db")
+    store = HistoryStore(path=path, flush_interval=0.01)
+    store.record(outcome("gallows"))
+    finish = store._finish
+    def finish_then_record(items):
+        finish(items)
+        if any(command == "stop" for command, _ in items):
+            store.record(outcome("noose"))  # <-- arrives after the stop command, while the writer is still alive
+    store._finish = finish_then_record
+    thread = store._thread
+    in_thread(store.close)
+    thread.join(5)
+    assert not thread.is_alive() and store._queue.empty()
+    conn = sqlite3.connect(path)
+    try:
+        assert [row[0] for row in conn.execute("SELECT target_word FROM outcomes ORDER BY id")] == ["gallows", "noose"]
+    finally:
+        conn.close()
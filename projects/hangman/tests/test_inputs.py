@@ -0,0 +1,69 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from hangman_pkg.inputs import FuzzInput, ReplayInput, ScriptExhausted, console, get_provider, read_input, use_provider
+
+
+def test_console_is_the_default_provider():
+    assert get_provider() is console
+
+def test_use_provider_routes_read_input():
+    outer, inner = ReplayInput(["a", "b"]), ReplayInput(["x"])
+    with use_provider(outer) as provider:
+        assert provider is outer
+        assert read_input("Guess: ") == "a"
+        with use_provider(inner):
+            assert read_input() == "x"
+        with use_provider(None):    # <-- keeps the current provider
+            assert read_input() == "b"
+    assert get_provider() is console
+
+def test_provider_is_restored_after_an_error():
+    with pytest.raises(ScriptExhausted, match="ended after 0 lines"):
+        with use_provider(ReplayInput([])):
+            read_input()
+    assert get_provider() is console
+
+def test_providers_are_per_thread():
+    seen = {}
+    barrier = threading.Barrier(2)
+    def play(name):
+        with use_provider(ReplayInput([name])):
+            barrier.wait()  # <-- both providers are installed before either thread reads
+            seen[name] = read_input()
+    threads = [threading.Thread(target=play, args=(name,)) for name in ("left", "right")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert seen == {"left": "left", "right": "right"}
+
+def test_replay_echo_and_recording(capsys, tmp_path):
+    provider = ReplayInput(["1", "e"], echo=True, record=True)
+    assert [provider.read("Option: "), provider.read("Guess: ")] == ["1", "e"]
+    assert capsys.readouterr().out == "Option: 1\nGuess: e\n"
+    path = tmp_path / "session.txt"
+    provider.save(str(path))
+    path.write_text("# seed: 3\n" + path.read_text() + "\n")
+    assert ReplayInput.from_file(str(path)).script == ["1", "e", ""]   # <-- comments dropped, blank lines kept
+
+def test_fuzz_input_is_seeded():
+    menu = [SimpleNamespace(_speaks=False), SimpleNamespace(_speaks=True), SimpleNamespace()]
+    def session(seed):
+        provider = FuzzInput(seed, max_inputs=50)
+        return [provider.read("", menu if idx % 3 == 0 else None) for idx in range(50)]
+    lines = session(7)
+    assert lines == session(7) and lines != session(8)
+    menu_lines = [line for line in lines[::3] if line not in FuzzInput.JUNK]
+    assert menu_lines and set(menu_lines) <= {"1", "3"}     # <-- never a mode played by voice
+    assert all(len(line) == 1 and line.isalpha() for idx, line in enumerate(lines) if idx % 3 and line not in FuzzInput.JUNK)
+
+def test_fuzz_input_ends():
+    provider = FuzzInput(0, max_inputs=2)
+    provider.read()
+    provider.read()
+    with pytest.raises(ScriptExhausted):
+        provider.read()
+    assert len(provider.lines) == 2
@@ -0,0 +1,83 @@
+import json
+import itertools
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from hangman_pkg import instrument
+from hangman_pkg.instrument import BUCKETS, Histogram, Tracer
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Makes every clock reading 1000ns later than the previous one."""
+    ticks = itertools.count(0, 1000)
+    monkeypatch.setattr(instrument, "time", SimpleNamespace(perf_counter_ns=lambda: next(ticks)))
+
+
+def test_histogram_buckets_by_power_of_two():
+    histogram = Histogram()
+    for duration_ns in (0, 1, 2, 3, 4, 1000, 2**200):
+        histogram.record(duration_ns)
+    assert histogram.buckets[:4] == [1, 1, 2, 1]   # <-- 0 | 1 | 2-3 | 4-7
+    assert histogram.buckets[10] == 1               # <-- 512-1023
+    assert histogram.buckets[BUCKETS - 1] == 1      # <-- anything longer lands in the last bucket
+    assert sum(histogram.buckets) == histogram.count == 7
+    assert (histogram.min_ns, histogram.max_ns) == (0, 2**200)
+
+def test_histogram_percentiles():
+    histogram = Histogram()
+    assert histogram.percentile(0.5) == 0 and histogram.report()['mean_ms'] == 0.0
+    for duration_ns in [100] * 98 + [5000, 9000]:
+        histogram.record(duration_ns)
+    assert histogram.percentile(0.50) == 127        # <-- the upper edge of the 64-127 bucket
+    assert histogram.percentile(0.99) == 8191
+    assert histogram.percentile(1.0) == 9000        # <-- never above the longest duration
+    report = histogram.report()
+    assert report['count'] == 100 and report['min_ms'] == 100 / 1e6 and report['max_ms'] == 9000 / 1e6
+
+def test_disabled_tracer_records_nothing(clock):
+    tracer = Tracer(enabled=False)
+    with tracer.span("idle"):
+        pass
+    assert tracer.span("idle") is instrument._NULL_SPAN
+    assert tracer.traced()(lambda: 42)() == 42
+    assert tracer.histograms == {} and len(tracer.events) == 0
+
+def test_spans_and_traced_functions(clock):
+    tracer = Tracer(enabled=True)
+    with tracer.span("outer"):
+        with tracer.span("inner"):
+            pass
+    @tracer.traced("fails")
+    def fails():
+        raise ValueError
+    with pytest.raises(ValueError):
+        fails()
+    report = tracer.report()
+    assert list(report) == ["fails", "inner", "outer"]
+    assert report['inner']['total_ms'] == 0.001 and report['outer']['total_ms'] == 0.003
+    assert report['fails']['count'] == 1            # <-- recorded even when the call raises
+
+def test_events_are_bounded(clock):
+    tracer = Tracer(enabled=True, max_events=3)
+    for idx in range(5):
+        with tracer.span(f"span{idx}"):
+            pass
+    assert [event[0] for event in tracer.events] == ["span2", "span3", "span4"]
+    assert len(tracer.histograms) == 5
+
+def test_chrome_trace(clock, tmp_path):
+    tracer = Tracer(enabled=True)   # <-- the origin is tick 0
+    with tracer.span("guess"):
+        pass
+    path = tracer.dump(str(tmp_path / "traces" / "trace.json"))
+    with open(path) as f:
+        trace = json.load(f)
+    complete = [event for event in trace['traceEvents'] if event['ph'] == "X"]
+    assert complete == [{'name': "guess", 'cat': "hangman", 'ph': "X", 'ts': 1.0, 'dur': 1.0,
+        'pid': complete[0]['pid'], 'tid': threading.get_ident()}]
+    names = {event['tid']: event['args']['name'] for event in trace['traceEvents'] if event['ph'] == "M"}
+    assert names[threading.get_ident()] == threading.current_thread().name
+    assert trace['otherData']['histograms'] == tracer.report()
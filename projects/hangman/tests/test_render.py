@@ -0,0 +1,129 @@
+import io
+import re
+
+import pytest
+
+from hangman_pkg import render
+from hangman_pkg.game_objects import Guess
+from hangman_pkg.render import BoardRenderer, board_lines
+
+
+class Terminal(io.StringIO):
+    """A minimal ANSI terminal: the escape sequences written by 'BoardRenderer', applied to a grid of rows."""
+    SEQUENCE = re.compile(r"\x1b(7|8|\[(\d*)(?:;(\d*))?([HJLKr]))")
+
+    def __init__(self, width=60, height=30):
+        super().__init__()
+        self.width, self.height = width, height
+        self.rows = [""] * height
+        self.row = self.col = 0
+        self.top, self.bottom = 0, height - 1
+        self._saved = (0, 0)
+
+    def isatty(self):
+        return True
+
+    def write(self, text):
+        pos = 0
+        for match in self.SEQUENCE.finditer(text):
+            self._text(text[pos:match.start()])
+            self._escape(*match.groups())
+            pos = match.end()
+        self._text(text[pos:])
+        return len(text)
+
+    def _text(self, text):
+        for char in text:
+            if char == "\n":
+                self.col = 0
+                if self.row == self.bottom:
+                    del self.rows[self.top]
+                    self.rows.insert(self.bottom, "")
+                else:
+                    self.row = min(self.row + 1, self.height - 1)
+            else:
+                line = self.rows[self.row].ljust(self.col)
+                self.rows[self.row] = line[:self.col] + char + line[self.col + 1:]
+                self.col += 1
+
+    def _escape(self, simple, first, second, command):
+        if simple == "7":
+            self._saved = (self.row, self.col)
+        elif simple == "8":
+            self.row, self.col = self._saved
+        elif command == "H":
+            self.row, self.col = int(first or 1) - 1, int(second or 1) - 1
+        elif command == "J":
+            self.rows = [""] * self.height
+        elif command == "L":
+            for _ in range(int(first or 1)):
+                del self.rows[self.bottom]
+                self.rows.insert(self.row, "")
+        elif command == "K":
+            self.rows[self.row] = self.rows[self.row][:self.col]
+        elif command == "r":
+            self.top, self.bottom = int(first or 1) - 1, int(second or self.height) - 1
+            self.row = self.col = 0
+
+    def print(self, text=""):
+        self.write(f"{text}\n")
+
+    @property
+    def screen(self):
+        return [line.rstrip() for line in self.rows]
+
+
+def board(misses=0, word="_ _ _ _ _", guess="", missed=""):
+    return Guess.FRAMES[misses], word, guess, missed
+
+def drawn(*args):
+    return [line.rstrip() for line in board_lines(*args)]
+
+
+@pytest.fixture
+def terminal(monkeypatch):
+    terminal = Terminal()
+    monkeypatch.setattr(render.shutil, "get_terminal_size", lambda: render.os.terminal_size((terminal.width, terminal.height)))
+    monkeypatch.delenv("HANGMAN_PLAIN", raising=False)
+    monkeypatch.setenv("TERM", "xterm")
+    return terminal
+
+
+def test_plain_stream_prints_every_board():
+    stream = io.StringIO()
+    renderer = BoardRenderer(stream)
+    assert not renderer.ansi
+    renderer.render(*board())
+    renderer.render(*board(1, "_ p p _ _", "p"))
+    assert stream.getvalue().count("Word:") == 2
+    assert "Word:   _ p p _ _" in stream.getvalue()
+
+def test_first_board_keeps_earlier_messages(terminal):
+    terminal.print("The mystery word contains 5 letters.")
+    with BoardRenderer(terminal) as renderer:
+        assert renderer.ansi
+        renderer.render(*board())
+        assert terminal.screen[:11] == drawn(*board())
+        assert "The mystery word contains 5 letters." in terminal.screen[11:]
+        terminal.print("Success!")
+    assert terminal.screen.index("Success!") > terminal.screen.index("The mystery word contains 5 letters.")
+
+def test_first_board_on_a_full_screen(terminal):
+    for idx in range(40):
+        terminal.print(f"line {idx}")
+    with BoardRenderer(terminal) as renderer:
+        renderer.render(*board())
+        assert terminal.screen[:11] == drawn(*board())
+        assert terminal.screen[11:] == ["", *(f"line {idx}" for idx in range(23, 40)), ""]   # <-- only the oldest lines scrolled away
+
+def test_redraws_only_the_board(terminal):
+    terminal.print("The mystery word contains 5 letters.")
+    with BoardRenderer(terminal) as renderer:
+        renderer.render(*board())
+        terminal.print("Success!")
+        before = terminal.getvalue()
+        renderer.render(*board(0, "_ p p _ _", "p"))
+        assert terminal.screen[:11] == drawn(*board(0, "_ p p _ _", "p"))
+        renderer.render(*board(1, "_ p p _ _", "z", "z"))
+        assert terminal.screen[:11] == drawn(*board(1, "_ p p _ _", "z", "z"))
+        assert "The mystery word contains 5 letters." in terminal.screen and "Success!" in terminal.screen
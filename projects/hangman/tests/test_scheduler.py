@@ -0,0 +1,50 @@
+import threading
+
+from hangman_pkg.scheduler import DeadlineScheduler, ScheduledTimer
+
+
+def test_callbacks_run_in_deadline_order():
+    scheduler = DeadlineScheduler()
+    fired, done = [], threading.Event()
+    scheduler.schedule(0.03, fired.append, "late")
+    scheduler.schedule(0.01, fired.append, "early")
+    scheduler.schedule(0.05, done.set)
+    assert done.wait(5)
+    assert fired == ["early", "late"]
+
+def test_cancelled_timer_never_fires():
+    scheduler = DeadlineScheduler()
+    fired, done = [], threading.Event()
+    handle = scheduler.schedule(0.01, fired.append, "cancelled")
+    assert handle.cancel()
+    assert not handle.cancel()
+    scheduler.schedule(0.03, done.set)
+    assert done.wait(5)
+    assert fired == [] and scheduler.pending == 0
+
+def test_cancel_reports_a_fired_timer():
+    scheduler = DeadlineScheduler()
+    started, release = threading.Event(), threading.Event()
+    def callback():
+        started.set()
+        release.wait(5)
+    timer = ScheduledTimer(0, callback, scheduler=scheduler)
+    timer.start()
+    assert started.wait(5)
+    assert not timer.cancel()   # <-- already running: the caller must not assume it was stopped
+    release.set()
+
+def test_cancel_races_the_run_loop():
+    scheduler = DeadlineScheduler()
+    fired = []
+    lock = threading.Lock()
+    def fire(idx):
+        with lock:
+            fired.append(idx)
+    handles = [scheduler.schedule(0, fire, idx) for idx in range(2000)]
+    stopped = {idx for idx, handle in enumerate(handles) if handle.cancel()}
+    done = threading.Event()
+    scheduler.schedule(0.05, done.set)
+    assert done.wait(5)
+    assert stopped.isdisjoint(fired)
+    assert len(stopped) + len(fired) == len(handles)
@@ -0,0 +1,37 @@
+import asyncio
+
+from hangman_pkg.server import HangmanServer, load_test
+
+
+class RecordingStore:
+    def __init__(self):
+        self.outcomes = []
+
+    def record(self, outcome_obj):
+        self.outcomes.append(outcome_obj)
+
+
+def run_load_test(store, sessions=4, games=2):
+    async def main():
+        server = HangmanServer(port=0, store=store)
+        port = await server.start()
+        try:
+            return await load_test(port=port, sessions=sessions, games=games)
+        finally:
+            server.close()
+    return asyncio.run(main())
+
+
+def test_load_test_sessions_are_not_persisted(monkeypatch):
+    shared = RecordingStore()
+    monkeypatch.setattr("hangman_pkg.history_store.history_store.record", shared.record)
+    report = run_load_test(store=None)
+    assert report['sessions'] == 4
+    assert report['completed'] == 4 and report['failed'] == 0    # <-- every game of every session finished
+    assert report['guesses'] >= 4 * 2
+    assert shared.outcomes == []
+
+def test_sessions_persist_to_the_server_store():
+    store = RecordingStore()
+    run_load_test(store, sessions=2, games=3)
+    assert len(store.outcomes) == 6
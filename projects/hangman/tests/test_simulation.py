@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from hangman_pkg import solver
+from hangman_pkg.context import GameContext
+from hangman_pkg.game_objects import Mode
+from hangman_pkg.simulation import SolverStrategy, Strategy, matches, percentile, play_headless
+from hangman_pkg.solver import FREQUENCY_ORDER
+
+WORDS = ["apple", "ample", "angle", "eagle", "maple", "table", "cable", "fable", "sable", "gable"]
+
+
+@pytest.fixture
+def corpus(monkeypatch):
+    """Serves `WORDS` as the word list named "test", instead of the system dictionary."""
+    monkeypatch.setitem(solver._corpora, "test", {5: list(WORDS)})
+    monkeypatch.setattr(SolverStrategy, "_solvers", {})
+    return "test"
+
+def mode():
+    return Mode(name="test", context=GameContext(store=None))
+
+
+@pytest.mark.parametrize("name", sorted(Strategy.strategies))
+@pytest.mark.parametrize("word", ["apple", "gable"])
+def test_every_strategy_finishes_a_game(name, word, corpus):
+    mode_obj = mode()
+    game, g = play_headless(mode_obj, Strategy.strategies[name](random.Random(0), corpus), word)
+    assert game is not mode_obj and mode_obj._word != word     # <-- the mode is copied
+    assert game.is_victorious == (game._unrevealed == 0)
+    assert game.is_victorious or g.miss_count == game.max_errors
+    assert len(set(g.attempts)) == len(g.attempts)
+
+@pytest.mark.parametrize("name", ["entropy", "solver"])
+def test_informed_strategies_win_within_the_corpus(name, corpus):
+    for word in WORDS:
+        game, g = play_headless(mode(), Strategy.strategies[name](random.Random(0), corpus), word)
+        assert game.is_victorious, f"{name} lost `{word}` after {g.attempts}"
+
+def test_frequency_strategy_follows_the_letter_order(corpus):
+    game, g = play_headless(mode(), Strategy.strategies["frequency"](), "gable")
+    assert "".join(g.attempts) == FREQUENCY_ORDER[:len(g.attempts)]
+
+def test_repeated_guess_is_an_error():
+    class Stubborn(Strategy):
+        def next_guess(self, board, guess_obj):
+            return "z"
+    with pytest.raises(RuntimeError, match="repeated the guess `z`"):
+        play_headless(mode(), Stubborn(), "apple")
+
+def test_matches():
+    board = ["_", "P", "P", "_", "_"]
+    assert matches("apple", board, {"p", "x"})
+    assert not matches("apply", board, {"y"})     # <-- a guessed letter in a hidden position
+    assert not matches("ample", board, set())
+
+def test_percentile():
+    values = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    assert [percentile(values, pct) for pct in (0, 10, 50, 90, 99, 100)] == [1, 1, 5, 9, 10, 10]
+    assert percentile([7], 50) == 7
+    assert percentile([], 99) == 0.0
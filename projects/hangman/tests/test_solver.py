@@ -0,0 +1,50 @@
+from hangman_pkg.game_objects import Guess
+from hangman_pkg.solver import CandidateIndex, Solver, popcount
+
+WORDS = {3: ["bat", "cat", "tab", "tat"], 4: ["abba", "baba"]}
+
+
+def words(index, bits, length=3):
+    return index.candidates(bits, length)
+
+
+def test_all_candidates():
+    index = CandidateIndex(WORDS)
+    assert words(index, index.all_candidates(3)) == WORDS[3]
+    assert popcount(index.all_candidates(4)) == 2
+    assert index.all_candidates(5) == 0
+
+def test_patterns_group_words_by_reveal():
+    index = CandidateIndex(WORDS)
+    table = index.patterns(3, "t")
+    assert {mask: words(index, bits) for mask, bits in table.items()} == {
+        0b100: ["bat", "cat"], 0b001: ["tab"], 0b101: ["tat"]}
+    assert index.patterns(3, "t") is table     # <-- built once
+
+def test_narrow():
+    index = CandidateIndex(WORDS)
+    bits = index.all_candidates(3)
+    assert words(index, index.narrow(bits, 3, "a", 0b010)) == WORDS[3]
+    assert words(index, index.narrow(bits, 3, "b", 0)) == ["cat", "tat"]   # <-- a miss
+    assert words(index, index.narrow(index.narrow(bits, 3, "b", 0), 3, "t", 0b101)) == ["tat"]
+    assert index.narrow(bits, 3, "z", 0b001) == 0
+    assert words(index, index.narrow(index.all_candidates(4), 4, "a", 0b1001), 4) == ["abba"]
+
+def test_exclude():
+    index = CandidateIndex(WORDS)
+    bits = index.all_candidates(3)
+    assert words(index, index.exclude(bits, 3, "cat")) == ["bat", "tab", "tat"]
+    assert words(index, index.exclude(index.exclude(bits, 3, "cat"), 3, "cat")) == ["bat", "tab", "tat"]
+    assert index.exclude(bits, 3, "dog") == bits
+    assert index.exclude(bits, 4, "cat") == bits
+    assert index.exclude(bits, 7, "example") == bits
+
+def test_solver_hint():
+    solver = Solver(CandidateIndex(WORDS))
+    g = Guess()
+    g.value = "b"
+    g._record(False)
+    assert solver.hint(["_", "A", "_"], g) == {'guess': "t", 'candidates': 2}
+    g.value = "cat"
+    g._record(False)
+    assert solver.hint(["_", "A", "_"], g) == {'guess': "tat", 'candidates': 1}
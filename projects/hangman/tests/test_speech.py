@@ -0,0 +1,84 @@
+import os
+import sys
+import types
+import threading
+
+import pytest
+
+from hangman_pkg.speech import PhraseCache, SpeechService
+
+
+class FakeEngine:
+    """A pyttsx3 engine that records what it says and writes a fake audio file for each render."""
+    def __init__(self):
+        self.spoken = []
+        self._saves = []
+
+    def say(self, text):
+        self.spoken.append(text)
+
+    def save_to_file(self, text, path):
+        self._saves.append(path)
+
+    def runAndWait(self):
+        for path in self._saves:
+            with open(path, "wb") as f:
+                f.write(b"RIFF")
+        self._saves.clear()
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = FakeEngine()
+    monkeypatch.setitem(sys.modules, "pyttsx3", types.SimpleNamespace(init=lambda: engine))
+    return engine
+
+
+def test_queue_speaks_in_order(engine, tmp_path):
+    service = SpeechService(PhraseCache(str(tmp_path)))
+    events = [service.say(f"phrase {idx}") for idx in range(5)]
+    service.wait()
+    assert all(event.is_set() for event in events)
+    assert engine.spoken == [f"phrase {idx}" for idx in range(5)]
+
+def test_say_does_not_block(tmp_path, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    class SlowEngine(FakeEngine):
+        def runAndWait(self):
+            started.set()
+            release.wait(5)
+    monkeypatch.setitem(sys.modules, "pyttsx3", types.SimpleNamespace(init=SlowEngine))
+    service = SpeechService(PhraseCache(str(tmp_path)))
+    first, second = service.say("one"), service.say("two")
+    assert started.wait(5)
+    assert not first.is_set() and not second.is_set()
+    release.set()
+    service.wait()
+    assert second.is_set()
+
+def test_prints_without_pyttsx3(monkeypatch, capsys, tmp_path):
+    monkeypatch.setitem(sys.modules, "pyttsx3", None)    # <-- not installed
+    service = SpeechService(PhraseCache(str(tmp_path)))
+    assert not service.available
+    assert service.say("Well done!").is_set()
+    assert capsys.readouterr().out == "Well done!\n"
+
+def test_prints_when_the_engine_fails(monkeypatch, capsys, tmp_path):
+    def broken_init():
+        raise RuntimeError("no audio device")
+    monkeypatch.setitem(sys.modules, "pyttsx3", types.SimpleNamespace(init=broken_init))
+    service = SpeechService(PhraseCache(str(tmp_path)))
+    service.say("Say a letter.").wait(5)
+    assert "Say a letter." in capsys.readouterr().out
+    assert not service.available
+
+def test_phrase_cache_evicts_least_recently_used(engine, tmp_path):
+    cache = PhraseCache(str(tmp_path), max_files=3)
+    for idx, text in enumerate(["a", "b", "c"]):
+        cache.render(engine, text)
+        os.utime(cache.path(text), (idx, idx))
+    os.utime(cache.path("a"), (10, 10))  # <-- "a" was played most recently
+    cache.render(engine, "d")
+    remaining = {text for text in "abcd" if os.path.isfile(cache.path(text))}
+    assert remaining == {"a", "c", "d"}
+    assert len(os.listdir(tmp_path)) == 3
@@ -0,0 +1,211 @@
+import sys
+import time
+import wave
+import struct
+import threading
+
+import pytest
+
+from hangman_pkg import game_objects
+from hangman_pkg.context import GameContext
+from hangman_pkg.inputs import ReplayInput, use_provider
+from hangman_pkg.speech_pipeline import FakeBackend, FakeCapture, PipelineError, SpeechPipeline, SpeechSession
+
+
+class Timeline:
+    """Records when each stage of a pipeline starts and ends."""
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+
+    def log(self, event, detail=None):
+        with self._lock:
+            self.events.append((time.perf_counter() - self._start, event, detail))
+
+    def speaker(self, delay=0.05):
+        def speak(text):
+            self.log("speak start", text)
+            time.sleep(delay)
+            self.log("speak end", text)
+        return speak
+
+    def capture(self, clips, delay=0.01):
+        clips = list(clips)
+        def capture():
+            self.log("capture start")
+            time.sleep(delay)
+            return clips.pop(0) if clips else None
+        return capture
+
+    def first(self, event, detail=None):
+        return next(at for at, name, text in self.events if name == event and detail in (None, text))
+
+
+def transcribe_clip(audio):
+    return {'text': audio, 'successful': True, 'error': None}
+
+
+def test_capture_waits_for_the_prompt():
+    timeline = Timeline()
+    with SpeechPipeline(timeline.capture(["e"]), FakeBackend(), timeline.speaker()) as pipeline:
+        pipeline.backend.transcribe = transcribe_clip
+        pipeline.prompt("Say a letter.")
+        assert pipeline.next_response(timeout=2)['text'] == "e"
+    assert timeline.first("capture start") >= timeline.first("speak end", "Say a letter.")
+
+def test_spoken_phrases_are_never_recorded():
+    timeline = Timeline()
+    with SpeechPipeline(timeline.capture(["e", "t"]), FakeBackend(), timeline.speaker()) as pipeline:
+        pipeline.backend.transcribe = transcribe_clip
+        pipeline.speak("Well done!")    # <-- praise, taunts and announcements
+        pipeline.speak("The mystery word contains 7 letters.")
+        pipeline.prompt("Say a letter.")
+        assert pipeline.next_response(timeout=2)['text'] == "e"
+    captures = [at for at, name, _ in timeline.events if name == "capture start"]
+    assert len(captures) == 1
+    assert captures[0] >= timeline.first("speak end", "Say a letter.")
+
+def test_new_prompt_discards_buffered_answers():
+    timeline = Timeline()
+    with SpeechPipeline(timeline.capture(["e", "t"]), FakeBackend(), timeline.speaker(0.01)) as pipeline:
+        pipeline.backend.transcribe = transcribe_clip
+        pipeline.prompt("Say a letter.")
+        time.sleep(0.2)                 # <-- the first answer is waiting, unread
+        pipeline.prompt("I did not catch that. Say a letter.")
+        assert pipeline.next_response(timeout=2)['text'] == "t"
+
+def test_recognition_with_the_fake_backend():
+    with SpeechPipeline(FakeCapture(["clip-1", "clip-2"]), FakeBackend(["apple", None]), lambda text: None) as pipeline:
+        pipeline.prompt("Say a letter.")
+        assert pipeline.next_response(timeout=2) == {'text': "apple", 'successful': True, 'error': None}
+        pipeline.prompt("Say a letter.")
+        response = pipeline.next_response(timeout=2)
+        assert not response['successful'] and "recognize" in response['error']
+
+def broken_capture():
+    raise OSError("microphone unplugged")
+
+def test_crashed_stage_is_raised():
+    with SpeechPipeline(broken_capture, FakeBackend(), lambda text: None) as pipeline:
+        pipeline.prompt("Say a letter.")
+        with pytest.raises(PipelineError):
+            pipeline.next_response(timeout=2)
+        with pytest.raises(PipelineError):
+            pipeline.next_response(timeout=2)
+
+def test_crashed_pipeline_falls_back_to_typed_guesses(monkeypatch, capsys):
+    class CrashingSession:  # <-- the capture and back end of the game's pipeline
+        __call__ = staticmethod(broken_capture)
+        transcribe = FakeBackend().transcribe
+    monkeypatch.setattr(game_objects, "available", lambda name: True)
+    mode = game_objects.Mode(name="voice", source="speech", context=GameContext(store=None))
+    mode._session = CrashingSession()
+    mode._word = "apple"
+    mode._index_word()
+    with use_provider(ReplayInput(["a", "p", "l", "e"])):
+        g = mode.play()
+    assert g.typed and g.pipeline is None
+    assert mode.is_victorious and g.attempts == ["a", "p", "l", "e"]
+    assert "microphone unplugged" in capsys.readouterr().out
+
+def test_next_response_times_out():
+    with SpeechPipeline(FakeCapture(["clip"], delay=1), FakeBackend(["e"]), lambda text: None) as pipeline:
+        pipeline.prompt("Say a letter.")
+        with pytest.raises(TimeoutError):
+            pipeline.next_response(timeout=0.1)
+
+
+class RecordedAudio:
+    """A stand-in for `speech_recognition`: `AudioFile` reads a recorded WAV file, and `Recognizer.listen` returns its next utterance."""
+    FRAMES = 1600   # <-- one utterance: 0.1 seconds at 16 kHz
+
+    def __init__(self, listen_delay=0.0):
+        self.opened = []
+        self.calibrations = 0
+        self.listen_delay = listen_delay
+        audio = self
+
+        class AudioFile:
+            def __init__(self, path):
+                self.path = path
+
+            def __enter__(self):
+                self.wave = wave.open(self.path, "rb")
+                audio.opened.append(self)
+                return self
+
+            def __exit__(self, *exc_info):
+                self.wave.close()
+
+        class Recognizer:
+            def adjust_for_ambient_noise(self, source, duration):
+                audio.calibrations += 1
+
+            def listen(self, source):
+                time.sleep(audio.listen_delay)
+                return source.wave.readframes(RecordedAudio.FRAMES)
+
+        self.AudioFile = AudioFile
+        self.Recognizer = Recognizer
+        self.Microphone = None
+
+
+def record(path, utterances):
+    """Writes a 16 kHz mono WAV file of `utterances` clips, each filled with its own sample value."""
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(16000)
+        for idx in range(utterances):
+            f.writeframes(struct.pack("<h", idx + 1) * RecordedAudio.FRAMES)
+    return str(path)
+
+@pytest.fixture
+def recorded(monkeypatch):
+    audio = RecordedAudio()
+    monkeypatch.setitem(sys.modules, "speech_recognition", audio)
+    return audio
+
+
+def test_recorded_session_reuses_the_open_source(recorded, tmp_path):
+    session = SpeechSession.from_recording(record(tmp_path / "guesses.wav", 3), FakeBackend(["e", "t", "a"]))
+    with session:
+        clips = [session.capture() for _ in range(3)]
+        texts = [session.transcribe(clip)['text'] for clip in clips]
+    assert texts == ["e", "t", "a"]
+    assert len(recorded.opened) == 1    # <-- one source for every guess
+    assert [struct.unpack_from("<h", clip)[0] for clip in clips] == [1, 2, 3]
+    assert recorded.calibrations == 0 and not session.is_open
+
+def test_session_calibrates_once(recorded, tmp_path):
+    path = record(tmp_path / "guesses.wav", 3)
+    session = SpeechSession(lambda: recorded.AudioFile(path), FakeBackend(), calibration=0.2)
+    for _ in range(3):
+        session.capture()
+    session.close()
+    assert recorded.calibrations == 1
+    session.capture()   # <-- reopening recalibrates
+    session.close()
+    assert recorded.calibrations == 2 and len(recorded.opened) == 2
+
+def test_session_times_every_stage(recorded, tmp_path):
+    recorded.listen_delay = 0.02
+    session = SpeechSession.from_recording(record(tmp_path / "guesses.wav", 2), FakeBackend(["e", "t"], delay=0.01))
+    with session:
+        for _ in range(2):
+            session.transcribe(session.capture())
+    report = session.report()
+    assert {stage: stats['count'] for stage, stats in report.items()} == {'open': 1, 'capture': 2, 'recognize': 2}
+    assert report['capture']['mean'] >= 0.02 and report['recognize']['mean'] >= 0.01
+    assert report['capture']['max'] >= report['capture']['mean']
+
+def test_session_drives_the_pipeline(recorded, tmp_path):
+    session = SpeechSession.from_recording(record(tmp_path / "guesses.wav", 2), FakeBackend(["e", "t"]))
+    with session, SpeechPipeline(session, session, lambda text: None) as pipeline:
+        answers = []
+        for _ in range(2):
+            pipeline.prompt("Say a letter.")
+            answers.append(pipeline.next_response(timeout=2)['text'])
+    assert answers == ["e", "t"]
+    assert len(recorded.opened) == 1
@@ -0,0 +1,45 @@
+import datetime
+from types import SimpleNamespace
+
+from hangman_pkg.stats import ModeStats
+
+
+def outcome(is_victorious, seconds_ago=0, duration=10.0, tries=5):
+    timestamp = datetime.datetime.now() - datetime.timedelta(seconds=seconds_ago)
+    return SimpleNamespace(is_victorious=is_victorious, duration=duration, tries=tries, timestamp=timestamp)
+
+
+def test_totals_and_streaks():
+    stats = ModeStats()
+    for won in (True, True, False, True, True, True, False):
+        stats.record(outcome(won))
+    report = stats.report()
+    assert report['games'] == 7 and report['wins'] == 5 and report['win_rate'] == round(5 / 7, 3)
+    assert report['streak'] == 0 and report['best_streak'] == 3
+    assert report['mean_duration'] == 10.0 and report['mean_tries'] == 5.0
+
+def test_recent_window_is_a_ring_buffer():
+    stats = ModeStats(window=3)
+    results = (True, True, True, False, False, True, False)
+    for idx, won in enumerate(results):
+        stats.record(outcome(won))
+        window = results[max(idx - 2, 0):idx + 1]
+        assert stats.recent_games == len(window)
+        assert stats.recent_wins == sum(window)
+    assert list(stats._recent) == [False, True, False]
+
+def test_period_drops_old_games():
+    stats = ModeStats(period=60)
+    stats.record(outcome(True, seconds_ago=120))    # <-- already outside the period
+    stats.record(outcome(True, seconds_ago=30))
+    stats.record(outcome(False))
+    assert stats.period_games == 2 and stats.period_wins == 1
+    stats._trim(now=stats._timeline[0][0] + 61)
+    assert stats.period_games == 1 and stats.period_wins == 0
+    assert stats.games == 3 and stats.wins == 2
+
+def test_empty_stats():
+    assert ModeStats().report() == {
+        'games': 0, 'wins': 0, 'win_rate': 0.0, 'streak': 0, 'best_streak': 0, 'mean_duration': 0.0, 'mean_tries': 0.0,
+        'recent_wins': 0, 'recent_games': 0, 'period_wins': 0, 'period_games': 0,
+    }
@@ -0,0 +1,85 @@
+import os
+import threading
+
+from hangman_pkg.word_index import MAX_LENGTH, WordIndex
+
+
+def write_words(path, words, mtime_ns=None):
+    tmp_path = f"{path}.tmp"    # <-- swapped in whole, as readers may rebuild the index at any time
+    with open(tmp_path, "w") as f:
+        f.write("\n".join(words) + "\n")
+    if mtime_ns is not None:
+        os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+    os.replace(tmp_path, path)
+
+def make_index(tmp_path, words):
+    source = tmp_path / "words"
+    write_words(source, words, 10**18)
+    return WordIndex(str(source), str(tmp_path / "words.idx"))
+
+
+def test_words_by_length_and_class(tmp_path):
+    index = make_index(tmp_path, ["cat", "Paris", "horse", "ox", "giraffe"])
+    assert sorted(index.words(0)) == ["cat", "giraffe", "horse", "ox"]
+    assert sorted(index.words(5)) == ["giraffe", "horse"]
+    assert list(index.words(0, word_class=1)) == ["Paris"]
+
+def test_rebuilds_when_the_source_changes(tmp_path):
+    index = make_index(tmp_path, ["apple", "banana"])
+    view = index.words(0)
+    write_words(index.source, ["cherry", "damson", "elderberry"], 2 * 10**18)
+    assert not view.is_current()
+    assert sorted(WordIndex(index.source, index.path).words(0)) == ["cherry", "damson", "elderberry"]
+    assert sorted(index.words(0)) == ["cherry", "damson", "elderberry"]
+
+def test_view_stays_current_while_the_source_is_unchanged(tmp_path):
+    index = make_index(tmp_path, ["apple", "banana"])
+    view = index.words(0)
+    assert view.is_current()
+    assert view.generation == index.generation == 1
+
+def test_rebuilds_a_corrupt_index(tmp_path):
+    index = make_index(tmp_path, ["apple", "banana", "cherry"])
+    index.build()
+    with open(index.path, "rb") as f:
+        data = f.read()
+    for corrupt in (data[:10], data[:-3], b"XXXX" + data[4:], data[:-1] + b"\xff" * 64, b"\0" * len(data)):
+        with open(index.path, "wb") as f:
+            f.write(corrupt)
+        assert sorted(WordIndex(index.source, index.path).words(0)) == ["apple", "banana", "cherry"]
+
+def test_views_survive_a_concurrent_rebuild(tmp_path):
+    index = make_index(tmp_path, ["apple", "banana", "cherry"])
+    errors = []
+    stop = threading.Event()
+    def read():
+        while not stop.is_set():
+            try:
+                view = index.words(0)
+                assert sorted(view) in (["apple", "banana", "cherry"], ["damson", "elderberry"])
+            except Exception as exc:
+                errors.append(exc)
+                return
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for idx in range(20):
+        words = ["damson", "elderberry"] if idx % 2 else ["apple", "banana", "cherry"]
+        write_words(index.source, words, (3 + idx) * 10**18)
+        index.open()
+    stop.set()
+    for reader in readers:
+        reader.join()
+    assert errors == []
+
+def test_stale_view_still_reads_its_own_load(tmp_path):
+    index = make_index(tmp_path, ["apple", "banana"])
+    view = index.words(0)
+    write_words(index.source, ["cherry"], 2 * 10**18)
+    index.open()
+    assert sorted(view) == ["apple", "banana"] and not view.is_current()
+
+def test_minimum_above_the_last_bucket(tmp_path):
+    index = make_index(tmp_path, ["a" * 300, "b" * 255, "cat"])
+    assert len(index.words(MAX_LENGTH)) == 2
+    assert len(index.words(MAX_LENGTH + 1)) == 0
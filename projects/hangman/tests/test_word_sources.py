@@ -0,0 +1,48 @@
+import os
+import gzip
+import random
+from types import SimpleNamespace
+
+from hangman_pkg.word_sources import DictionarySource, FileSource, WordSource
+
+
+def mode(source, words=("dictionary",), min_word_length=3):
+    return SimpleNamespace(source=source, min_word_length=min_word_length, _get_from_dictionary=lambda: list(words))
+
+
+def test_reads_a_compressed_corpus(tmp_path):
+    path = tmp_path / "words.gz"
+    with gzip.open(path, "wt") as f:
+        f.write("ox\nhorse\nZebra\n")
+    source = WordSource.for_mode(mode(str(path)))
+    assert sorted(source.stream()) == ["Zebra", "horse", "ox"]
+    assert source.choose(3, random.Random(0)) == "horse"
+
+def test_corrupt_corpus_falls_back_to_the_dictionary(tmp_path, capsys):
+    path = tmp_path / "words.gz"
+    path.write_bytes(b"not gzip at all")
+    assert WordSource.for_mode(mode(str(path))).choose(3) == "dictionary"
+    assert "words.gz" in capsys.readouterr().err
+
+def test_deleted_corpus_falls_back_to_the_dictionary(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("horse\n")
+    source = WordSource.for_mode(mode(str(path)))
+    os.remove(path)
+    assert source.choose(3) == "dictionary"
+    assert FileSource(str(path)).choose(3) is None
+
+def test_file_sources_are_selected_by_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert "file" not in WordSource.sources
+    assert WordSource.for_mode(mode("file")) is None
+    (tmp_path / "file").write_text("horse\n")
+    source = WordSource.for_mode(mode("file"))
+    assert isinstance(source, FileSource) and source.choose(3) == "horse"
+
+def test_dictionary_honours_a_longer_minimum():
+    source = DictionarySource(mode("dictionary", words=["horse", "elephant", "giraffe"], min_word_length=5))
+    rng = random.Random(0)
+    assert {source.choose(5, rng) for _ in range(50)} == {"horse", "elephant", "giraffe"}
+    assert {source.choose(8, rng) for _ in range(50)} == {"elephant"}
+    assert source.choose(9, rng) is None